@@ -32,12 +32,33 @@ interface BackupData {
   }>;
 }
 
+// Restart loops shouldn't rewrite the full JSON export (and add another timestamped copy) each time
+const BACKUP_MIN_INTERVAL_MS = 60 * 60 * 1000; // 1 hour
+
+function msSinceLastBackup(file: string): number {
+  try {
+    return Date.now() - fs.statSync(file).mtimeMs;
+  } catch {
+    return Infinity; // No previous backup
+  }
+}
+
 /**
  * Backup script that exports the entire database state to JSON.
  * This creates a portable backup file that can be used for disaster recovery.
  */
 async function backupDatabase() {
   try {
+    // Determine output path
+    const dataDir = process.env.DATA_DIR || path.join(__dirname, '../../data');
+    const outputPath = path.join(dataDir, 'backup_latest.json');
+
+    const age = msSinceLastBackup(outputPath);
+    if (age < BACKUP_MIN_INTERVAL_MS && !process.argv.includes('--force')) {
+      console.log(`⏭️  Skipping JSON backup: ${outputPath} is only ${Math.round(age / 60000)} min old (pass --force to override)`);
+      return { success: true, skipped: true, outputPath };
+    }
+
     console.log('🔄 Starting database backup...');
 
     // Fetch system configuration
@@ -129,10 +150,6 @@ async function backupDatabase() {
       backupData.users.push(userData);
     }
 
-    // Determine output path
-    const dataDir = process.env.DATA_DIR || path.join(__dirname, '../../data');
-    const outputPath = path.join(dataDir, 'backup_latest.json');
-
     // Also create a timestamped backup
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-').substring(0, 19);
     const timestampedPath = path.join(dataDir, `backup_${timestamp}.json`);
@@ -142,10 +159,14 @@ async function backupDatabase() {
       fs.mkdirSync(dataDir, { recursive: true });
     }
 
-    // Write backup files
-    const jsonContent = JSON.stringify(backupData, null, 2);
-    fs.writeFileSync(outputPath, jsonContent, 'utf8');
-    fs.writeFileSync(timestampedPath, jsonContent, 'utf8');
+    // Encode once, then write each file whole to a temp path and rename it over the target,
+    // so a crash mid-write can never leave a truncated backup_latest.json to restore from
+    const jsonContent = Buffer.from(JSON.stringify(backupData, null, 2), 'utf8');
+    for (const target of [outputPath, timestampedPath]) {
+      const tmpPath = `${target}.tmp`;
+      fs.writeFileSync(tmpPath, jsonContent);
+      fs.renameSync(tmpPath, target);
+    }
 
     const stats = {
       users: backupData.users.length,
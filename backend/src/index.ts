@@ -17,6 +17,10 @@ import { validateEnv, getEnv } from './utils/env';
 validateEnv();
 import { logger } from './utils/logger';
 
+// Pool outbound connections before any service creates an axios client
+import { configureHttpAgents } from './utils/http';
+configureHttpAgents();
+
 import apiRouter from './routes/api';
 import authRouter from './routes/auth'; // Import new auth router
 import statsRouter from './routes/stats';
@@ -86,21 +90,27 @@ app.use(cors({
 
 // Rate limiting
 // Balanced approach: Protect against abuse while allowing normal usage patterns
+
+// Public, read-only health/status endpoints never count against the general limit.
+// NOTE: /system/setup-defaults is intentionally excluded — it now requires admin
+//       auth and must be rate-limited like any other authenticated endpoint.
+const UNLIMITED_READ_PATHS = ['/system/status', '/health'];
+
+// Prefixes (relative to /api) that already pass through a dedicated limiter below;
+// counting them again in the general limiter would be a second store hit per request
+const SPECIFIC_LIMITER_PREFIXES = ['/auth', '/recommendations', '/system/setup', '/system/verify', '/settings/import'];
+
 const generalLimiter = rateLimit({
   windowMs: 15 * 60 * 1000, // 15 minutes
   max: 2000, // 2000 requests per 15 minutes (~133/min) - allows very large imports (1000+ items)
   message: 'Too many requests from this IP, please try again later.',
   standardHeaders: true,
   legacyHeaders: false,
-  // Skip rate limiting only for truly public, read-only health/status endpoints.
-  // NOTE: /system/setup-defaults is intentionally excluded — it now requires admin
-  //       auth and must be rate-limited like any other authenticated endpoint.
   skip: (req) => {
-    const readOnlyPaths = [
-      '/system/status',
-      '/health',
-    ];
-    return readOnlyPaths.some(path => req.path.includes(path)) && req.method === 'GET';
+    if (req.method === 'GET' && UNLIMITED_READ_PATHS.some(path => req.path.includes(path))) return true;
+    // GET /auth/me is skipped by authLimiter, so the general limit stays its only guard
+    if (req.method === 'GET' && req.path === '/auth/me') return false;
+    return SPECIFIC_LIMITER_PREFIXES.some(prefix => req.path === prefix || req.path.startsWith(`${prefix}/`));
   },
 });
 
@@ -1,8 +1,26 @@
 import axios, { AxiosError } from 'axios';
 import { JellyfinItem, JellyfinLibrary, HttpError } from './types'; // Removed JellyfinAuthResponse, JellyfinUser as authenticateUser moved
 import ConfigService from './services/config';
+import { CacheService } from './services/cache';
 import { sanitizeUrl, validateRequestUrl, validateSafeUrl } from './utils/ssrf-protection';
 
+// Default field set for watch-history requests
+export const HISTORY_FIELDS = 'ProviderIds,Overview,Genres,CommunityRating,ProductionYear,PremiereDate,UserData,DateCreated,RunTimeTicks,SeriesId,SeriesName';
+
+// Owned-library scans walk every item in every library; reuse them for a short window
+const OWNED_IDS_TTL_SECONDS = 15 * 60;
+
+// Owned-title keys: lowercase alphanumerics with a leading "the"/"a" dropped
+const OWNED_TITLE_STRIP_RE = /[^a-z0-9]/g;
+const OWNED_TITLE_ARTICLE_RE = /^the|^a/;
+
+function normalizeOwnedTitle(title: string): string {
+    return title.toLowerCase().replace(OWNED_TITLE_STRIP_RE, '').replace(OWNED_TITLE_ARTICLE_RE, '');
+}
+
+// The in-memory cache hands back the same array on every hit, so its Set is built once per entry
+const ownedSetsByEntry = new WeakMap<string[], ReadonlySet<string>>();
+
 /**
  * Custom error for Jellyfin authentication failures (401)
  * This error should be propagated to frontend to trigger token refresh
@@ -152,8 +170,10 @@ export class JellyfinService {
     /**
      * Fetch ONLY watched items (IsPlayed filter) from Jellyfin.
      * This ensures we get actual watch history, not the entire library.
+     * Callers that only aggregate can pass a narrower `fields` list; Overview and
+     * UserData dominate the response size on large histories.
      */
-    public async getUserHistory(userId: string, accessToken: string, limit: number = 200, serverUrl?: string): Promise<JellyfinItem[]> {
+    public async getUserHistory(userId: string, accessToken: string, limit: number = 200, serverUrl?: string, fields: string = HISTORY_FIELDS): Promise<JellyfinItem[]> {
         try {
             const baseRaw = await JellyfinService.getBaseUrl(serverUrl);
             if (!baseRaw) throw new Error('Jellyfin base URL not configured');
@@ -168,7 +188,7 @@ export class JellyfinService {
                 SortBy: 'DatePlayed',              // Sort by when they were watched
                 SortOrder: 'Descending',           // Newest watches first
                 Limit: limit,
-                Fields: 'ProviderIds,Overview,Genres,CommunityRating,ProductionYear,PremiereDate,UserData,DateCreated,RunTimeTicks,SeriesId,SeriesName',
+                Fields: fields,
             };
 
             console.debug(`[Jellyfin] Fetching watched history: ${base}/Users/${userId}/Items (limit: ${limit})`);
@@ -204,7 +224,7 @@ export class JellyfinService {
      * Each entry will be either `tmdb:<id>` when a TMDB provider id is present, or
      * `titleyear:<normalized title>::<year>` for title+year matching fallback.
      */
-    public async getOwnedIds(userId: string, accessToken: string, serverUrl?: string): Promise<Set<string>> {
+    public async getOwnedIds(userId: string, accessToken: string, serverUrl?: string): Promise<ReadonlySet<string>> {
         try {
             const baseRaw = await JellyfinService.getBaseUrl(serverUrl);
             if (!baseRaw) {
@@ -212,25 +232,42 @@ export class JellyfinService {
                 return new Set();
             }
             const base = baseRaw.endsWith('/') ? baseRaw.slice(0, -1) : baseRaw;
+            const cacheKey = `owned_ids_${base}_${userId}`;
+            const cached = CacheService.get<string[]>('api', cacheKey);
+            if (cached) {
+                let ownedSet = ownedSetsByEntry.get(cached);
+                if (!ownedSet) {
+                    ownedSet = new Set(cached);
+                    ownedSetsByEntry.set(cached, ownedSet);
+                }
+                return ownedSet;
+            }
+
             const headers = JellyfinService.getHeaders(accessToken);
 
             // Fetch the user's libraries and aggregate items similarly to getItems logic
             let libs: JellyfinLibrary[] = [];
+            // A failed listing or library fetch yields a partial set: it is still returned,
+            // but not cached, so one Jellyfin timeout can't hide owned titles for the TTL
+            let incomplete = false;
             try {
                 libs = (await this.getLibraries(accessToken, serverUrl)) || [];
             } catch (e) {
                 console.warn('Failed to fetch libraries for ownedId extraction', e);
                 libs = [];
             }
+            if (libs.length === 0) incomplete = true;
             const pools = libs.length ? await Promise.all(libs.map(l => {
                 const url = validateRequestUrl(`${base}/Users/${userId}/Items`);
                 // codeql[js/request-forgery] - False positive: URL validated 3x (sanitizeUrl in getBaseUrl, validateRequestUrl, validateSafeUrl)
-                return axios.get<{ Items: JellyfinItem[] }>(validateSafeUrl(url), { headers, params: { ParentId: l.Id, Recursive: true, IncludeItemTypes: 'Movie,Series', Fields: 'ProviderIds,ProductionYear,Name,PremiereDate' }, timeout: 15000 }).then(r => r.data.Items || []).catch(() => [] as JellyfinItem[]);
+                return axios.get<{ Items: JellyfinItem[] }>(validateSafeUrl(url), { headers, params: { ParentId: l.Id, Recursive: true, IncludeItemTypes: 'Movie,Series', Fields: 'ProviderIds,ProductionYear,Name,PremiereDate', EnableImages: false, EnableUserData: false }, timeout: 15000 }).then(r => r.data.Items || []).catch(() => {
+                    incomplete = true;
+                    return [] as JellyfinItem[];
+                });
             })) : [];
             const items = (pools || []).flat();
 
             const owned = new Set<string>();
-            const normalize = (s: string) => (s || '').toString().toLowerCase().replace(/[^a-z0-9]/g, '').replace(/^the|^a/, '').trim();
 
             for (const it of items) {
                 // Try provider IDs first
@@ -243,11 +280,15 @@ export class JellyfinService {
                 const title = it?.Name || '';
                 const year = it?.ProductionYear || (it?.PremiereDate ? String(it.PremiereDate).substring(0, 4) : '') || '';
                 if (title) {
-                    const key = `titleyear:${normalize(title)}::${String(year || '')}`;
+                    const key = `titleyear:${normalizeOwnedTitle(title)}::${String(year || '')}`;
                     owned.add(key);
                 }
             }
 
+            // Stored as an array: persistent cache entries are JSON-serialized
+            const entry = Array.from(owned);
+            ownedSetsByEntry.set(entry, owned);
+            if (!incomplete) CacheService.set('api', cacheKey, entry, OWNED_IDS_TTL_SECONDS);
             return owned;
         } catch (e) {
             const err = e as AxiosError;
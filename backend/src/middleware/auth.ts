@@ -6,6 +6,7 @@ import { logger } from '../utils/logger';
 import { JellyfinService } from '../jellyfin';
 import NodeCache from 'node-cache';
 import { validateSession, updateSessionJellyfinToken } from '../services/sessionService';
+import { AuthService } from '../authService';
 
 const jellyfinService = new JellyfinService();
 
@@ -100,7 +101,6 @@ export async function authMiddleware(req: Request, res: Response, next: NextFunc
                         // Token invalid or expired — attempt transparent re-auth using stored credential
                         if (session.credential) {
                             try {
-                                const { AuthService } = await import('../authService');
                                 const authSvc = new AuthService();
                                 const refreshed = await authSvc.authenticateUser(
                                     session.username,
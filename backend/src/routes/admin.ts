@@ -19,52 +19,52 @@ router.get('/users', async (req, res) => {
     try {
         // Auth handled by middleware
 
-        const users = await prisma.user.findMany({
-            select: {
-                id: true,
-                username: true,
-                createdAt: true,
-                userMedia: {
-                    select: {
-                        status: true,
-                        updatedAt: true
-                    }
-                }
-            }
-        });
+        // Counts and latest timestamps are aggregated by the database in one grouped query per
+        // table, instead of loading every UserMedia row plus two lookups per user
+        const [users, mediaGroups, weeklyGroups, redemptionGroups] = await Promise.all([
+            prisma.user.findMany({ select: { id: true, username: true, createdAt: true } }),
+            prisma.userMedia.groupBy({
+                by: ['userId', 'status'],
+                _count: { _all: true },
+                _max: { updatedAt: true },
+            }),
+            prisma.weeklyWatchlist.groupBy({ by: ['userId'], _max: { generatedAt: true } }),
+            prisma.redemptionCandidates.groupBy({ by: ['userId'], _max: { generatedAt: true } }),
+        ]);
 
-        const userStats = await Promise.all(users.map(async (user) => {
-            // Count by status
-            const watched = user.userMedia.filter(um => um.status === 'WATCHED').length;
-            const watchlist = user.userMedia.filter(um => um.status === 'WATCHLIST').length;
-            const blocked = user.userMedia.filter(um => um.status === 'BLOCKED').length;
+        type MediaTotals = { watched: number; watchlist: number; blocked: number; lastActivity: Date | null };
+        const NO_MEDIA: MediaTotals = { watched: 0, watchlist: 0, blocked: 0, lastActivity: null };
+        const totalsByUser = new Map<number, MediaTotals>();
+        for (const group of mediaGroups) {
+            let totals = totalsByUser.get(group.userId);
+            if (!totals) {
+                totals = { watched: 0, watchlist: 0, blocked: 0, lastActivity: null };
+                totalsByUser.set(group.userId, totals);
+            }
+            if (group.status === 'WATCHED') totals.watched = group._count._all;
+            else if (group.status === 'WATCHLIST') totals.watchlist = group._count._all;
+            else if (group.status === 'BLOCKED') totals.blocked = group._count._all;
 
-            // Find last activity
-            const lastActivity = user.userMedia.length > 0
-                ? user.userMedia.reduce((latest, um) =>
-                    um.updatedAt > latest ? um.updatedAt : latest,
-                    user.userMedia[0].updatedAt
-                )
-                : user.createdAt;
+            const latest = group._max.updatedAt;
+            if (latest && (!totals.lastActivity || latest > totals.lastActivity)) totals.lastActivity = latest;
+        }
 
-            // Get Weekly Picks status
-            const weeklyPicks = await prisma.weeklyWatchlist.findFirst({
-                where: { userId: user.id },
-                orderBy: { generatedAt: 'desc' },
-                select: { generatedAt: true }
-            });
+        const weeklyByUser = new Map(weeklyGroups.map(g => [g.userId, g._max.generatedAt]));
+        const redemptionByUser = new Map(redemptionGroups.map(g => [g.userId, g._max.generatedAt]));
 
-            // Get Redemption Candidates status
-            const redemptionCandidates = await prisma.redemptionCandidates.findFirst({
-                where: { userId: user.id },
-                orderBy: { generatedAt: 'desc' },
-                select: { generatedAt: true }
-            });
+        const now = Date.now();
+        // Determine if active (activity in last 7 days)
+        const sevenDaysAgo = new Date(now - 7 * 24 * 60 * 60 * 1000);
+        const daysSince = (date: Date) => (now - date.getTime()) / (1000 * 60 * 60 * 24);
 
-            // Determine if active (activity in last 7 days)
-            const sevenDaysAgo = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000);
+        const userStats = users.map((user) => {
+            const { watched, watchlist, blocked, lastActivity: latestMedia } = totalsByUser.get(user.id) ?? NO_MEDIA;
+            const lastActivity = latestMedia ?? user.createdAt;
             const isActive = lastActivity >= sevenDaysAgo;
 
+            const weeklyPicks = weeklyByUser.get(user.id);
+            const redemptionCandidates = redemptionByUser.get(user.id);
+
             return {
                 username: user.username,
                 createdAt: user.createdAt,
@@ -78,26 +78,27 @@ router.get('/users', async (req, res) => {
                 },
                 aiFeatures: {
                     weeklyPicks: weeklyPicks ? {
-                        generatedAt: weeklyPicks.generatedAt,
-                        daysOld: (Date.now() - weeklyPicks.generatedAt.getTime()) / (1000 * 60 * 60 * 24)
+                        generatedAt: weeklyPicks,
+                        daysOld: daysSince(weeklyPicks)
                     } : null,
                     redemptionCandidates: redemptionCandidates ? {
-                        generatedAt: redemptionCandidates.generatedAt,
-                        daysOld: (Date.now() - redemptionCandidates.generatedAt.getTime()) / (1000 * 60 * 60 * 24)
+                        generatedAt: redemptionCandidates,
+                        daysOld: daysSince(redemptionCandidates)
                     } : null
                 }
             };
-        }));
+        });
 
         // Sort by last activity (most recent first)
         userStats.sort((a, b) => b.lastActivity.getTime() - a.lastActivity.getTime());
 
+        const active = userStats.reduce((n, u) => (u.isActive ? n + 1 : n), 0);
         res.json({
             users: userStats,
             summary: {
                 total: users.length,
-                active: userStats.filter(u => u.isActive).length,
-                inactive: userStats.filter(u => !u.isActive).length
+                active,
+                inactive: users.length - active
             }
         });
     } catch (e) {
@@ -10,6 +10,7 @@ import crypto from 'crypto';
 import { logger } from '../utils/logger';
 import { authMiddleware } from '../middleware/auth';
 import { createSession, deleteSession } from '../services/sessionService';
+import ConfigService from '../services/config';
 
 const authRouter = Router();
 const authService = new AuthService();
@@ -108,8 +109,6 @@ authRouter.post('/login', validateLogin, async (req: Request, res: Response) =>
         }
 
         // After successful auth, read back the config to get the working URL that was persisted
-        const ConfigServiceModule = await import('../services/config');
-        const ConfigService = ConfigServiceModule.default;
         const cfg = await ConfigService.getConfig();
         const workingUrl = cfg.jellyfinUrl;
 
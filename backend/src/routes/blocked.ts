@@ -6,6 +6,8 @@
 import { Router, Request, Response } from 'express';
 import { prisma } from '../db';
 import { AdvocateService } from '../services/advocate';
+import { requestMediaByTmdb } from '../services/jellyseerr';
+import { invalidateUserData } from '../services/data';
 import { authMiddleware } from '../middleware/auth';
 
 const router = Router();
@@ -206,7 +208,6 @@ router.post('/:id/unblock', async (req: Request, res: Response) => {
         } else if (action === 'jellyseerr') {
             // Make Jellyseerr request
             try {
-                const { requestMediaByTmdb } = await import('../services/jellyseerr');
                 const mediaType = media.mediaType as 'movie' | 'tv';
                 jellyseerrResult = await requestMediaByTmdb(tmdbId, mediaType);
                 console.log(`[Blocked API] Jellyseerr request sent for ${tmdbId} (${mediaType})`);
@@ -228,6 +229,7 @@ router.post('/:id/unblock', async (req: Request, res: Response) => {
             console.log(`[Blocked API] Removed UserMedia relation for ${tmdbId} (Action: ${action})`);
         }
 
+        invalidateUserData(req.user.username);
         console.log(`[Blocked API] Unblocked media ${tmdbId} for ${req.user.username}, action: ${action}`);
 
         // Update redemption candidates cache by removing this item
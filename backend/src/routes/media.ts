@@ -18,7 +18,7 @@ const jellyfinService = new JellyfinService();
  * GET /images/:filename - Serve locally cached images
  */
 
-router.get('/images/:filename', async (req: Request, res: Response) => {
+router.get('/images/:filename', (req: Request, res: Response) => {
     const { filename } = req.params;
 
     // Security: Validate filename to prevent directory traversal
@@ -27,17 +27,26 @@ router.get('/images/:filename', async (req: Request, res: Response) => {
         return res.status(400).json({ error: 'Invalid filename' });
     }
 
-    const [, mediaType, tmdbIdStr, type] = match;
+    const [, , tmdbIdStr, type] = match;
     const tmdbId = parseInt(tmdbIdStr, 10);
     const imageDir = process.env.IMAGE_DIR || '/app/images';
     const imagePath = path.join(imageDir, filename);
 
-    // Optimize: If exists, serve immediately (fs.existsSync is synchronous but fast on local SSD/tmpfs)
-    if (fs.existsSync(imagePath)) {
-        return res.sendFile(imagePath);
-    }
+    // Hand the file straight to sendFile; it stats the file itself, so a missing image shows up
+    // as ENOENT here instead of costing every hit an extra blocking existsSync first
+    res.sendFile(imagePath, (err?: NodeJS.ErrnoException) => {
+        if (!err || res.headersSent) return;
+        if (err.code !== 'ENOENT') {
+            console.error(`[ImageHandler] Failed to send ${filename}:`, err.message);
+            res.status(500).json({ error: 'Internal server error while retrieving image' });
+            return;
+        }
+        void healMissingImage(res, filename, imagePath, tmdbId, type as 'poster' | 'backdrop');
+    });
+});
 
-    // Self-healing: File missing, checking DB for source URL
+// Self-healing: the local file is gone, so re-download it from the source URL stored in the DB
+async function healMissingImage(res: Response, filename: string, imagePath: string, tmdbId: number, type: 'poster' | 'backdrop') {
     console.log(`[ImageHandler] Image missing: ${filename}. Attempting self-healing...`);
     try {
         const media = await prisma.media.findUnique({
@@ -75,7 +84,7 @@ router.get('/images/:filename', async (req: Request, res: Response) => {
         console.error(`[ImageHandler] Error during self-healing:`, err);
         return res.status(500).json({ error: 'Internal server error while retrieving image' });
     }
-});
+}
 
 /**
  * GET /debug/jellyfin - Debug endpoint to inspect raw Jellyfin watched history
@@ -4,8 +4,8 @@
 
 import { Router, Request, Response } from 'express';
 import { JellyfinService, JellyfinAuthError } from '../jellyfin';
-import { JellyfinItem, FrontendItem, MediaItemInput } from '../types';
-import { getUserData, getFullWatchlist } from '../services/data';
+import { JellyfinItem, FrontendItem } from '../types';
+import { getUserData, getTrackedIds, getFullWatchlist } from '../services/data';
 import prisma from '../services/data';
 import { GeminiService } from '../services/gemini';
 import { TasteService } from '../services/taste';
@@ -17,6 +17,7 @@ import { toFrontendItem } from './route-utils';
 import { getAnchorItems, collectCandidateIds, MOOD_KEYWORDS } from '../services/anchor-recommendations';
 import { authMiddleware } from '../middleware/auth';
 import pLimit from 'p-limit';
+import { logger } from '../utils/logger';
 import { discoverMovies, discoverTV } from '../services/tmdb-discover';
 import { genreNamesToIds, getGenreName } from '../services/tmdb-genres';
 import {
@@ -76,6 +77,13 @@ function interleaveByGenre(items: FrontendItem[]): FrontendItem[] {
 const router = Router();
 const jellyfinService = new JellyfinService();
 
+// One limiter for every getFullDetails fan-out, shared across requests, so concurrent
+// users together stay within a fixed number of in-flight Jellyseerr detail calls
+const detailFetchLimit = pLimit(16);
+
+// Watch history rarely changes between clicks while users try different filters
+const HISTORY_CACHE_TTL_SECONDS = 5 * 60;
+
 /**
  * GET /search - Search for media via Jellyseerr
  * Identity sourced exclusively from req.user (set by authMiddleware).
@@ -93,12 +101,7 @@ router.get('/search', authMiddleware, async (req, res) => {
 
         // Filter out items already tracked by this user
         if (userName) {
-            const userData = await getUserData(userName);
-            const existingIds = new Set<number>([
-                ...(userData.watchedIds || []),
-                ...(userData.watchlistIds || []),
-                ...(userData.blockedIds || [])
-            ]);
+            const existingIds = await getTrackedIds(userName);
             const beforeCount = mapped.length;
             mapped = mapped.filter((item: FrontendItem) => item.tmdbId !== null && !existingIds.has(item.tmdbId));
             console.debug(`[Search] Filtered ${beforeCount - mapped.length} existing items (${mapped.length} remaining)`);
@@ -116,7 +119,7 @@ router.get('/search', authMiddleware, async (req, res) => {
  * Identity sourced exclusively from req.user (set by authMiddleware).
  */
 router.get('/recommendations', authMiddleware, async (req, res) => {
-    const { libraryId, type, genre, mood, yearFrom, yearTo } = req.query;
+    const { type, genre, mood, yearFrom, yearTo } = req.query;
     // Use the Jellyfin token resolved by authMiddleware (from session), falling back to the
     // raw header for legacy local: token flows where jellyfinToken is not set.
     const accessToken = (req.user?.jellyfinToken ?? req.headers['x-access-token']) as string;
@@ -149,95 +152,52 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
 
         console.log(`[Recommendations] Request: type=${type} genre=${genre} mood=${mood} yearFrom=${selectedYearFrom ?? 'any'} yearTo=${selectedYearTo ?? 'any'} refresh=${req.query.refresh}`);
 
-        // Fetch items from library or all libraries
         // NOTE: These Jellyfin API calls are optional - recommendations can work without them
         // using locally cached anchor items from the database
-        let items: JellyfinItem[] = [];
-        let history: any[] = [];
-        let ownedSet: Set<string> = new Set();
         let jellyfinAvailable = true;
 
-        // Try to fetch from Jellyfin, but don't fail if unavailable
-        try {
-            if (libraryId) {
-                items = await jellyfinService.getItems(userId, accessToken, libraryId as string, undefined, jellyfinServer);
-            } else {
-                let libs: any[] = [];
-                try {
-                    libs = (await jellyfinService.getLibraries(accessToken, jellyfinServer)) || [];
-                } catch (e) {
-                    console.warn('Failed to fetch libraries (Jellyfin may be unreachable)', e);
-                    libs = [];
-                }
-                const pools = libs.length ? await Promise.all(libs.map(l => jellyfinService.getItems(userId, accessToken, l.Id, undefined, jellyfinServer))) : [];
-                items = (pools || []).flat();
+        const loadHistory = async (): Promise<any[]> => {
+            const historyCacheKey = `rec_history_${jellyfinServer || 'default'}_${userId}`;
+            const cachedHistory = CacheService.get<JellyfinItem[]>('api', historyCacheKey);
+            if (cachedHistory) return cachedHistory;
+            try {
+                const fetched = await jellyfinService.getUserHistory(userId, accessToken, undefined, jellyfinServer);
+                if (!Array.isArray(fetched)) return [];
+                // An empty list is also what a failed fetch looks like; don't pin it
+                if (fetched.length > 0) CacheService.set('api', historyCacheKey, fetched, HISTORY_CACHE_TTL_SECONDS);
+                return fetched;
+            } catch (e) {
+                console.warn('[Recommendations] Jellyfin history fetch failed, using local anchor data:', e instanceof Error ? e.message : e);
+                jellyfinAvailable = false;
+                return [];
             }
-        } catch (e) {
-            console.warn('[Recommendations] Jellyfin items fetch failed, using local data only:', e instanceof Error ? e.message : e);
-            jellyfinAvailable = false;
-        }
-
-        const userData = await getUserData(userName || userId);
-
-        // Try to fetch history from Jellyfin, but continue if it fails
-        try {
-            history = await jellyfinService.getUserHistory(userId, accessToken, undefined, jellyfinServer);
-            if (!Array.isArray(history)) history = [];
-        } catch (e) {
-            console.warn('[Recommendations] Jellyfin history fetch failed, using local anchor data:', e instanceof Error ? e.message : e);
-            history = [];
-            jellyfinAvailable = false;
-        }
-
-        const historyTmdbIds = extractTmdbIds(history);
-
-        // Try to get owned IDs, but continue if it fails
-        try {
-            ownedSet = await jellyfinService.getOwnedIds(userId, accessToken, jellyfinServer);
-        } catch (e) {
-            console.warn('[Recommendations] Jellyfin owned IDs fetch failed:', e instanceof Error ? e.message : e);
-            ownedSet = new Set();
-        }
-
-        // Build exclusion lists
-        const watchedTitles = (history || []).map((h: any) => {
-            const name = h.Name || h.title || h.name || '';
-            const year = h.ProductionYear || (h.PremiereDate ? String(h.PremiereDate).substring(0, 4) : '');
-            return year ? `${name} (${year})` : name;
-        }).filter(Boolean);
-
-        const watchlistEntries = await getFullWatchlist(userName || userId);
-        const watchlistTitles = (watchlistEntries || []).map((w: any) => (w.title || '').trim()).filter(Boolean);
+        };
 
-        let blockedTitles: string[] = [];
-        let blockedItems: Array<{ title: string; genres: string[] }> = [];
-        if (Array.isArray(userData.blockedIds) && userData.blockedIds.length) {
+        const loadOwnedIds = async (): Promise<ReadonlySet<string>> => {
             try {
-                const blockedMedia = await prisma.media.findMany({
-                    where: { tmdbId: { in: userData.blockedIds.map((i: any) => Number(i)).filter(Boolean) } },
-                    select: { title: true, genres: true },
-                });
-                blockedTitles = blockedMedia.map(m => (m.title || '').trim()).filter(Boolean);
-                blockedItems = blockedMedia.map(m => ({
-                    title: (m.title || '').trim(),
-                    genres: m.genres ? JSON.parse(m.genres) as string[] : [],
-                })).filter(b => b.title);
+                return await jellyfinService.getOwnedIds(userId, accessToken, jellyfinServer);
             } catch (e) {
-                console.warn('Failed to resolve blockedIds to titles', e);
+                console.warn('[Recommendations] Jellyfin owned IDs fetch failed:', e instanceof Error ? e.message : e);
+                return new Set();
             }
-        }
-
-        const libraryTitles = (items || []).map(it => `${(it as any).Name || (it as any).Title || ''}${(it as any).ProductionYear ? ` (${(it as any).ProductionYear})` : ''}`.trim()).filter(Boolean);
-        const allExclusionArray = Array.from(new Set([...watchedTitles, ...watchlistTitles, ...blockedTitles, ...libraryTitles]));
-
-        // Build numeric exclusion set
-        const excludedIds = new Set<number>();
-        historyTmdbIds.forEach(id => excludedIds.add(id));
-        (userData.watchedIds || []).forEach((id: any) => { const n = Number(id); if (Number.isFinite(n)) excludedIds.add(n); });
-        (userData.watchlistIds || []).forEach((id: any) => { const n = Number(id); if (Number.isFinite(n)) excludedIds.add(n); });
-        (userData.blockedIds || []).forEach((id: any) => { const n = Number(id); if (Number.isFinite(n)) excludedIds.add(n); });
+        };
 
-        for (const s of Array.from(ownedSet || [])) {
+        // The Jellyfin calls and the user's DB state are independent; load them all at once
+        const [history, ownedSet, userData, watchlistEntries] = await Promise.all([
+            loadHistory(),
+            loadOwnedIds(),
+            getUserData(userName || userId),
+            getFullWatchlist(userName || userId),
+        ]);
+        // Served from the snapshot getUserData just cached
+        const trackedIds = await getTrackedIds(userName || userId);
+
+        // Build numeric exclusion set: a private copy of the user's tracked ids (it is
+        // extended during generation), plus everything in the Jellyfin history
+        const excludedIds = new Set<number>(trackedIds);
+        for (const id of extractTmdbIds(history)) excludedIds.add(id);
+
+        for (const s of ownedSet) {
             if (typeof s === 'string' && s.startsWith('tmdb:')) {
                 const num = Number(s.split(':')[1]);
                 if (Number.isFinite(num)) excludedIds.add(num);
@@ -256,32 +216,6 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
         const TARGET_COUNT = 10;
         const MAX_ATTEMPTS = 3;
 
-        const jellyfinToMediaInput = (item: JellyfinItem): MediaItemInput => ({
-            tmdbId: item.ProviderIds?.Tmdb ?? item.ProviderIds?.tmdb,
-            title: item.Name,
-            name: item.Name,
-            mediaType: item.Type?.toLowerCase() === 'series' ? 'tv' : 'movie',
-            releaseYear: item.ProductionYear ? String(item.ProductionYear) : (item.PremiereDate ? String(item.PremiereDate).substring(0, 4) : undefined),
-            voteAverage: item.CommunityRating,
-            overview: item.Overview,
-        });
-
-        const likedItems: MediaItemInput[] = [
-            ...(history || []).map(jellyfinToMediaInput),
-            ...(watchlistEntries || []).map(w => ({
-                tmdbId: w.tmdbId,
-                title: w.title,
-                mediaType: w.mediaType,
-                releaseYear: w.releaseYear,
-                posterUrl: w.posterUrl,
-                overview: w.overview,
-                voteAverage: w.voteAverage,
-            } as MediaItemInput))
-        ];
-        const dislikedItems: MediaItemInput[] = Array.isArray(userData.blockedIds)
-            ? userData.blockedIds.map(id => ({ tmdbId: id } as MediaItemInput))
-            : [];
-
         const cacheKey = `${userName || userId}_${filters.type || 'any'}_${filters.genre || 'any'}_${filters.mood || 'any'}_${filters.yearFrom || 'any'}_${filters.yearTo || 'any'}`;
         const viewCacheKey = `view_recs_${cacheKey}`;
         // Ensure strictly boolean check on string 'true'
@@ -337,9 +271,36 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
             // Already cleared and set to []
         }
 
+        // Blocked titles + genres feed the Gemini prompts; exclusion itself is id-based.
+        // Built only once we know we're generating, so view-cache hits skip the lookup.
+        let blockedItems: Array<{ title: string; genres: string[] }> = [];
+        if (Array.isArray(userData.blockedIds) && userData.blockedIds.length) {
+            try {
+                const blockedMedia = await prisma.media.findMany({
+                    where: { tmdbId: { in: userData.blockedIds.map((i: any) => Number(i)).filter(Boolean) } },
+                    select: { title: true, genres: true },
+                });
+                blockedItems = blockedMedia.map(m => ({
+                    title: (m.title || '').trim(),
+                    genres: m.genres ? JSON.parse(m.genres) as string[] : [],
+                })).filter(b => b.title);
+            } catch (e) {
+                console.warn('Failed to resolve blockedIds to titles', e);
+            }
+        }
+
+        // Only the five most recent liked titles reach the prompt: take them straight off
+        // history then the watchlist instead of mapping every entry to a MediaItemInput first
+        const recentLikedTitles = [
+            ...(history || []).slice(0, 5).map((i: JellyfinItem) => i.Name),
+            ...(watchlistEntries || []).slice(0, 5).map(w => w.title),
+        ].slice(0, 5).filter((t): t is string => !!t);
+
         // --- ANCHOR-BASED CANDIDATE PRE-FETCH ---
         // Try to get candidates from user's enriched history first
         const mediaTypeFilter = filters.type === 'tv' ? 'tv' : filters.type === 'movie' ? 'movie' : undefined;
+        // Type candidates are fetched and ranked as; fixed for the whole request
+        const candidateType: 'movie' | 'tv' = mediaTypeFilter ?? 'movie';
         const genreFilters = (filters.genre || '')
             .split(',')
             .map(g => g.trim())
@@ -349,16 +310,16 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
         const anchors = await getAnchorItems(userName || userId, mediaTypeFilter, genreFilter, moodFilter, 10);
 
         if (anchors.length > 0 && buffer.length < TARGET_COUNT) {
-            const anchorGenres = anchors.flatMap(a => a.genres).slice(0, 3);
-            console.debug(`[Anchor] Found ${anchors.length} anchor items for ${userName || userId} (genres: ${anchorGenres.join(', ') || 'any'})`);
+            // The genre summary exists only for this trace; skip building it unless debug is on
+            if (logger.isLevelEnabled('debug')) {
+                logger.debug({ anchors: anchors.length, user: userName || userId, genres: anchors.flatMap(a => a.genres).slice(0, 3) }, '[Anchor] Found anchor items');
+            }
             const candidateIds = collectCandidateIds(anchors, excludedIds);
             console.debug(`[Anchor] Collected ${candidateIds.length} candidate IDs from anchors`);
 
             // Fetch details for candidates with bounded concurrency
-            const candidateType: 'movie' | 'tv' = filters.type === 'tv' ? 'tv' : 'movie';
             const MAX_CANDIDATES_FOR_RANKING = 40;
             const MAX_CANDIDATE_FETCH = 80;
-            const DETAIL_FETCH_CONCURRENCY = 8;
 
             // Phase 1: Collect all matching candidates with their details
             const candidatesForRanking: Array<{
@@ -370,14 +331,12 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
             }> = [];
 
             const candidateIdsToFetch = candidateIds.slice(0, MAX_CANDIDATE_FETCH);
-            const limit = pLimit(DETAIL_FETCH_CONCURRENCY);
-
             const fetchedCandidates = await Promise.all(
                 candidateIdsToFetch.map(tmdbId =>
-                    limit(async () => {
+                    detailFetchLimit(async () => {
                         // Check if already in any exclusion list BEFORE fetching details
                         if (excludedIds.has(tmdbId)) {
-                            console.debug(`[Anchor] SKIP: "${tmdbId}" - already in exclusion list`);
+                            logger.debug({ tmdbId }, '[Anchor] SKIP: already in exclusion list');
                             return null;
                         }
 
@@ -390,18 +349,18 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
 
                             if (!isYearInRange(fullDetails.releaseDate, filters.yearFrom, filters.yearTo)) {
                                 const releaseYear = extractYear(fullDetails.releaseDate);
-                                console.debug(`[Anchor] SKIP: "${tmdbId}" - year ${releaseYear ?? 'unknown'} outside range ${filters.yearFrom ?? 'any'}-${filters.yearTo ?? 'any'}`);
+                                logger.debug({ tmdbId, releaseYear, yearFrom: filters.yearFrom, yearTo: filters.yearTo }, '[Anchor] SKIP: year outside range');
                                 return null;
                             }
 
-                    // Filter by genre if specified
-                    if (genreFilter && genreFilter.length > 0) {
-                        const hasMatchingGenre = matchesSelectedGenres(fullDetails.genres, genreFilter);
-                        if (!hasMatchingGenre) {
-                            console.debug(`[Anchor] SKIP: "${tmdbId}" - genres [${fullDetails.genres.join(', ')}] don't match any of "${genreFilter.join(', ')}"`);
-                            return null;
-                        }
-                    }
+                            // Filter by genre if specified
+                            if (genreFilter && genreFilter.length > 0) {
+                                const hasMatchingGenre = matchesSelectedGenres(fullDetails.genres, genreFilter);
+                                if (!hasMatchingGenre) {
+                                    logger.debug({ tmdbId, genres: fullDetails.genres, genreFilter }, '[Anchor] SKIP: genres don\'t match filter');
+                                    return null;
+                                }
+                            }
 
                             let moodMatched: boolean | null = null;
                             if (moodFilter && MOOD_KEYWORDS[moodFilter]) {
@@ -431,11 +390,11 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
 
                 if (moodFilter && MOOD_KEYWORDS[moodFilter]) {
                     if (!candidate.moodMatched && candidatesForRanking.length >= 10) {
-                        console.debug(`[Anchor] MOOD SKIP: "${candidate.title}" - no keywords match mood "${moodFilter}"`);
+                        logger.debug({ title: candidate.title, mood: moodFilter }, '[Anchor] MOOD SKIP: no keywords match mood');
                         continue;
                     }
                     if (candidate.moodMatched) {
-                        console.debug(`[Anchor] MOOD MATCH: "${candidate.title}" matches mood "${moodFilter}"`);
+                        logger.debug({ title: candidate.title, mood: moodFilter }, '[Anchor] MOOD MATCH');
                     }
                 }
 
@@ -446,7 +405,7 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                     overview: candidate.overview,
                     voteAverage: candidate.voteAverage,
                 });
-                console.debug(`[Anchor] CANDIDATE: "${candidate.title}" [${candidate.genres.slice(0, 2).join(', ')}] ⭐${candidate.voteAverage?.toFixed(1) || 'N/A'}`);
+                logger.debug({ title: candidate.title, genres: candidate.genres.slice(0, 2), voteAverage: candidate.voteAverage }, '[Anchor] CANDIDATE');
             }
 
             console.debug(`[Anchor] Collected ${candidatesForRanking.length} candidates for Gemini ranking`);
@@ -471,17 +430,20 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                 console.debug(`[Gemini Ranking] Mood="${filters.mood || 'none'}" Genre="${genreFilter?.join(', ') || 'none'}" - Approved ${rankedCandidates.length} items`);
 
                 // Phase 3: Add Gemini-approved items to buffer
+                const acceptedIds = new Set(buffer.map(b => Number(b.tmdb_id)));
+                // Only ids we actually sent may be accepted; a Set avoids rescanning the pool per ranked item
+                const rankableIds = new Set(candidatesForRanking.map(c => c.tmdbId));
                 for (const ranked of rankedCandidates) {
                     if (buffer.length >= TARGET_COUNT) break;
-                    const candidate = candidatesForRanking.find(c => c.tmdbId === ranked.tmdbId);
-                    if (!candidate) continue;
+                    if (!rankableIds.has(ranked.tmdbId)) continue;
 
                     // getFullDetails is already cached from Phase 1 — no new network call
                     const fullDetails = await getFullDetails(ranked.tmdbId, candidateType);
-                    if (fullDetails && fullDetails.tmdb_id && !buffer.find(b => Number(b.tmdb_id) === ranked.tmdbId)) {
+                    if (fullDetails && fullDetails.tmdb_id && !acceptedIds.has(ranked.tmdbId)) {
                         buffer.push(fullDetails);
+                        acceptedIds.add(ranked.tmdbId);
                         excludedIds.add(ranked.tmdbId);
-                        console.log(`[Anchor+Gemini] ACCEPT: "${ranked.title}" - ${ranked.reason}`);
+                        logger.debug({ title: ranked.title, reason: ranked.reason }, '[Anchor+Gemini] ACCEPT');
                     }
                 }
             }
@@ -491,14 +453,18 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
         // --- END ANCHOR-BASED PRE-FETCH ---
 
         let attempts = 0;
+        // Same for every attempt: read it on the first one only, so a thin profile costs one
+        // lookup and one background refresh rather than one per attempt
+        let fillTasteProfile: string | undefined;
         while ((buffer.length < TARGET_COUNT) && attempts < MAX_ATTEMPTS) {
             attempts++;
             console.debug(`[Buffer] Attempt ${attempts}/${MAX_ATTEMPTS} — buffer has ${buffer.length}/${TARGET_COUNT}`);
 
-            const candidateType: 'movie' | 'tv' = filters.type === 'tv' ? 'tv' : 'movie';
-            let tasteProfile = await TasteService.getProfile(userName || userId, candidateType);
-            if (!tasteProfile || tasteProfile.length < 10) {
-                TasteService.triggerUpdate(userName || userId, candidateType, accessToken, userId);
+            if (fillTasteProfile === undefined) {
+                fillTasteProfile = await TasteService.getProfile(userName || userId, candidateType);
+                if (!fillTasteProfile || fillTasteProfile.length < 10) {
+                    TasteService.triggerUpdate(userName || userId, candidateType, accessToken, userId);
+                }
             }
 
             const candidatePool = new Map<number, {
@@ -509,6 +475,10 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                 voteAverage?: number;
             }>();
 
+            // Buffer ids are collected once per attempt and kept in sync as items are accepted,
+            // so dedup against the pool/buffer is a Set lookup rather than a rebuild per candidate
+            const bufferIds = new Set<number>(buffer.map(b => Number(b.tmdb_id)).filter(n => Number.isFinite(n)));
+
             const addCandidate = (candidate: {
                 tmdbId: number;
                 title: string;
@@ -520,21 +490,17 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                 if (!candidate.tmdbId || !Number.isFinite(candidate.tmdbId)) return;
                 if (!candidate.title || !candidate.title.trim()) return;
                 if (!isYearInRange(candidate.releaseDate, filters.yearFrom, filters.yearTo)) return;
-                const existingIds = new Set<number>([
-                    ...Array.from(candidatePool.keys()),
-                    ...buffer.map(b => Number(b.tmdb_id)).filter(n => Number.isFinite(n)),
-                ]);
-                if (!shouldIncludeTmdbId(candidate.tmdbId, excludedIds, existingIds)) return;
-                if (!candidatePool.has(candidate.tmdbId)) candidatePool.set(candidate.tmdbId, candidate);
+                if (candidatePool.has(candidate.tmdbId)) return;
+                if (!shouldIncludeTmdbId(candidate.tmdbId, excludedIds, bufferIds)) return;
+                candidatePool.set(candidate.tmdbId, candidate);
             };
 
             // Candidate source 1: Expanded anchor graph (candidate-first, no title generation)
             try {
                 const fillAnchors = await getAnchorItems(userName || userId, candidateType, genreFilter, moodFilter, 15);
                 const fillAnchorIds = collectCandidateIds(fillAnchors, excludedIds).slice(0, 100);
-                const detailLimit = pLimit(8);
                 await Promise.all(fillAnchorIds.map(tmdbId =>
-                    detailLimit(async () => {
+                    detailFetchLimit(async () => {
                         try {
                             const fullDetails = await getFullDetails(tmdbId, candidateType);
                             if (!fullDetails || !fullDetails.tmdb_id || excludedIds.has(fullDetails.tmdb_id)) return;
@@ -564,46 +530,31 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                 const discoverVoteCountMin = attempts === 1 ? 250 : attempts === 2 ? 100 : 50;
                 const discoverPages = attempts === 1 ? 2 : attempts === 2 ? 3 : 4;
 
-                if (candidateType === 'movie') {
-                    const discovered = await discoverMovies({
-                        with_genres: discoverGenreIds.length ? discoverGenreIds.join('|') : undefined,
-                        primary_release_date_gte: filters.yearFrom ? `${filters.yearFrom}-01-01` : undefined,
-                        primary_release_date_lte: filters.yearTo ? `${filters.yearTo}-12-31` : undefined,
-                        vote_average_gte: discoverVoteMin,
-                        vote_count_gte: discoverVoteCountMin,
-                        sort_by: attempts === 1 ? 'vote_average.desc' : 'popularity.desc',
-                    }, discoverPages);
-
-                    for (const item of discovered) {
-                        addCandidate({
-                            tmdbId: item.id,
-                            title: item.title || item.original_title || '',
-                            genres: (item.genre_ids || []).map(id => getGenreName(id, 'movie')).filter((g): g is string => !!g),
-                            overview: item.overview || undefined,
-                            voteAverage: item.vote_average,
-                            releaseDate: item.release_date,
-                        });
-                    }
-                } else {
-                    const discovered = await discoverTV({
-                        with_genres: discoverGenreIds.length ? discoverGenreIds.join('|') : undefined,
-                        first_air_date_gte: filters.yearFrom ? `${filters.yearFrom}-01-01` : undefined,
-                        first_air_date_lte: filters.yearTo ? `${filters.yearTo}-12-31` : undefined,
-                        vote_average_gte: discoverVoteMin,
-                        vote_count_gte: discoverVoteCountMin,
-                        sort_by: attempts === 1 ? 'vote_average.desc' : 'popularity.desc',
-                    }, discoverPages);
-
-                    for (const item of discovered) {
-                        addCandidate({
-                            tmdbId: item.id,
-                            title: item.name || item.original_name || '',
-                            genres: (item.genre_ids || []).map(id => getGenreName(id, 'tv')).filter((g): g is string => !!g),
-                            overview: item.overview || undefined,
-                            voteAverage: item.vote_average,
-                            releaseDate: item.first_air_date,
-                        });
-                    }
+                const sharedParams = {
+                    with_genres: discoverGenreIds.length ? discoverGenreIds.join('|') : undefined,
+                    vote_average_gte: discoverVoteMin,
+                    vote_count_gte: discoverVoteCountMin,
+                    sort_by: attempts === 1 ? 'vote_average.desc' : 'popularity.desc',
+                };
+                const dateFrom = filters.yearFrom ? `${filters.yearFrom}-01-01` : undefined;
+                const dateTo = filters.yearTo ? `${filters.yearTo}-12-31` : undefined;
+
+                // Normalize movie/TV discover results to one shape so a single loop feeds the pool
+                const discovered = candidateType === 'movie'
+                    ? (await discoverMovies({ ...sharedParams, primary_release_date_gte: dateFrom, primary_release_date_lte: dateTo }, discoverPages))
+                        .map(item => ({ id: item.id, title: item.title || item.original_title || '', genre_ids: item.genre_ids, overview: item.overview, vote_average: item.vote_average, releaseDate: item.release_date }))
+                    : (await discoverTV({ ...sharedParams, first_air_date_gte: dateFrom, first_air_date_lte: dateTo }, discoverPages))
+                        .map(item => ({ id: item.id, title: item.name || item.original_name || '', genre_ids: item.genre_ids, overview: item.overview, vote_average: item.vote_average, releaseDate: item.first_air_date }));
+
+                for (const item of discovered) {
+                    addCandidate({
+                        tmdbId: item.id,
+                        title: item.title,
+                        genres: (item.genre_ids || []).map(id => getGenreName(id, candidateType)).filter((g): g is string => !!g),
+                        overview: item.overview || undefined,
+                        voteAverage: item.vote_average,
+                        releaseDate: item.releaseDate,
+                    });
                 }
             } catch (e) {
                 console.warn('[Fill] TMDB discover candidate pool collection failed:', e instanceof Error ? e.message : e);
@@ -616,8 +567,8 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
             const rankedCandidates = await GeminiService.rankCandidates(
                 candidatesForRanking,
                 {
-                    tasteProfile: tasteProfile || undefined,
-                    recentFavorites: likedItems.slice(0, 5).map(i => i.title || i.name || '').filter(Boolean),
+                    tasteProfile: fillTasteProfile || undefined,
+                    recentFavorites: recentLikedTitles,
                     requestedGenre: genreFilter?.join(', '),
                     requestedMood: filters.mood,
                     requestedYearRange: (filters.yearFrom || filters.yearTo) ? `${filters.yearFrom ?? 'any'}-${filters.yearTo ?? 'any'}` : undefined,
@@ -632,11 +583,12 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
                     const details = await getFullDetails(ranked.tmdbId, candidateType);
                     if (!details || !details.tmdb_id) continue;
                     if (excludedIds.has(details.tmdb_id)) continue;
-                    if (buffer.find(b => Number(b.tmdb_id) === details.tmdb_id)) continue;
+                    if (bufferIds.has(details.tmdb_id)) continue;
 
                     buffer.push(details);
+                    bufferIds.add(details.tmdb_id);
                     excludedIds.add(details.tmdb_id);
-                    console.log(`[Fill+Gemini] ACCEPT: "${ranked.title}" - ${ranked.reason || 'candidate-first rank'}`);
+                    logger.debug({ title: ranked.title, reason: ranked.reason || 'candidate-first rank' }, '[Fill+Gemini] ACCEPT');
                 } catch {
                     // Skip details failures
                 }
@@ -651,7 +603,7 @@ router.get('/recommendations', authMiddleware, async (req, res) => {
         // Update the generation buffer
         CacheService.set('recommendations', cacheKey, remaining);
 
-        TasteService.triggerUpdate(userName || userId, (filters.type === 'tv') ? 'tv' : 'movie', accessToken, userId);
+        TasteService.triggerUpdate(userName || userId, candidateType, accessToken, userId);
 
         let validItems = responseItems.map(d => toFrontendItem(d)).filter((x): x is FrontendItem => x !== null && x.tmdbId !== null);
 
@@ -42,6 +42,34 @@ export interface ToFrontendItemInput {
     genres?: string[];
 }
 
+const LOCAL_IMAGE_PREFIX = '/images/';
+const PROXY_IMAGE_PREFIX = '/api/proxy/image';
+
+/**
+ * Resolve the URL the frontend should load for a poster or backdrop.
+ * Prefers the local cached image, then the stored source URL, then legacy path fields;
+ * anything that is not already served by the backend is routed through the image proxy.
+ */
+function resolveImageUrl(
+    kind: 'poster' | 'backdrop',
+    url: string | null | undefined,
+    sourceUrl: string | null | undefined,
+    legacyPath: string | null | undefined
+): string | null {
+    if (url) {
+        // Cached images are stored as /images/<file> and served under /api/images/
+        if (url.startsWith(LOCAL_IMAGE_PREFIX)) return `/api${url}`;
+        if (url.startsWith(PROXY_IMAGE_PREFIX) || url.startsWith('/api/images/')) return url;
+        return `${PROXY_IMAGE_PREFIX}?type=${kind}&path=${encodeURIComponent(url)}`;
+    }
+    if (sourceUrl) {
+        return sourceUrl.startsWith(PROXY_IMAGE_PREFIX)
+            ? sourceUrl
+            : `${PROXY_IMAGE_PREFIX}?type=${kind}&path=${encodeURIComponent(sourceUrl)}`;
+    }
+    return legacyPath ? `${PROXY_IMAGE_PREFIX}?type=${kind}&path=${encodeURIComponent(legacyPath)}` : null;
+}
+
 /**
  * Standard mapper to normalize varied backend shapes to frontend contract
  */
@@ -62,69 +90,11 @@ export function toFrontendItem(item: ToFrontendItemInput | null | undefined): Fr
         (item.releaseDate ? String(item.releaseDate).substring(0, 4) :
             (item.firstAirDate ? String(item.firstAirDate).substring(0, 4) : '')) ?? '';
 
-    // Poster resolution: Prefer local cached image, fallback to source URL
-    let posterUrl: string | null = null;
-    if (item.posterUrl) {
-        // If posterUrl starts with /images/, convert to /api/images/ (backend serves cached images)
-        if (item.posterUrl.startsWith('/images/')) {
-            const filename = item.posterUrl.replace('/images/', '');
-            posterUrl = `/api/images/${filename}`;
-        }
-        // If posterUrl is already a proxy URL, use it
-        else if (item.posterUrl.startsWith('/api/proxy/image') || item.posterUrl.startsWith('/api/images/')) {
-            posterUrl = item.posterUrl;
-        }
-        // Otherwise, construct proxy URL
-        else {
-            posterUrl = `/api/proxy/image?type=poster&path=${encodeURIComponent(item.posterUrl)}`;
-        }
-    }
-    // Fallback to posterSourceUrl if posterUrl is missing
-    else if (item.posterSourceUrl) {
-        posterUrl = item.posterSourceUrl.startsWith('/api/proxy/image')
-            ? item.posterSourceUrl
-            : `/api/proxy/image?type=poster&path=${encodeURIComponent(item.posterSourceUrl)}`;
-    }
-    // Last resort: try legacy fields
-    else {
-        const posterSource = item.poster_path || item.poster || item.poster_url;
-        if (posterSource) {
-            posterUrl = `/api/proxy/image?type=poster&path=${encodeURIComponent(posterSource)}`;
-        }
-    }
-
+    const posterUrl = resolveImageUrl('poster', item.posterUrl, item.posterSourceUrl,
+        item.poster_path || item.poster || item.poster_url);
     const voteAverage = item.voteAverage ?? item.vote_average ?? item.rating ?? 0;
-
-    // Backdrop resolution: Prefer local cached image, fallback to source URL
-    let backdropUrl: string | null = null;
-    if (item.backdropUrl) {
-        // If backdropUrl starts with /images/, convert to /api/images/ (backend serves cached images)
-        if (item.backdropUrl.startsWith('/images/')) {
-            const filename = item.backdropUrl.replace('/images/', '');
-            backdropUrl = `/api/images/${filename}`;
-        }
-        // If backdropUrl is already a proxy URL, use it
-        else if (item.backdropUrl.startsWith('/api/proxy/image') || item.backdropUrl.startsWith('/api/images/')) {
-            backdropUrl = item.backdropUrl;
-        }
-        // Otherwise, construct proxy URL
-        else {
-            backdropUrl = `/api/proxy/image?type=backdrop&path=${encodeURIComponent(item.backdropUrl)}`;
-        }
-    }
-    // Fallback to backdropSourceUrl if backdropUrl is missing
-    else if (item.backdropSourceUrl) {
-        backdropUrl = item.backdropSourceUrl.startsWith('/api/proxy/image')
-            ? item.backdropSourceUrl
-            : `/api/proxy/image?type=backdrop&path=${encodeURIComponent(item.backdropSourceUrl)}`;
-    }
-    // Last resort: try legacy fields
-    else {
-        const backdropSource = item.backdrop_path || item.backdrop || item.backdrop_url;
-        if (backdropSource) {
-            backdropUrl = `/api/proxy/image?type=backdrop&path=${encodeURIComponent(backdropSource)}`;
-        }
-    }
+    const backdropUrl = resolveImageUrl('backdrop', item.backdropUrl, item.backdropSourceUrl,
+        item.backdrop_path || item.backdrop || item.backdrop_url);
 
     return {
         tmdbId,
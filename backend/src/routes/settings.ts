@@ -3,12 +3,15 @@
  */
 
 import { Router, Request, Response } from 'express';
-import importService from '../services/import';
+import importService, { type ImportProgress } from '../services/import';
 import { exportUserData, exportAllUsersData } from '../services/export';
 import { authMiddleware } from '../middleware/auth';
 
 const router = Router();
 
+const SSE_POLL_MS = 500;
+const SSE_KEEPALIVE_TICKS = 30; // ~15s between keep-alive comments while progress is unchanged
+
 /**
  * GET /settings/import/progress/:username - SSE endpoint for import progress
  * The authenticated user may only poll their own import progress.
@@ -34,8 +37,21 @@ router.get('/import/progress/:username', authMiddleware, (req, res) => {
         res.write(`data: ${JSON.stringify(initialProgress)}\n\n`);
     }
 
+    // Progress objects are replaced on every update, so a reference check tells us whether
+    // anything changed. Unchanged ticks send nothing except a periodic keep-alive comment.
+    let lastSent: ImportProgress | null | undefined = initialProgress ?? undefined;
+    let idleTicks = 0;
     const interval = setInterval(() => {
         const progress = importService.getProgress(username);
+        if (progress === lastSent) {
+            if (++idleTicks >= SSE_KEEPALIVE_TICKS) {
+                idleTicks = 0;
+                res.write(': keep-alive\n\n');
+            }
+            return;
+        }
+        lastSent = progress;
+        idleTicks = 0;
         if (progress) {
             res.write(`data: ${JSON.stringify(progress)}\n\n`);
             if (progress.completed) {
@@ -45,7 +61,7 @@ router.get('/import/progress/:username', authMiddleware, (req, res) => {
         } else {
             res.write(`data: ${JSON.stringify({ active: false })}\n\n`);
         }
-    }, 500);
+    }, SSE_POLL_MS);
 
     req.on('close', () => {
         clearInterval(interval);
@@ -156,10 +172,13 @@ router.get('/export', authMiddleware, async (req, res) => {
             filename = `jellyfin-backup-${username}-${new Date().toISOString().split('T')[0]}.json`;
         }
 
-        res.setHeader('Content-Type', 'application/json');
+        // Serialised once into a buffer and written as-is: res.json() would also hash the
+        // whole backup for an ETag that a one-off attachment download never revalidates
+        const body = Buffer.from(JSON.stringify(exportData), 'utf8');
+        res.setHeader('Content-Type', 'application/json; charset=utf-8');
         res.setHeader('Content-Disposition', `attachment; filename="${filename}"`);
-
-        res.json(exportData);
+        res.setHeader('Content-Length', body.length);
+        res.end(body);
     } catch (e) {
         console.error('Export failed', e);
         res.status(500).json({ error: 'Export failed', message: String(((e as any)?.message) || e) });
@@ -4,12 +4,23 @@ import { JellyfinService, JellyfinAuthError } from '../jellyfin';
 import { sanitizeUrl } from '../utils/ssrf-protection';
 import { GeminiService } from '../services/gemini';
 import { authMiddleware } from '../middleware/auth';
-import prisma from '../db';
+import { CacheService } from '../services/cache';
+import { getUserData } from '../services/data';
 
 const router = Router();
 router.use(authMiddleware);
 const jellyfinService = new JellyfinService();
 
+// History aggregation walks up to 2000 Jellyfin items; reuse it across modal opens
+const HISTORY_STATS_TTL_SECONDS = 600;
+
+interface HistoryStats {
+    movies: number;
+    series: number;
+    totalHours: number;
+    genres: Array<{ name: string; value: number }>;
+}
+
 /**
  * GET /api/stats
  * Aggregates user statistics:
@@ -30,72 +41,81 @@ router.get('/', async (req, res) => {
     }
 
     try {
-        // 1. Fetch blocked count from local DB
-        const blockedCount = await prisma.userMedia.count({
-            where: {
-                userId: req.user.id,
-                status: 'BLOCKED'
-            }
-        });
+        // 1. Blocked count from the per-user status snapshot, which every status write
+        //    invalidates, so reopening the modal doesn't re-count rows
+        const { blockedIds } = await getUserData(req.user.username);
+        const blockedCount = blockedIds.length;
 
-        // 2. Fetch User History from Jellyfin
-        // Request a high limit to get accurate stats
+        // 2. Fetch and aggregate User History from Jellyfin (cached per user)
         const jellyfinUserId = req.user.jellyfinUserId || '';
-        const history = await jellyfinService.getUserHistory(jellyfinUserId, accessToken, 2000, jellyfinServer);
-
-        // 3. Aggregate Stats
-        let movieCount = 0;
-        const seriesIds = new Set<string>();
-        const genreCounts: Record<string, number> = {};
-        let totalTicks = 0;
-
-        for (const item of history) {
-            // Count Type
-            if (item.Type === 'Movie') movieCount++;
-            if (item.Type === 'Episode' && item.SeriesId) {
-                seriesIds.add(item.SeriesId);
-                // Also track genre for episodes if available, 
-                // but usually episodes inherit genres from series. 
-                // Jellyfin API `Episode` item might contain Genres if requested.
-            }
+        const cacheKey = `stats:history:${jellyfinUserId}`;
+        let historyStats = CacheService.get<HistoryStats>('api', cacheKey);
+
+        if (!historyStats) {
+            // Request a high limit to get accurate stats
+            // Only the aggregated fields are requested; skipping Overview/UserData keeps the 2000-item payload small
+            const history = await jellyfinService.getUserHistory(jellyfinUserId, accessToken, 2000, jellyfinServer, 'Genres,RunTimeTicks,SeriesId');
+
+            // 3. Aggregate Stats
+            let movieCount = 0;
+            const seriesIds = new Set<string>();
+            const genreCounts: Record<string, number> = {};
+            let totalTicks = 0;
+
+            for (const item of history) {
+                // Count Type
+                if (item.Type === 'Movie') movieCount++;
+                if (item.Type === 'Episode' && item.SeriesId) {
+                    seriesIds.add(item.SeriesId);
+                    // Also track genre for episodes if available, 
+                    // but usually episodes inherit genres from series. 
+                    // Jellyfin API `Episode` item might contain Genres if requested.
+                }
 
-            // Count Genres
-            if (item.Genres && Array.isArray(item.Genres)) {
-                for (const g of item.Genres) {
-                    if (g) {
-                        genreCounts[g] = (genreCounts[g] || 0) + 1;
+                // Count Genres
+                if (item.Genres && Array.isArray(item.Genres)) {
+                    for (const g of item.Genres) {
+                        if (g) {
+                            genreCounts[g] = (genreCounts[g] || 0) + 1;
+                        }
                     }
                 }
-            }
 
-            // Sum Duration
-            if (item.RunTimeTicks) {
-                totalTicks += item.RunTimeTicks;
+                // Sum Duration
+                if (item.RunTimeTicks) {
+                    totalTicks += item.RunTimeTicks;
+                }
             }
-        }
-
-        const seriesCount = seriesIds.size;
 
-        // Convert Ticks to Hours
-        // 1 tick = 100 nanoseconds => 10,000,000 ticks = 1 second
-        const totalSeconds = totalTicks / 10000000;
-        const totalHours = Math.round(totalSeconds / 3600);
+            // Convert Ticks to Hours
+            // 1 tick = 100 nanoseconds => 10,000,000 ticks = 1 second
+            const totalSeconds = totalTicks / 10000000;
 
-        // Format Genre Data for Recharts (Array of objects)
-        // Sort by count desc and take top 8
-        const genreData = Object.entries(genreCounts)
-            .map(([name, value]) => ({ name, value }))
-            .sort((a, b) => b.value - a.value)
-            .slice(0, 8);
+            historyStats = {
+                movies: movieCount,
+                series: seriesIds.size,
+                totalHours: Math.round(totalSeconds / 3600),
+                // Format Genre Data for Recharts (Array of objects)
+                // Sort by count desc and take top 8
+                genres: Object.entries(genreCounts)
+                    .map(([name, value]) => ({ name, value }))
+                    .sort((a, b) => b.value - a.value)
+                    .slice(0, 8),
+            };
+            // An empty history is usually a failed Jellyfin fetch; don't pin zeroed stats for the TTL
+            if (history.length > 0) {
+                CacheService.set('api', cacheKey, historyStats, HISTORY_STATS_TTL_SECONDS);
+            }
+        }
 
         res.json({
             stats: {
-                movies: movieCount,
-                series: seriesCount,
+                movies: historyStats.movies,
+                series: historyStats.series,
                 blocked: blockedCount,
-                totalHours: totalHours
+                totalHours: historyStats.totalHours
             },
-            genres: genreData
+            genres: historyStats.genres
         });
 
     } catch (error) {
@@ -128,23 +148,23 @@ router.get('/profile', async (req, res) => {
         // Fetch User History (limit to recent 50 items for profile generation to save context)
         // We filter by specific type if possible, or just fetch all and filter locally
         const jellyfinUserId = req.user.jellyfinUserId || '';
-        const history = await jellyfinService.getUserHistory(jellyfinUserId, accessToken, 100, jellyfinServer);
-
-        // Filter and Map to MediaItemInput
-        const validItems = history
-            .filter(item => {
-                if (type === 'movie') return item.Type === 'Movie';
-                if (type === 'tv' || type === 'series') return item.Type === 'Series' || (item.Type === 'Episode' && item.SeriesName);
-                return false;
-            })
-            .map(item => ({
-                title: item.SeriesName || item.Name, // Use SeriesName for episodes if available
-                releaseYear: item.ProductionYear,
-                mediaType: type === 'tv' || type === 'series' ? 'tv' : 'movie'
-            }));
-
-        // Deduplicate by title
-        const uniqueItems = Array.from(new Map(validItems.map(item => [item.title, item])).values());
+        const history = await jellyfinService.getUserHistory(jellyfinUserId, accessToken, 100, jellyfinServer, 'ProductionYear,SeriesName');
+
+        // Filter, map and deduplicate by title in one pass (episodes repeat their series title)
+        const isTv = type === 'tv' || type === 'series';
+        const seenTitles = new Set<string>();
+        const uniqueItems: { title: string; releaseYear: number | undefined; mediaType: string }[] = [];
+        for (const item of history) {
+            const matchesType = type === 'movie'
+                ? item.Type === 'Movie'
+                : isTv && (item.Type === 'Series' || (item.Type === 'Episode' && !!item.SeriesName));
+            if (!matchesType) continue;
+
+            const title = item.SeriesName || item.Name; // Use SeriesName for episodes if available
+            if (seenTitles.has(title)) continue;
+            seenTitles.add(title);
+            uniqueItems.push({ title, releaseYear: item.ProductionYear, mediaType: isTv ? 'tv' : 'movie' });
+        }
 
         if (uniqueItems.length === 0) {
             return res.json({ profile: `No watched ${type} history found to analyze.` });
@@ -7,6 +7,7 @@ import { sanitizeUrl } from '../utils/ssrf-protection';
 import { validateJellyfinSync } from '../middleware/validators';
 import { authMiddleware } from '../middleware/auth';
 import { JellyfinAuthError } from '../jellyfin';
+import { syncHistory } from '../services/sync';
 
 const router = Router();
 router.use(authMiddleware);
@@ -29,7 +30,6 @@ router.post('/jellyfin', validateJellyfinSync, async (req: Request, res: Respons
         const jellyfinUserId = req.user.jellyfinUserId || '';
         console.log(`[API] Starting Jellyfin sync for user: ${req.user.username}`);
 
-        const { syncHistory } = await import('../services/sync');
         const result = await syncHistory(jellyfinUserId, req.user.username, accessToken, jellyfinUrl);
 
         console.log(`[API] Sync complete: ${result.new} new, ${result.skipped} skipped, ${result.failed} failed`);
@@ -7,6 +7,7 @@ import axios from 'axios';
 import { GoogleGenAI } from '@google/genai';
 import ConfigService from '../services/config';
 import { sanitizeUrl, validateRequestUrl, validateSafeUrl, validateExternalUrl } from '../utils/ssrf-protection';
+import { httpAgent, httpsAgent, withBackoff } from '../utils/http';
 import { validateConfigUpdate } from '../middleware/validators';
 import { authMiddleware, requireAdmin } from '../middleware/auth';
 import prisma from '../db';
@@ -54,6 +55,65 @@ async function bootstrapOrAdmin(req: Request, res: Response, next: NextFunction)
 // Image Proxy
 // ---------------------------------------------------------------------------
 
+// Bounded in-memory LRU of proxied image bytes. Cards re-render often and the
+// same posters are requested by every user, so repeat hits skip the upstream fetch.
+// Poster paths are content-addressed upstream, so entries live as long as the browser copy.
+const IMAGE_CACHE_TTL_MS = 24 * 60 * 60 * 1000; // 24 hours
+const IMAGE_CACHE_MAX_ENTRIES = 512;
+const IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024; // 64 MB
+
+interface CachedImage {
+    data: Buffer;
+    contentType: string;
+    expiresAt: number;
+}
+
+const imageCache = new Map<string, CachedImage>();
+// Upstream fetches in progress, so a cold grid asking for the same poster twice downloads it once
+const inflightImages = new Map<string, Promise<{ data: Buffer; contentType: string }>>();
+let imageCacheBytes = 0;
+
+function deleteCachedImage(url: string): void {
+    const entry = imageCache.get(url);
+    if (!entry) return;
+    imageCacheBytes -= entry.data.length;
+    imageCache.delete(url);
+}
+
+function getCachedImage(url: string): CachedImage | undefined {
+    const entry = imageCache.get(url);
+    if (!entry) return undefined;
+    if (entry.expiresAt <= Date.now()) {
+        deleteCachedImage(url);
+        return undefined;
+    }
+    // Re-insert to mark as most recently used
+    imageCache.delete(url);
+    imageCache.set(url, entry);
+    return entry;
+}
+
+function setCachedImage(url: string, data: Buffer, contentType: string): void {
+    if (data.length > IMAGE_CACHE_MAX_BYTES) return;
+    deleteCachedImage(url);
+    imageCache.set(url, { data, contentType, expiresAt: Date.now() + IMAGE_CACHE_TTL_MS });
+    imageCacheBytes += data.length;
+    // Evict least recently used entries until both bounds hold
+    for (const oldest of imageCache.keys()) {
+        if (imageCache.size <= IMAGE_CACHE_MAX_ENTRIES && imageCacheBytes <= IMAGE_CACHE_MAX_BYTES) break;
+        deleteCachedImage(oldest);
+    }
+}
+
+// One client for every proxied poster/backdrop; the pooled agents are passed explicitly so its
+// keep-alive reuse doesn't depend on configureHttpAgents() having run before this module loaded
+const imageClient = axios.create({
+    responseType: 'arraybuffer',
+    timeout: 10000,
+    httpAgent,
+    httpsAgent,
+});
+
 /**
  * GET /image  (mounted by api.ts at /proxy → canonical path: /api/proxy/image)
  * Routes images through the backend to avoid 403s from Jellyseerr.
@@ -114,6 +174,13 @@ proxyRouter.get('/image', async (req, res) => {
             imageUrl = validateRequestUrl(`${jellyseerrUrl}${upstreamPrefix}${imagePath}`);
         }
 
+        const cached = getCachedImage(imageUrl);
+        if (cached) {
+            res.setHeader('Content-Type', cached.contentType);
+            res.setHeader('Cache-Control', 'public, max-age=86400');
+            return res.send(cached.data);
+        }
+
         const headers: Record<string, string> = {};
         if (config.jellyseerrApiKey) {
             headers['X-Api-Key'] = config.jellyseerrApiKey;
@@ -126,16 +193,31 @@ proxyRouter.get('/image', async (req, res) => {
         // (2) relative paths are constructed solely from the admin-configured base URL;
         // (3) validateSafeUrl() performs a final sync protocol + blocklist check.
         // CodeQL cannot statically trace our custom sanitizers — see SECURITY.md for full analysis.
-        const response = await axios.get(validateSafeUrl(imageUrl), { // lgtm[js/request-forgery] codeql[js/request-forgery]
-            responseType: 'arraybuffer',
-            headers,
-            timeout: 10000,
-        });
+        const safeImageUrl = validateSafeUrl(imageUrl);
+        let pending = inflightImages.get(imageUrl);
+        if (!pending) {
+            pending = (async () => {
+                // A card grid fires dozens of these at once; retry a 429/5xx from the upstream briefly
+                // instead of leaving a broken poster behind (network errors are not retried)
+                const response = await withBackoff( // lgtm[js/request-forgery] codeql[js/request-forgery]
+                    () => imageClient.get(safeImageUrl, { headers }),
+                    { retries: 2, baseDelayMs: 200, maxDelayMs: 1000 }
+                );
+                const type = String(response.headers['content-type'] || 'image/jpeg');
+                // axios already hands back a Buffer for arraybuffer responses in Node; avoid copying it
+                const bytes = Buffer.isBuffer(response.data) ? response.data : Buffer.from(response.data);
+                if (type.startsWith('image/')) {
+                    setCachedImage(imageUrl, bytes, type);
+                }
+                return { data: bytes, contentType: type };
+            })().finally(() => inflightImages.delete(imageUrl));
+            inflightImages.set(imageUrl, pending);
+        }
 
-        const contentType = response.headers['content-type'] || 'image/jpeg';
+        const { data, contentType } = await pending;
         res.setHeader('Content-Type', contentType);
         res.setHeader('Cache-Control', 'public, max-age=86400');
-        res.send(response.data);
+        res.send(data);
     } catch (error: any) {
         console.error('Image proxy error:', error?.message || error);
         if (error?.response?.status) {
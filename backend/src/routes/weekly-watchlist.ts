@@ -6,7 +6,7 @@
 import { Router } from 'express';
 import { WeeklyWatchlistService } from '../services/weekly-watchlist';
 import { authMiddleware } from '../middleware/auth';
-import prisma from '../db';
+import { getTrackedIds } from '../services/data';
 
 const router = Router();
 router.use(authMiddleware);
@@ -37,12 +37,9 @@ router.get('/', async (req, res) => {
             });
         }
 
-        // Filter out items the user has already interacted with (watched, watchlist, blocked)
-        const userInteractions = await prisma.userMedia.findMany({
-            where: { userId: req.user.id },
-            include: { media: { select: { tmdbId: true } } }
-        });
-        const interactedTmdbIds = new Set(userInteractions.map(i => i.media.tmdbId));
+        // Filter out items the user has already interacted with (watched, watchlist, blocked).
+        // The id set comes from the cached per-user snapshot rather than a full userMedia+media read
+        const interactedTmdbIds = await getTrackedIds(req.user.username);
 
         const filteredMovies = (watchlist.movies as { tmdbId: number }[]).filter(
             (m: { tmdbId: number }) => !interactedTmdbIds.has(m.tmdbId)
@@ -125,12 +125,12 @@ export class AdvocateService {
 
         console.log(`[Advocate] Found ${candidates.length} redemption candidates`);
 
-        // Update redemption attempts
-        for (const candidate of candidates) {
+        // Update redemption attempts in a single write for all picked candidates
+        if (candidates.length > 0) {
             await prisma.userMedia.updateMany({
                 where: {
                     userId,
-                    mediaId: candidate.media.id
+                    mediaId: { in: candidates.map(c => c.media.id) }
                 },
                 data: {
                     redemptionAttempts: {
@@ -6,6 +6,7 @@
 import prisma from '../db';
 import { getMediaDetails } from './jellyseerr';
 import type { Enriched } from './jellyseerr';
+import { logger } from '../utils/logger';
 
 export interface AnchorItem {
     id: number;
@@ -126,6 +127,10 @@ export async function getAnchorItems(
     let animationCount = 0;
     const MAX_ANIMATION = 4; // Max 4 animated items out of 10 anchors
 
+    // Filter terms are the same for every candidate; lowercase them once rather than per item
+    const genreFiltersLower = genreFilters.map(g => g.toLowerCase());
+    const moodKeywordsLower = mood && MOOD_KEYWORDS[mood] ? MOOD_KEYWORDS[mood].map(mk => mk.toLowerCase()) : null;
+
     for (const um of combined) {
         if (anchors.length >= limit) break;
 
@@ -141,9 +146,8 @@ export async function getAnchorItems(
             if (similarIds.length === 0 && recommendationIds.length === 0) continue;
 
             // Filter by genre if specified
-            if (genreFilters.length > 0) {
-                const hasMatchingGenre = genreFilters.some(selectedGenre => {
-                    const selectedLower = selectedGenre.toLowerCase();
+            if (genreFiltersLower.length > 0) {
+                const hasMatchingGenre = genreFiltersLower.some(selectedLower => {
                     return genres.some((g: string) => {
                         const genreLower = g.toLowerCase();
                         return genreLower.includes(selectedLower) || selectedLower.includes(genreLower);
@@ -153,16 +157,15 @@ export async function getAnchorItems(
             }
 
             // Filter by mood keywords if specified
-            if (mood && MOOD_KEYWORDS[mood]) {
-                const moodKeywords = MOOD_KEYWORDS[mood];
+            if (moodKeywordsLower) {
                 const keywordsLower = keywords.map((k: string) => k.toLowerCase());
-                const hasMatchingKeyword = moodKeywords.some(mk =>
-                    keywordsLower.some((k: string) => k.includes(mk.toLowerCase()) || mk.toLowerCase().includes(k))
+                const hasMatchingKeyword = moodKeywordsLower.some(mk =>
+                    keywordsLower.some((k: string) => k.includes(mk) || mk.includes(k))
                 );
                 if (!hasMatchingKeyword) {
                     // Don't strictly filter, but deprioritize - only skip if we have enough anchors
                     if (anchors.length >= limit * 0.5) {
-                        console.debug(`[Anchor] MOOD SKIP: "${media.title}" - keywords [${keywords.slice(0, 3).join(', ')}] don't match mood "${mood}"`);
+                        logger.debug({ title: media.title, keywords: keywords.slice(0, 3), mood }, '[Anchor] MOOD SKIP: keywords don\'t match mood');
                         continue;
                     }
                 }
@@ -171,7 +174,7 @@ export async function getAnchorItems(
             // Animation limiter only - prevent all-anime anchor sets
             const isAnimation = genres.some((g: string) => g.toLowerCase().includes('animation'));
             if (isAnimation && animationCount >= MAX_ANIMATION) {
-                console.debug(`[Anchor] DIVERSIFY SKIP: "${media.title}" - already have ${MAX_ANIMATION} Animation anchors`);
+                logger.debug({ title: media.title, maxAnimation: MAX_ANIMATION }, '[Anchor] DIVERSIFY SKIP: animation anchor limit reached');
                 continue;
             }
             if (isAnimation) {
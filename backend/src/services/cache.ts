@@ -124,6 +124,18 @@ class PersistentCacheStore {
     }
   }
 
+  // get/set run for every cache lookup; compile each SQL statement once and reuse it
+  private readonly statements = new Map<string, Database.Statement>();
+
+  private stmt(sql: string): Database.Statement {
+    let statement = this.statements.get(sql);
+    if (!statement) {
+      statement = this.db!.prepare(sql);
+      this.statements.set(sql, statement);
+    }
+    return statement;
+  }
+
   private supports(namespace: CacheNamespace): boolean {
     return this.enabled && this.db !== null && PERSISTENT_NAMESPACES.has(namespace);
   }
@@ -135,7 +147,7 @@ class PersistentCacheStore {
 
     this.lastCleanupAt = now;
     try {
-      this.db.prepare('DELETE FROM persistent_cache WHERE expires_at <= ?').run(now);
+      this.stmt('DELETE FROM persistent_cache WHERE expires_at <= ?').run(now);
     } catch (error) {
       console.warn('[Cache] Failed to cleanup expired persistent entries:', error);
     }
@@ -147,7 +159,7 @@ class PersistentCacheStore {
 
     try {
       const now = Date.now();
-      const row = this.db!.prepare(
+      const row = this.stmt(
         `SELECT value, expires_at
          FROM persistent_cache
          WHERE namespace = ? AND key = ?`
@@ -178,7 +190,7 @@ class PersistentCacheStore {
       const now = Date.now();
       const expiresAt = now + Math.max(1, ttlSeconds) * 1000;
       const serialized = JSON.stringify(value);
-      this.db!.prepare(
+      this.stmt(
         `INSERT INTO persistent_cache(namespace, key, value, expires_at, updated_at)
          VALUES (?, ?, ?, ?, ?)
          ON CONFLICT(namespace, key) DO UPDATE SET
@@ -196,7 +208,7 @@ class PersistentCacheStore {
     this.cleanupExpiredIfNeeded();
     try {
       const now = Date.now();
-      const row = this.db!.prepare(
+      const row = this.stmt(
         `SELECT 1
          FROM persistent_cache
          WHERE namespace = ? AND key = ? AND expires_at > ?
@@ -211,7 +223,7 @@ class PersistentCacheStore {
   del(namespace: CacheNamespace, key: string): number {
     if (!this.supports(namespace)) return 0;
     try {
-      const info = this.db!.prepare(
+      const info = this.stmt(
         `DELETE FROM persistent_cache
          WHERE namespace = ? AND key = ?`
       ).run(namespace, key);
@@ -224,7 +236,7 @@ class PersistentCacheStore {
   clearNamespace(namespace: CacheNamespace): number {
     if (!this.supports(namespace)) return 0;
     try {
-      const info = this.db!.prepare(
+      const info = this.stmt(
         `DELETE FROM persistent_cache
          WHERE namespace = ?`
       ).run(namespace);
@@ -237,7 +249,7 @@ class PersistentCacheStore {
   clearAll(): number {
     if (!this.enabled || !this.db) return 0;
     try {
-      const info = this.db.prepare('DELETE FROM persistent_cache').run();
+      const info = this.stmt('DELETE FROM persistent_cache').run();
       return Number(info.changes || 0);
     } catch {
       return 0;
@@ -249,7 +261,7 @@ class PersistentCacheStore {
     this.cleanupExpiredIfNeeded();
     try {
       const now = Date.now();
-      const row = this.db.prepare('SELECT COUNT(*) AS count FROM persistent_cache WHERE expires_at > ?').get(now) as { count: number };
+      const row = this.stmt('SELECT COUNT(*) AS count FROM persistent_cache WHERE expires_at > ?').get(now) as { count: number };
       return Number(row?.count || 0);
     } catch {
       return 0;
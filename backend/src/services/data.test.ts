@@ -0,0 +1,96 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const prismaMock = vi.hoisted(() => ({
+  userMedia: { findFirst: vi.fn(), findMany: vi.fn(), upsert: vi.fn() },
+  media: { upsert: vi.fn(), update: vi.fn() },
+  user: { findUnique: vi.fn(), upsert: vi.fn() },
+}));
+
+vi.mock('../db', () => ({ default: prismaMock }));
+vi.mock('../generated/prisma/client', () => ({ MediaStatus: { WATCHED: 'WATCHED', WATCHLIST: 'WATCHLIST', BLOCKED: 'BLOCKED' } }));
+vi.mock('./jellyseerr', () => ({ getMediaDetails: vi.fn().mockResolvedValue(null) }));
+vi.mock('./image', () => ({
+  ImageService: { imageExists: vi.fn().mockReturnValue(false), getLocalPath: vi.fn(), downloadMediaImages: vi.fn() },
+}));
+vi.mock('./enrichment', () => ({ enrichMedia: vi.fn().mockResolvedValue(undefined) }));
+
+import { updateMediaStatus, getFullWatchlist, invalidateUserData, invalidateWatchlists } from './data';
+
+const item = { tmdbId: 550, title: 'Fight Club', mediaType: 'movie', posterUrl: '/images/movie_550_poster.jpg' };
+
+describe('updateMediaStatus', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    prismaMock.user.findUnique.mockResolvedValue({ id: 1 });
+    prismaMock.media.upsert.mockResolvedValue({ id: 10, posterUrl: item.posterUrl });
+    prismaMock.userMedia.upsert.mockResolvedValue({ id: 100, userId: 1, mediaId: 10, status: 'WATCHED' });
+  });
+
+  it('skips the media upsert when a user action repeats a complete, unchanged status', async () => {
+    const existing = { id: 100, status: 'WATCHED', media: { title: 'Fight Club', posterUrl: item.posterUrl } };
+    prismaMock.userMedia.findFirst.mockResolvedValue(existing);
+
+    const result = await updateMediaStatus('alice', item, 'WATCHED');
+
+    expect(result).toBe(existing);
+    expect(prismaMock.media.upsert).not.toHaveBeenCalled();
+    expect(prismaMock.userMedia.upsert).not.toHaveBeenCalled();
+  });
+
+  it('still syncs the media row when the stored row has no poster', async () => {
+    prismaMock.userMedia.findFirst.mockResolvedValue({ id: 100, status: 'WATCHED', media: { title: 'Fight Club', posterUrl: null } });
+
+    await updateMediaStatus('alice', item, 'WATCHED');
+
+    expect(prismaMock.media.upsert).toHaveBeenCalledWith(expect.objectContaining({
+      where: { tmdbId: 550 },
+      update: expect.objectContaining({ posterUrl: item.posterUrl }),
+    }));
+    expect(prismaMock.userMedia.upsert).toHaveBeenCalled();
+  });
+
+  it('does not run the status lookup for bulk callers that pass a userId', async () => {
+    await updateMediaStatus('alice', item, 'WATCHED', undefined, 1);
+
+    expect(prismaMock.userMedia.findFirst).not.toHaveBeenCalled();
+    expect(prismaMock.user.findUnique).not.toHaveBeenCalled();
+    expect(prismaMock.media.upsert).toHaveBeenCalled();
+    expect(prismaMock.userMedia.upsert).toHaveBeenCalledWith(expect.objectContaining({
+      where: { userId_mediaId: { userId: 1, mediaId: 10 } },
+    }));
+  });
+});
+
+describe('getFullWatchlist cache', () => {
+  const row = (title: string) => ({ status: 'WATCHLIST', media: { tmdbId: 550, title, mediaType: 'movie' } });
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    invalidateUserData('bob');
+    prismaMock.user.findUnique.mockResolvedValue({ id: 2 });
+  });
+
+  it('does not store a load that was in flight when the user data was invalidated', async () => {
+    let release!: (rows: unknown[]) => void;
+    prismaMock.userMedia.findMany.mockReturnValueOnce(new Promise(resolve => { release = resolve; }));
+
+    const pending = getFullWatchlist('bob');
+    await vi.waitFor(() => expect(prismaMock.userMedia.findMany).toHaveBeenCalled());
+    invalidateUserData('bob');
+    release([row('Stale')]);
+    expect((await pending)[0].title).toBe('Stale');
+
+    prismaMock.userMedia.findMany.mockResolvedValueOnce([row('Fresh')]);
+    expect((await getFullWatchlist('bob'))[0].title).toBe('Fresh');
+  });
+
+  it('reloads after a shared media row is rewritten', async () => {
+    prismaMock.userMedia.findMany.mockResolvedValueOnce([row('Before')]);
+    await getFullWatchlist('bob');
+    expect((await getFullWatchlist('bob'))[0].title).toBe('Before');
+
+    invalidateWatchlists();
+    prismaMock.userMedia.findMany.mockResolvedValueOnce([row('After')]);
+    expect((await getFullWatchlist('bob'))[0].title).toBe('After');
+  });
+});
@@ -1,9 +1,10 @@
 import { MediaStatus } from '../generated/prisma/client';
-import { search as jellySearch } from './jellyseerr';
+import { getMediaDetails } from './jellyseerr';
 import { ImageService } from './image';
 import { MediaItem, MediaUpdateData, MediaCreateData, MediaItemInput } from '../types';
 import prisma from '../db';
 import { enrichMedia } from './enrichment';
+import { logger } from '../utils/logger';
 
 // Bounded concurrency queue for background enrichment.
 // Prevents thousands of concurrent Jellyseerr requests and SQLite write conflicts
@@ -64,6 +65,16 @@ export async function syncMediaItem(item: MediaItemInput) {
   const voteAverage = item?.voteAverage ?? item?.vote_average ?? item?.rating ?? null;
   const language = item?.language ?? item?.originalLanguage ?? null;
 
+  // If a remote image was already downloaded, store the local path straight away.
+  // Otherwise every re-sync flips posterUrl to the remote URL and the background
+  // task has to write it back again.
+  const isRemoteImage = (url: string | null | undefined): url is string =>
+    !!url && (url.startsWith('http') || url.startsWith('/api/proxy'));
+  const localPoster = isRemoteImage(posterUrl) && ImageService.imageExists(tmdbId, validType, 'poster')
+    ? ImageService.getLocalPath(tmdbId, validType, 'poster') : null;
+  const localBackdrop = isRemoteImage(backdropUrl) && ImageService.imageExists(tmdbId, validType, 'backdrop')
+    ? ImageService.getLocalPath(tmdbId, validType, 'backdrop') : null;
+
   // Build update payload but avoid overwriting existing posterUrl with null/undefined
   const updateData: any = {
     title: validTitle,
@@ -71,13 +82,13 @@ export async function syncMediaItem(item: MediaItemInput) {
   };
   if (validYear) updateData.releaseYear = validYear;
   if (posterUrl) {
-    updateData.posterUrl = posterUrl;
+    updateData.posterUrl = localPoster ?? posterUrl;
     updateData.posterSourceUrl = posterUrl; // Save original URL as source
   }
   // Persist rich metadata when provided to allow backfilling
   if (overview !== null && overview !== undefined && overview !== '') updateData.overview = overview;
   if (backdropUrl) {
-    updateData.backdropUrl = backdropUrl;
+    updateData.backdropUrl = localBackdrop ?? backdropUrl;
     updateData.backdropSourceUrl = backdropUrl; // Save original URL as source
   }
   if (voteAverage !== null && voteAverage !== undefined) updateData.voteAverage = Number(voteAverage);
@@ -87,11 +98,11 @@ export async function syncMediaItem(item: MediaItemInput) {
     tmdbId,
     title: validTitle,
     mediaType: validType,
-    posterUrl,
+    posterUrl: localPoster ?? posterUrl,
     posterSourceUrl: posterUrl, // Save original URL as source
     releaseYear: validYear,
     overview: overview ?? null,
-    backdropUrl: backdropUrl ?? null,
+    backdropUrl: localBackdrop ?? backdropUrl ?? null,
     backdropSourceUrl: backdropUrl, // Save original URL as source
     voteAverage: voteAverage !== null && voteAverage !== undefined ? Number(voteAverage) : null,
     language,
@@ -115,11 +126,16 @@ export async function syncMediaItem(item: MediaItemInput) {
 
     // 1. Download remote images to local paths
     try {
-      const needsPosterDownload = posterUrl && (posterUrl.startsWith('http') || posterUrl.startsWith('/api/proxy'));
-      const needsBackdropDownload = backdropUrl && (backdropUrl.startsWith('http') || backdropUrl.startsWith('/api/proxy'));
+      const needsPosterDownload = isRemoteImage(posterUrl) && !localPoster;
+      const needsBackdropDownload = isRemoteImage(backdropUrl) && !localBackdrop;
 
       if (needsPosterDownload || needsBackdropDownload) {
-        const localImages = await ImageService.downloadMediaImages(tmdbId, validType, posterUrl, backdropUrl);
+        const localImages = await ImageService.downloadMediaImages(
+          tmdbId,
+          validType,
+          needsPosterDownload ? posterUrl : null,
+          needsBackdropDownload ? backdropUrl : null,
+        );
         if (localImages.posterUrl && localImages.posterUrl !== posterUrl) {
           updates.posterUrl = localImages.posterUrl;
           console.log(`[syncMediaItem] Updating posterUrl: ${posterUrl} -> ${localImages.posterUrl}`);
@@ -140,19 +156,19 @@ export async function syncMediaItem(item: MediaItemInput) {
         const incomingPoster = item?.posterUrl ?? item?.poster_url ?? item?.poster_path ?? null;
         if (incomingPoster) {
           updates.posterUrl = incomingPoster;
-        } else if (item?.title) {
+        } else {
+          // tmdbId is already known: one cached details lookup instead of a fuzzy title search
           try {
-            const candidates = await jellySearch(validTitle);
-            if (Array.isArray(candidates) && candidates.length > 0) {
-              const first = candidates.find(c => c.tmdb_id && Number(c.tmdb_id) === tmdbId) || candidates[0];
-              if (first.posterUrl) updates.posterUrl = first.posterUrl;
-              if (first.overview && !('overview' in updates)) updates.overview = first.overview;
-              if (first.backdropUrl && !('backdropUrl' in updates)) updates.backdropUrl = first.backdropUrl;
-              if (first.voteAverage != null && !('voteAverage' in updates)) updates.voteAverage = Number(first.voteAverage);
-              if (first.language && !('language' in updates)) updates.language = String(first.language);
+            const details = await getMediaDetails(tmdbId, validType);
+            if (details) {
+              if (details.posterUrl) updates.posterUrl = details.posterUrl;
+              if (details.overview && !('overview' in updates)) updates.overview = details.overview;
+              if (details.backdropUrl && !('backdropUrl' in updates)) updates.backdropUrl = details.backdropUrl;
+              if (details.voteAverage != null && !('voteAverage' in updates)) updates.voteAverage = Number(details.voteAverage);
+              if (details.language && !('language' in updates)) updates.language = String(details.language);
             }
           } catch (inner) {
-            console.warn('Jellyseerr search failed during poster backfill for', validTitle, inner);
+            console.warn('Jellyseerr details lookup failed during poster backfill for', tmdbId, inner);
           }
         }
       }
@@ -163,6 +179,7 @@ export async function syncMediaItem(item: MediaItemInput) {
     // Single consolidated write — replaces up to 4 separate update() calls per item
     if (Object.keys(updates).length > 0) {
       await prisma.media.update({ where: { id: mediaId }, data: updates });
+      invalidateWatchlists();
       console.log(`[syncMediaItem] Backfill update applied for tmdbId ${tmdbId} (${Object.keys(updates).join(', ')})`);
     }
   });
@@ -170,33 +187,58 @@ export async function syncMediaItem(item: MediaItemInput) {
   return media;
 }
 
-export async function updateMediaStatus(username: string, item: MediaItemInput, status: MediaStatus | string, accessToken?: string) {
+/**
+ * Resolve the user row for `username`, creating it on first use.
+ * Existing users cost a single indexed read instead of an upsert write.
+ */
+export async function ensureUser(username: string): Promise<{ id: number }> {
+  const existing = await prisma.user.findUnique({ where: { username }, select: { id: true } });
+  if (existing) return existing;
+  return prisma.user.upsert({ where: { username }, create: { username }, update: {}, select: { id: true } });
+}
+
+/**
+ * Set a user's status for a media item, creating the user/media rows as needed.
+ * Bulk callers (sync, import) pass `userId` after resolving the user once, so each
+ * item skips the user lookup — one fewer query per item.
+ */
+export async function updateMediaStatus(username: string, item: MediaItemInput, status: MediaStatus | string, accessToken?: string, userId?: number) {
   // Do not log full item or access token here to avoid leaking user tokens or PII.
 
   if (!username) throw new Error('username required');
   const tmdbId = parseTmdbId(item);
   if (!tmdbId) throw new Error('tmdbId is required to update status');
 
-  const user = await prisma.user.upsert({
-    where: { username },
-    create: { username },
-    update: {},
-  });
+  const statusVal = (typeof status === 'string' ? (status as string).toUpperCase() : status) as MediaStatus;
 
-  const media = await syncMediaItem(item);
+  // No-op guard for single user actions: a repeated click skips the media upsert, image
+  // backfill and enrichment. Bulk callers (sync, import) pass `userId` and have already
+  // filtered out tracked items, so for them the lookup would only add a query per item.
+  // Rows still missing a title or poster fall through so a later save can fill them in.
+  if (userId === undefined) {
+    const existing = await prisma.userMedia.findFirst({
+      where: { status: statusVal, user: { username }, media: { tmdbId } },
+      include: { media: { select: { title: true, posterUrl: true } } },
+    });
+    if (existing && existing.media.title && existing.media.posterUrl) {
+      logger.debug({ user: username, tmdbId, status: statusVal }, '[DB Save] Already in this status; skipping');
+      return existing;
+    }
+  }
 
-  const statusVal = (typeof status === 'string' ? (status as string).toUpperCase() : status) as MediaStatus;
+  const resolvedUserId = userId ?? (await ensureUser(username)).id;
+
+  const media = await syncMediaItem(item);
 
   // Minimal debug: log the user and tmdb id and intended status (no tokens or payloads)
-  try {
-    console.debug(`[DB Save] user=${username} tmdb=${tmdbId} status=${statusVal}`);
-  } catch { }
+  logger.debug({ user: username, tmdbId, status: statusVal }, '[DB Save] Saving status');
 
   const upserted = await prisma.userMedia.upsert({
-    where: { userId_mediaId: { userId: user.id, mediaId: media.id } },
-    create: { userId: user.id, mediaId: media.id, status: statusVal },
+    where: { userId_mediaId: { userId: resolvedUserId, mediaId: media.id } },
+    create: { userId: resolvedUserId, mediaId: media.id, status: statusVal },
     update: { status: statusVal },
   });
+  invalidateUserData(username);
 
   // Schedule enrichment through bounded queue — max 3 concurrent enrichment tasks.
   // Prevents SQLite lock contention and Jellyseerr request floods during imports.
@@ -209,12 +251,49 @@ export async function updateMediaStatus(username: string, item: MediaItemInput,
   return upserted;
 }
 
-export async function getUserData(username: string) {
+type UserData = { watchedIds: number[]; watchlistIds: number[]; blockedIds: number[] };
+
+// Short-lived per-user snapshot of status ids. Search, recommendations and sync
+// read this on nearly every request; every status write calls invalidateUserData().
+const USER_DATA_TTL_MS = 60 * 1000;
+const userDataCache = new Map<string, { data: UserData; expiresAt: number }>();
+
+type WatchlistEntry = Awaited<ReturnType<typeof loadFullWatchlist>>[number];
+
+// The full watchlist is read by both /user/watchlist and every recommendation run;
+// it shares the snapshot's TTL and invalidation so a write is visible immediately.
+const watchlistCache = new Map<string, { data: WatchlistEntry[]; expiresAt: number }>();
+
+// Bumped on every invalidation. A load that was already in flight when a write
+// landed must not store its (now stale) result after the invalidation.
+let cacheGeneration = 0;
+
+export function invalidateUserData(username: string): void {
+  cacheGeneration++;
+  userDataCache.delete(username);
+  watchlistCache.delete(username);
+}
+
+/**
+ * Drop every cached watchlist. Media rows are shared between users, so enrichment
+ * and backfill writes call this instead of tracking which users hold the row.
+ */
+export function invalidateWatchlists(): void {
+  cacheGeneration++;
+  watchlistCache.clear();
+}
+
+export async function getUserData(username: string): Promise<UserData> {
   if (!username) return { watchedIds: [], watchlistIds: [], blockedIds: [] };
 
+  const cached = userDataCache.get(username);
+  if (cached && cached.expiresAt > Date.now()) return cached.data;
+  const generation = cacheGeneration;
+
+  // Only status + tmdbId are needed; avoid hydrating every full media row
   const user = await prisma.user.findUnique({
     where: { username },
-    include: { userMedia: { include: { media: true } } },
+    select: { userMedia: { select: { status: true, media: { select: { tmdbId: true } } } } },
   });
 
   if (!user) return { watchedIds: [], watchlistIds: [], blockedIds: [] };
@@ -231,12 +310,44 @@ export async function getUserData(username: string) {
     else if (um.status === 'BLOCKED') blockedIds.push(tmdb);
   }
 
-  return { watchedIds, watchlistIds, blockedIds };
+  const data = { watchedIds, watchlistIds, blockedIds };
+  if (generation === cacheGeneration) {
+    userDataCache.set(username, { data, expiresAt: Date.now() + USER_DATA_TTL_MS });
+  }
+  return data;
+}
+
+const trackedIdsBySnapshot = new WeakMap<UserData, ReadonlySet<number>>();
+
+/**
+ * Every TMDB id the user has any status for (watched, watchlist or blocked).
+ * Built once per cached snapshot, so callers don't each merge the three lists.
+ */
+export async function getTrackedIds(username: string): Promise<ReadonlySet<number>> {
+  const data = await getUserData(username);
+  let tracked = trackedIdsBySnapshot.get(data);
+  if (!tracked) {
+    tracked = new Set([...data.watchedIds, ...data.watchlistIds, ...data.blockedIds]);
+    trackedIdsBySnapshot.set(data, tracked);
+  }
+  return tracked;
 }
 
-export async function getFullWatchlist(username: string) {
+export async function getFullWatchlist(username: string): Promise<WatchlistEntry[]> {
   if (!username) return [];
 
+  const cached = watchlistCache.get(username);
+  if (cached && cached.expiresAt > Date.now()) return cached.data;
+
+  const generation = cacheGeneration;
+  const data = await loadFullWatchlist(username);
+  if (generation === cacheGeneration) {
+    watchlistCache.set(username, { data, expiresAt: Date.now() + USER_DATA_TTL_MS });
+  }
+  return data;
+}
+
+async function loadFullWatchlist(username: string) {
   const user = await prisma.user.findUnique({ where: { username } });
   if (!user) return [];
 
@@ -278,7 +389,10 @@ export async function removeFromWatchlist(username: string, item: MediaItemInput
       },
     });
     // result.count contains number of deleted records
-    if (result.count && result.count > 0) return true;
+    if (result.count && result.count > 0) {
+      invalidateUserData(username);
+      return true;
+    }
     return false;
   } catch (e) {
     console.warn('Failed to remove watchlist entry', e);
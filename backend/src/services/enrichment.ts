@@ -1,5 +1,8 @@
+import pLimit from 'p-limit';
 import prisma from '../db';
 import { getFullDetails, type FullMediaDetails } from './jellyseerr';
+import { logger } from '../utils/logger';
+import { invalidateWatchlists } from './data';
 
 /**
  * Check if a media item should be enriched
@@ -34,7 +37,7 @@ export async function enrichMedia(mediaId: number): Promise<boolean> {
 
         // Check if enrichment is needed
         if (!shouldEnrich(media)) {
-            console.debug(`[Enrichment] Skipping ${media.title} - already enriched recently`);
+            logger.debug({ title: media.title }, '[Enrichment] Skipping - already enriched recently');
             return true;
         }
 
@@ -60,6 +63,7 @@ export async function enrichMedia(mediaId: number): Promise<boolean> {
                 enrichedAt: new Date(),
             },
         });
+        invalidateWatchlists();
 
         console.info(`[Enrichment] Successfully enriched ${media.title}: ${fullDetails.genres.length} genres, ${fullDetails.keywords.length} keywords, ${fullDetails.topCast.length} cast, ${fullDetails.similar.length} similar, ${fullDetails.recommendations.length} recommendations`);
         return true;
@@ -94,9 +98,12 @@ export async function enrichMediaByTmdbId(tmdbId: number, mediaType: 'movie' | '
     }
 }
 
+// In-flight enrichments during a backfill; each one is a handful of Jellyseerr calls plus a DB update
+const BACKFILL_CONCURRENCY = 5;
+
 /**
  * Background job: Enrich all media items that need enrichment
- * Respects rate limiting with delays between API calls
+ * Respects rate limiting by capping the number of in-flight items
  */
 export async function runEnrichmentBackfill(): Promise<{ total: number; enriched: number; failed: number }> {
     console.info('[Enrichment] Starting backfill job...');
@@ -117,17 +124,16 @@ export async function runEnrichmentBackfill(): Promise<{ total: number; enriched
 
     const result = { total: mediaToEnrich.length, enriched: 0, failed: 0 };
 
-    for (const media of mediaToEnrich) {
+    // Bounded fan-out over the shared keep-alive agent instead of one item at a time plus a 200ms sleep
+    const limit = pLimit(BACKFILL_CONCURRENCY);
+    await Promise.all(mediaToEnrich.map(media => limit(async () => {
         const success = await enrichMedia(media.id);
         if (success) {
             result.enriched++;
         } else {
             result.failed++;
         }
-
-        // Rate limiting: 200ms delay between API calls
-        await new Promise(resolve => setTimeout(resolve, 200));
-    }
+    })));
 
     console.info(`[Enrichment] Backfill complete: ${result.enriched} enriched, ${result.failed} failed`);
     return result;
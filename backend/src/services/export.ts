@@ -25,6 +25,16 @@ interface ExportData {
   };
 }
 
+const EXPORTED_MEDIA_FIELDS = {
+  title: true,
+  tmdbId: true,
+  mediaType: true,
+  releaseYear: true,
+  posterUrl: true,
+  overview: true,
+  voteAverage: true,
+} as const;
+
 /**
  * Export user's database state to legacy JSON format
  */
@@ -48,10 +58,11 @@ export async function exportUserData(username: string): Promise<ExportData> {
     };
   }
 
-  // Fetch all user media records with associated media details
+  // Fetch all user media records with only the media columns the backup carries; the
+  // enrichment JSON (keywords, cast, similar ids) would otherwise be loaded and dropped per row
   const userMediaRecords = await prisma.userMedia.findMany({
     where: { userId: user.id },
-    include: { media: true },
+    select: { status: true, updatedAt: true, media: { select: EXPORTED_MEDIA_FIELDS } },
     orderBy: { updatedAt: 'desc' }
   });
 
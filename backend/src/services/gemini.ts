@@ -2,6 +2,8 @@ import { GoogleGenAI, type GenerateContentConfig } from '@google/genai';
 import OpenAI from 'openai';
 import ConfigService from './config';
 import { MediaItemInput } from '../types';
+import { withBackoff } from '../utils/http';
+import { logger } from '../utils/logger';
 
 // Gemini 2.5+ and 3.0+ models automatically use internal thinking for improved reasoning
 // Thinking dynamically adjusts based on prompt complexity
@@ -19,19 +21,81 @@ export interface AIClientBundle {
   openrouterClient?: OpenAI;
 }
 
+// Shorten free text for prompts; only appends an ellipsis when something was cut
+function truncate(text: string | undefined, max: number): string {
+  if (!text) return '';
+  return text.length <= max ? text : `${text.substring(0, max)}...`;
+}
+
+// One numbered candidate line as used by the ranking and curator prompts
+function formatCandidateLine(
+  c: { tmdbId: number; title: string; genres: string[]; overview?: string; voteAverage?: number },
+  index: number,
+  overviewLength: number,
+  fallbackOverview = ''
+): string {
+  return `${index + 1}. [ID:${c.tmdbId}] "${c.title}" [${c.genres.join(', ')}] ★${c.voteAverage?.toFixed(1) || 'N/A'}\n   ${truncate(c.overview || fallbackOverview, overviewLength)}`;
+}
+
+// Detailed mood descriptions for the ranking prompt, keyed by mood id
+const MOOD_DESCRIPTIONS: Readonly<Record<string, string>> = {
+  'mind-bending': 'MIND-BENDING: Complex plots, twist endings, psychological themes, surreal, nonlinear timelines',
+  'dark': 'DARK & GRITTY: Noir, dystopian, crime, violence, morally ambiguous, intense',
+  'adrenaline': 'ADRENALINE: Action-packed, thrilling, car chases, explosions, heists, high stakes',
+  'chill': 'CHILL & COMFORT: Relaxing, heartwarming, slice of life, feel-good, cozy, low-stakes',
+  'feel-good': 'FEEL-GOOD: Uplifting, happy endings, comedy, romance, optimistic, warm',
+  'tearjerker': 'TEARJERKER: Emotional, tragic, loss, grief, moving, bittersweet',
+  'visual': 'VISUAL/EPIC: Stunning visuals, epic scope, fantasy worlds, cinematographic masterpiece',
+};
+
+// Blocked titles as prompt bullet lines, capped at `max`
+function formatBlockedList(items: Array<{ title: string; genres: string[] }>, max: number): string {
+  return items.slice(0, max).map(b => `- "${b.title}" [${b.genres.join(', ')}]`).join('\n');
+}
+
+// Parse a JSON array/object out of a model response. Strips a markdown fence, tries the
+// whole text, then the outermost [...] / {...} span (indexOf/lastIndexOf rather than a
+// greedy [\s\S]* regex that rescans the response). Returns undefined when nothing parses.
+function parseAIJson<T>(responseText: string, open: '[' | '{'): T | undefined {
+  let text = responseText.trim();
+  if (text.startsWith('```')) {
+    text = text.replace(/^```(?:json)?\n?/, '').replace(/\n?```$/, '');
+  }
+  try {
+    return JSON.parse(text) as T;
+  } catch {
+    const start = text.indexOf(open);
+    const end = text.lastIndexOf(open === '[' ? ']' : '}');
+    if (start === -1 || end <= start) return undefined;
+    try {
+      return JSON.parse(text.slice(start, end + 1)) as T;
+    } catch {
+      return undefined;
+    }
+  }
+}
+
+// SDK clients are reused across calls and only rebuilt when provider, model or key changes
+let cachedClient: { key: string; bundle: AIClientBundle } | null = null;
+
 // Build AI client based on configured provider
 export async function buildClientAndModel(): Promise<AIClientBundle> {
   const cfg = await ConfigService.getConfig();
   const provider = cfg.aiProvider || 'google';
   const modelNameFromCfg = cfg.aiModel ? String(cfg.aiModel).trim() : DEFAULT_MODEL;
+  const rawKey = provider === 'openrouter'
+    ? (cfg.openrouterApiKey ? String(cfg.openrouterApiKey) : (process.env.OPENROUTER_API_KEY || ''))
+    : (cfg.geminiApiKey ? String(cfg.geminiApiKey) : (process.env.GEMINI_API_KEY || ''));
+  const apiKey = rawKey.trim();
+
+  const cacheKey = `${provider}|${modelNameFromCfg}|${apiKey}`;
+  if (cachedClient && cachedClient.key === cacheKey) return cachedClient.bundle;
 
   console.log(`[AI] Provider: ${provider}, Model: ${modelNameFromCfg}`);
 
+  let bundle: AIClientBundle;
   if (provider === 'openrouter') {
     // OpenRouter setup
-    const rawKey = cfg.openrouterApiKey ? String(cfg.openrouterApiKey) : (process.env.OPENROUTER_API_KEY || '');
-    const apiKey = rawKey.trim();
-
     if (!apiKey) {
       throw new Error('OpenRouter API key not configured');
     }
@@ -54,16 +118,13 @@ export async function buildClientAndModel(): Promise<AIClientBundle> {
       ? `google/${modelNameFromCfg}`
       : modelNameFromCfg;
 
-    return {
+    bundle = {
       provider: 'openrouter',
       modelName: openrouterModelName,
       openrouterClient
     };
   } else {
     // Google AI Direct setup (new @google/genai SDK)
-    const rawKey = cfg.geminiApiKey ? String(cfg.geminiApiKey) : (process.env.GEMINI_API_KEY || '');
-    const apiKey = rawKey.trim();
-
     if (!apiKey) {
       throw new Error('Gemini API key not configured');
     }
@@ -81,13 +142,16 @@ export async function buildClientAndModel(): Promise<AIClientBundle> {
       }
     } : {};
 
-    return {
+    bundle = {
       provider: 'google',
       modelName: modelNameFromCfg,
       googleClient,
       modelConfig
     };
   }
+
+  cachedClient = { key: cacheKey, bundle };
+  return bundle;
 }
 
 // Unified content generation function that works with both providers
@@ -113,11 +177,13 @@ export async function generateAIContent(
       } : {})
     };
 
-    const response = await client.googleClient.models.generateContent({
+    // The OpenAI SDK retries 429s itself; the Google client doesn't, so back off here
+    const googleClient = client.googleClient;
+    const response = await withBackoff(() => googleClient.models.generateContent({
       model: client.modelName,
       contents: prompt,
       config,
-    });
+    }));
 
     return response.text ?? '';
   }
@@ -205,9 +271,9 @@ Return ONLY plain text bullet points, no markdown formatting, no headers. Keep e
       console.debug(`[AI Ranking] Using provider: ${client.provider}, model: ${client.modelName} for ${candidates.length} candidates`);
 
       // Format candidates for prompt
-      const candidateList = candidates.slice(0, 30).map((c, i) =>
-        `${i + 1}. [ID:${c.tmdbId}] "${c.title}" [${c.genres.join(', ')}] ★${c.voteAverage?.toFixed(1) || 'N/A'}\n   ${(c.overview || 'No description').substring(0, 150)}`
-      ).join('\n');
+      const candidateList = candidates.slice(0, 30)
+        .map((c, i) => formatCandidateLine(c, i, 150, 'No description'))
+        .join('\n');
 
       // Build context lines, filtering out empty ones
       const contextLines: string[] = [];
@@ -216,27 +282,13 @@ Return ONLY plain text bullet points, no markdown formatting, no headers. Keep e
       if (userContext.requestedGenre) contextLines.push(`Requested genre: ${userContext.requestedGenre}`);
       if (userContext.requestedYearRange) contextLines.push(`Requested year range: ${userContext.requestedYearRange}`);
 
-      // Detailed mood descriptions
-      const moodDescriptions: Record<string, string> = {
-        'mind-bending': 'MIND-BENDING: Complex plots, twist endings, psychological themes, surreal, nonlinear timelines',
-        'dark': 'DARK & GRITTY: Noir, dystopian, crime, violence, morally ambiguous, intense',
-        'adrenaline': 'ADRENALINE: Action-packed, thrilling, car chases, explosions, heists, high stakes',
-        'chill': 'CHILL & COMFORT: Relaxing, heartwarming, slice of life, feel-good, cozy, low-stakes',
-        'feel-good': 'FEEL-GOOD: Uplifting, happy endings, comedy, romance, optimistic, warm',
-        'tearjerker': 'TEARJERKER: Emotional, tragic, loss, grief, moving, bittersweet',
-        'visual': 'VISUAL/EPIC: Stunning visuals, epic scope, fantasy worlds, cinematographic masterpiece',
-      };
-      if (userContext.requestedMood && moodDescriptions[userContext.requestedMood]) {
-        contextLines.push(`Requested mood: ${moodDescriptions[userContext.requestedMood]}`);
-      }
+      const moodDescription = userContext.requestedMood ? MOOD_DESCRIPTIONS[userContext.requestedMood] : undefined;
+      if (moodDescription) contextLines.push(`Requested mood: ${moodDescription}`);
 
       // Build blocked items context for negative signals
       let blockedContext = '';
       if (userContext.blockedItems && userContext.blockedItems.length > 0) {
-        const blockedList = userContext.blockedItems.slice(0, 20).map(b =>
-          `- "${b.title}" [${b.genres.join(', ')}]`
-        ).join('\n');
-        blockedContext = `\nBLOCKED ITEMS (user rejected these):\n${blockedList}\n`;
+        blockedContext = `\nBLOCKED ITEMS (user rejected these):\n${formatBlockedList(userContext.blockedItems, 20)}\n`;
       }
 
       // Gemini 3 optimized: data first, task middle, constraints last
@@ -252,29 +304,19 @@ Return ONLY a JSON array: [{"tmdbId": 123, "title": "Name", "reason": "Why it fi
 Do NOT include titles not in the candidate list.${blockedContext ? ' Avoid titles similar in theme/genre to the blocked items.' : ''} Output must be valid JSON, no markdown.`;
 
       // Debug: log prompt size and first candidate
-      console.debug(`[AI Ranking] Prompt length: ${prompt.length} chars, first candidate: ${candidates[0]?.title}`);
+      logger.debug({ promptLength: prompt.length, firstCandidate: candidates[0]?.title }, '[AI Ranking] Prompt built');
 
       const responseText = await generateAIContent(client, prompt, { json: true });
       console.debug(`[AI Ranking] Raw response length: ${responseText.length} chars`);
 
-      // Try parsing directly first
-      let parsed: any[] = [];
-      try {
-        parsed = JSON.parse(responseText);
-        console.debug(`[AI Ranking] Direct parse succeeded with ${parsed.length} items`);
-      } catch (directParseError) {
-        console.debug(`[AI Ranking] Direct parse failed: ${(directParseError as Error).message}`);
-        // If direct parse fails, try regex extraction
-        const jsonMatch = responseText.match(/\[[\s\S]*\]/);
-        if (!jsonMatch) {
-          console.warn('[AI Ranking] No valid JSON in response, first 300 chars:', JSON.stringify(responseText.substring(0, 300)));
-          // Fallback: return top candidates by rating
-          return candidates
-            .sort((a, b) => (b.voteAverage || 0) - (a.voteAverage || 0))
-            .slice(0, limit)
-            .map(c => ({ tmdbId: c.tmdbId, title: c.title, reason: 'Top rated' }));
-        }
-        parsed = JSON.parse(jsonMatch[0]);
+      const parsed = parseAIJson<any[]>(responseText, '[');
+      if (!parsed) {
+        console.warn('[AI Ranking] No valid JSON in response, first 300 chars:', JSON.stringify(responseText.substring(0, 300)));
+        // Fallback: return top candidates by rating
+        return candidates
+          .sort((a, b) => (b.voteAverage || 0) - (a.voteAverage || 0))
+          .slice(0, limit)
+          .map(c => ({ tmdbId: c.tmdbId, title: c.title, reason: 'Top rated' }));
       }
 
       console.debug(`[AI Ranking] Selected ${parsed.length} items from ${candidates.length} candidates`);
@@ -350,31 +392,12 @@ Return ONLY valid JSON, no markdown.`;
       const responseText = await generateAIContent(client, prompt, { json: true });
       console.debug(`[AI Taste] Response length: ${responseText.length} chars`);
 
-      // Try to parse JSON - handle markdown code blocks
-      let parsed: any;
-      let cleanedText = responseText.trim();
-
-      // Remove markdown code blocks if present
-      if (cleanedText.startsWith('```')) {
-        cleanedText = cleanedText.replace(/^```(?:json)?\n?/, '').replace(/\n?```$/, '');
-      }
-
-      try {
-        parsed = JSON.parse(cleanedText);
-      } catch {
-        // Try to extract JSON object from response
-        const jsonMatch = cleanedText.match(/\{[\s\S]*\}/);
-        if (jsonMatch) {
-          try {
-            parsed = JSON.parse(jsonMatch[0]);
-          } catch (innerErr) {
-            console.debug(`[AI Taste] JSON extraction failed, raw response: ${cleanedText.substring(0, 200)}`);
-            throw new Error('No valid JSON in response');
-          }
-        } else {
-          console.debug(`[AI Taste] No JSON found, raw response: ${cleanedText.substring(0, 200)}`);
-          throw new Error('No valid JSON in response');
+      const parsed = parseAIJson<any>(responseText, '{');
+      if (!parsed) {
+        if (logger.isLevelEnabled('debug')) {
+          logger.debug({ raw: responseText.trim().substring(0, 200) }, '[AI Taste] No JSON found');
         }
+        throw new Error('No valid JSON in response');
       }
 
       console.debug(`[AI Taste] Analysis complete: ${parsed.genres?.length || 0} genres, ${parsed.keywords?.length || 0} keywords`);
@@ -444,12 +467,12 @@ Return ONLY valid JSON, no markdown.`;
 
     try {
       const client = await buildClientAndModel();
-      console.debug(`[Curator] Processing ${candidates.length} candidates for user with taste: ${userTaste.tasteProfile.substring(0, 50)}...`);
+      console.debug(`[Curator] Processing ${candidates.length} candidates for user with taste: ${truncate(userTaste.tasteProfile, 50)}`);
 
       // Format candidates (limit to first 150 to avoid token limits)
-      const candidateList = candidates.slice(0, 150).map((c, i) =>
-        `${i + 1}. [ID:${c.tmdbId}] "${c.title}" [${c.genres.join(', ')}] ★${c.voteAverage?.toFixed(1) || 'N/A'}\n   ${(c.overview || '').substring(0, 80)}...`
-      ).join('\n');
+      const candidateList = candidates.slice(0, 150)
+        .map((c, i) => formatCandidateLine(c, i, 80))
+        .join('\n');
 
       // Gemini 3 optimized: data first, task middle, constraints last
       const prompt = `USER TASTE:
@@ -468,18 +491,8 @@ Do NOT include titles not in the candidate pool. IMPORTANT: Ensure genre diversi
       const responseText = await generateAIContent(client, prompt, { json: true });
       console.debug(`[Curator] Response length: ${responseText.length} chars`);
 
-      // Parse JSON
-      let parsed: Array<{ tmdbId: number; title: string; reason: string }> = [];
-      try {
-        parsed = JSON.parse(responseText);
-      } catch {
-        const jsonMatch = responseText.match(/\[[\s\S]*\]/);
-        if (jsonMatch) {
-          parsed = JSON.parse(jsonMatch[0]);
-        } else {
-          throw new Error('No valid JSON in Curator response');
-        }
-      }
+      const parsed = parseAIJson<Array<{ tmdbId: number; title: string; reason: string }>>(responseText, '[');
+      if (!parsed) throw new Error('No valid JSON in Curator response');
 
       console.debug(`[Curator] Selected ${parsed.length} candidates with reasons`);
       return parsed.slice(0, limit);
@@ -499,13 +512,13 @@ Do NOT include titles not in the candidate pool. IMPORTANT: Ensure genre diversi
    * Reviews Curator's picks and selects only the absolute best
    * 
    * @param curatorPicks - Candidates selected by Curator with reasons
-   * @param blocklist - TMDB IDs the user has blocked
+   * @param blocklist - TMDB IDs the user has blocked (pass a Set to reuse it across calls)
    * @param limit - Final number to select (default 10)
    * @returns Top picks (WOW-factor only)
    */
   static async criticSelect(
     curatorPicks: Array<{ tmdbId: number; title: string; reason: string }>,
-    blocklist: number[],
+    blocklist: ReadonlySet<number> | number[],
     limit: number = 10,
     tasteProfile?: string,
     blocklistItems?: Array<{ title: string; genres: string[] }>
@@ -514,8 +527,9 @@ Do NOT include titles not in the candidate pool. IMPORTANT: Ensure genre diversi
       return [];
     }
 
-    // Pre-filter obvious blocklist matches
-    const filtered = curatorPicks.filter(p => !blocklist.includes(p.tmdbId));
+    // Pre-filter obvious blocklist matches (Set lookup keeps this O(picks))
+    const blockedIds: ReadonlySet<number> = blocklist instanceof Set ? blocklist : new Set(blocklist);
+    const filtered = curatorPicks.filter(p => !blockedIds.has(p.tmdbId));
 
     if (filtered.length <= limit) {
       // Not enough candidates, return all
@@ -524,7 +538,7 @@ Do NOT include titles not in the candidate pool. IMPORTANT: Ensure genre diversi
 
     try {
       const client = await buildClientAndModel();
-      console.debug(`[Critic] Reviewing ${filtered.length} candidates, blocklist size: ${blocklist.length}`);
+      console.debug(`[Critic] Reviewing ${filtered.length} candidates, blocklist size: ${blockedIds.size}`);
 
       // Format curator picks with their reasons
       const picksList = filtered.map((p, i) =>
@@ -534,9 +548,7 @@ Do NOT include titles not in the candidate pool. IMPORTANT: Ensure genre diversi
       // Build blocklist context with metadata when available
       let blocklistContext = '(none)';
       if (blocklistItems && blocklistItems.length > 0) {
-        blocklistContext = blocklistItems.slice(0, 30).map(b =>
-          `- "${b.title}" [${b.genres.join(', ')}]`
-        ).join('\n');
+        blocklistContext = formatBlockedList(blocklistItems, 30);
       }
 
       // Gemini 3 optimized: data first, task middle, constraints last
@@ -552,28 +564,13 @@ Return ONLY a valid JSON array: [{"tmdbId": 123, "title": "Example"}, ...]
 Do NOT select titles similar in theme/genre to the blocked items above. Output must be valid JSON, no markdown.`;
 
       const responseText = await generateAIContent(client, prompt, { json: true });
-      console.debug(`[Critic] Response length: ${responseText.length} chars`);
-      console.debug(`[Critic] Raw response: ${responseText.substring(0, 300)}`);
-
-      // Parse JSON - handle markdown code blocks
-      let parsed: Array<{ tmdbId: number; title: string }> = [];
-      let cleanedText = responseText.trim();
-
-      // Remove markdown code blocks if present
-      if (cleanedText.startsWith('```')) {
-        cleanedText = cleanedText.replace(/^```(?:json)?\n?/, '').replace(/\n?```$/, '');
+      // Snippet is only sliced out of the (possibly large) response when debug output is on
+      if (logger.isLevelEnabled('debug')) {
+        logger.debug({ length: responseText.length, raw: responseText.substring(0, 300) }, '[Critic] Response');
       }
 
-      try {
-        parsed = JSON.parse(cleanedText);
-      } catch {
-        const jsonMatch = cleanedText.match(/\[[\s\S]*\]/);
-        if (jsonMatch) {
-          parsed = JSON.parse(jsonMatch[0]);
-        } else {
-          throw new Error('No valid JSON in Critic response');
-        }
-      }
+      const parsed = parseAIJson<Array<{ tmdbId: number; title: string }>>(responseText, '[');
+      if (!parsed) throw new Error('No valid JSON in Critic response');
 
       console.debug(`[Critic] Approved ${parsed.length} titles from ${filtered.length} candidates`);
       return parsed.slice(0, limit);
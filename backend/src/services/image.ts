@@ -18,6 +18,8 @@ const pipeline = promisify(stream.pipeline);
  */
 export class ImageService {
     private static imageDir = process.env.IMAGE_DIR || '/app/images';
+    // Downloads in progress, keyed by target filename
+    private static pendingDownloads = new Map<string, Promise<string | null>>();
 
     /**
      * Ensure the images directory exists
@@ -77,7 +79,19 @@ export class ImageService {
      * @param headers - Optional headers (e.g., X-Api-Key for Jellyseerr)
      * @returns Local URL path on success, null on failure
      */
-    static async download(url: string, filename: string, headers?: Record<string, string>): Promise<string | null> {
+    static download(url: string, filename: string, headers?: Record<string, string>): Promise<string | null> {
+        // The backfill queue and the self-healing /images route can ask for the same file at
+        // once; later callers wait on the first download instead of starting their own
+        const pending = this.pendingDownloads.get(filename);
+        if (pending) return pending;
+
+        const download = this.fetchToFile(url, filename, headers)
+            .finally(() => this.pendingDownloads.delete(filename));
+        this.pendingDownloads.set(filename, download);
+        return download;
+    }
+
+    private static async fetchToFile(url: string, filename: string, headers?: Record<string, string>): Promise<string | null> {
         try {
             await this.ensureImageDir();
 
@@ -115,8 +129,16 @@ export class ImageService {
                 timeout: 30000, // 30 second timeout
             });
 
-            // Save to disk
-            await pipeline(response.data, fs.createWriteStream(filepath));
+            // Stream into a temp file and rename it into place: an interrupted download must not
+            // leave a truncated image behind, since imageExists() would then trust it forever
+            const tmpPath = `${filepath}.${process.pid}-${Math.random().toString(36).slice(2)}.tmp`;
+            try {
+                await pipeline(response.data, fs.createWriteStream(tmpPath));
+                await fs.promises.rename(tmpPath, filepath);
+            } catch (writeErr) {
+                await fs.promises.unlink(tmpPath).catch(() => undefined);
+                throw writeErr;
+            }
 
             console.log('[ImageService] Successfully downloaded image to file:', filename);
             return `/images/${filename}`;
@@ -151,22 +173,24 @@ export class ImageService {
             backdropUrl: backdropUrl || null,
         };
 
-        // Download poster if external URL provided
-        if (posterUrl && (posterUrl.startsWith('http') || posterUrl.startsWith('/api/proxy'))) {
-            const filename = this.getLocalFilename(tmdbId, mediaType, 'poster');
-            const localPath = await this.download(posterUrl, filename, headers);
-            if (localPath) {
-                result.posterUrl = localPath;
-            }
+        const isRemote = (url?: string | null): url is string =>
+            !!url && (url.startsWith('http') || url.startsWith('/api/proxy'));
+
+        // Download poster and backdrop concurrently rather than one after the other
+        const [localPoster, localBackdrop] = await Promise.all([
+            isRemote(posterUrl)
+                ? this.download(posterUrl, this.getLocalFilename(tmdbId, mediaType, 'poster'), headers)
+                : Promise.resolve(null),
+            isRemote(backdropUrl)
+                ? this.download(backdropUrl, this.getLocalFilename(tmdbId, mediaType, 'backdrop'), headers)
+                : Promise.resolve(null),
+        ]);
+
+        if (localPoster) {
+            result.posterUrl = localPoster;
         }
-
-        // Download backdrop if external URL provided
-        if (backdropUrl && (backdropUrl.startsWith('http') || backdropUrl.startsWith('/api/proxy'))) {
-            const filename = this.getLocalFilename(tmdbId, mediaType, 'backdrop');
-            const localPath = await this.download(backdropUrl, filename, headers);
-            if (localPath) {
-                result.backdropUrl = localPath;
-            }
+        if (localBackdrop) {
+            result.backdropUrl = localBackdrop;
         }
 
         return result;
@@ -12,13 +12,39 @@
  *    to migrate their data across versions.
  */
 
+import pLimit from 'p-limit';
 import prisma from './data';
 import { searchAndEnrich } from './jellyseerr';
-import { updateMediaStatus } from './data';
+import { ensureUser, updateMediaStatus } from './data';
 import { MediaItemInput, LegacyImportEntry } from '../types';
+import { logger } from '../utils/logger';
 
 type LegacyEntry = string | LegacyImportEntry;
 
+// In-flight entries during an import; each one is a Jellyseerr search plus a DB upsert
+const IMPORT_CONCURRENCY = 5;
+
+// Identity used to collapse duplicates before resolution: TMDB id when present, else the title
+function legacyEntryKey(entry: LegacyEntry): string {
+  if (typeof entry === 'string') return `t:${entry.trim().toLowerCase()}`;
+  const tmdbId = entry?.tmdb_id ?? entry?.tmdbId;
+  if (tmdbId) return `id:${tmdbId}`;
+  return `t:${String(entry?.title ?? '').trim().toLowerCase()}`;
+}
+
+// Media type resolveLegacyEntry will use: an object entry's own media_type wins over its list
+function entryMediaType(entry: LegacyEntry, listMediaType: 'movie' | 'tv'): 'movie' | 'tv' {
+  if (entry && typeof entry === 'object') return entry.media_type === 'tv' ? 'tv' : 'movie';
+  return listMediaType;
+}
+
+// Release year an entry carries, if any; used to tell same-titled remakes apart
+function entryYear(entry: LegacyEntry): string | null {
+  if (!entry || typeof entry !== 'object') return null;
+  const year = String(entry.year ?? entry.releaseDate ?? '').substring(0, 4);
+  return year || null;
+}
+
 // Resolved item after Jellyseerr verification
 interface ResolvedImportItem {
   title?: string;
@@ -157,108 +183,145 @@ export class ImportService {
     // Acquire per-user lock; cleared in finally so background imports release it too
     this.activeImports.add(username);
     try {
-    const user = await prisma.user.upsert({ where: { username }, create: { username }, update: {} });
+    const user = await ensureUser(username);
     // Unwrap if payloads are nested under `data` (legacy export format)
     const payload: ImportPayload = (jsonData && typeof jsonData === 'object' && jsonData.data) ? jsonData.data : jsonData;
 
-    // Build queue from known legacy keys
-    const queue: Array<{ raw: LegacyEntry; targetStatus: string; mediaType: 'movie'|'tv' }> = [];
+    // Build queue from known legacy keys. Entries are keyed by media type + identity so a
+    // title repeated across lists or merged backups is resolved (and searched in Jellyseerr)
+    // only once. A user can hold one status per title, so the first list it appears in
+    // decides it (watched lists are enqueued first) instead of whichever resolves first.
+    type QueueItem = { raw: LegacyEntry; targetStatus: string; mediaType: 'movie'|'tv' };
+    const unique = new Map<string, QueueItem>();
+    const enqueue = (entries: LegacyEntry[] | undefined, targetStatus: string, mediaType: 'movie'|'tv') => {
+      if (!Array.isArray(entries)) return;
+      for (const raw of entries) {
+        const key = `${entryMediaType(raw, mediaType)}|${legacyEntryKey(raw)}`;
+        const existing = unique.get(key);
+        if (!existing) {
+          unique.set(key, { raw, targetStatus, mediaType });
+        } else if (typeof existing.raw === 'string' && typeof raw === 'object') {
+          // Let an object entry (ids, year) replace a bare title, keeping the first status
+          unique.set(key, { ...existing, raw });
+        }
+      }
+    };
 
     try {
-      if (Array.isArray(payload.movies)) payload.movies.forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHED', mediaType: 'movie' }));
-      if (Array.isArray(payload.series)) payload.series.forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHED', mediaType: 'tv' }));
+      enqueue(payload.movies, 'WATCHED', 'movie');
+      enqueue(payload.series, 'WATCHED', 'tv');
 
       // watchlist may be nested
       if (payload.watchlist) {
-        if (Array.isArray(payload.watchlist.movies)) payload.watchlist.movies.forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHLIST', mediaType: 'movie' }));
-        if (Array.isArray(payload.watchlist.series)) payload.watchlist.series.forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHLIST', mediaType: 'tv' }));
+        enqueue(payload.watchlist.movies, 'WATCHLIST', 'movie');
+        enqueue(payload.watchlist.series, 'WATCHLIST', 'tv');
       }
 
       // legacy keys like watchlist_movies or similar
-      if (Array.isArray(payload['watchlist.movies'])) payload['watchlist.movies'].forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHLIST', mediaType: 'movie' }));
-      if (Array.isArray(payload['watchlist.series'])) payload['watchlist.series'].forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHLIST', mediaType: 'tv' }));
+      enqueue(payload['watchlist.movies'], 'WATCHLIST', 'movie');
+      enqueue(payload['watchlist.series'], 'WATCHLIST', 'tv');
 
       // Allow top-level generic arrays
-      if (Array.isArray(payload.items)) payload.items.forEach((r: LegacyEntry) => queue.push({ raw: r, targetStatus: 'WATCHLIST', mediaType: 'movie' }));
+      enqueue(payload.items, 'WATCHLIST', 'movie');
     } catch (e) {
       // ignore malformed
     }
+    const queue = Array.from(unique.values());
 
     console.log(`[Import] Built queue with ${queue.length} items for user ${username}`);
 
+    // Every TMDB id the user already has, indexed once; per-item checks are then a Set lookup
+    // instead of two queries each
+    const existingRows = await prisma.userMedia.findMany({
+      where: { userId: user.id },
+      select: { media: { select: { tmdbId: true, title: true, mediaType: true, releaseYear: true } } },
+    });
+    const existingTmdbIds = new Set(existingRows.map(r => r.media.tmdbId));
+    // Title-only entries the user already tracks need no Jellyseerr search to be skipped,
+    // unless the entry names a different release year (a remake sharing the title)
+    const knownTitleYears = new Map<string, Set<string>>();
+    for (const r of existingRows) {
+      const key = `${r.media.mediaType}|${legacyEntryKey(r.media.title)}`;
+      const years = knownTitleYears.get(key) ?? new Set<string>();
+      years.add(String(r.media.releaseYear ?? ''));
+      knownTitleYears.set(key, years);
+    }
+
     // Initialize progress tracking
     this.initProgress(username, queue.length);
 
-    let total = 0, skipped = 0, imported = 0;
+    let total = 0, processed = 0, skipped = 0, imported = 0;
     const errors: string[] = [];
 
-    // Process in batches to avoid timeout
-    const BATCH_SIZE = 10;
-    for (let i = 0; i < queue.length; i += BATCH_SIZE) {
-      const batch = queue.slice(i, i + BATCH_SIZE);
-      console.log(`[Import] Processing batch ${Math.floor(i / BATCH_SIZE) + 1}/${Math.ceil(queue.length / BATCH_SIZE)} (items ${i + 1}-${Math.min(i + BATCH_SIZE, queue.length)})`);
+    // Resolve entries concurrently: nearly all of an import's time is Jellyseerr search round
+    // trips, which overlap well on the shared keep-alive agent
+    const limit = pLimit(IMPORT_CONCURRENCY);
+    await Promise.all(queue.map(q => limit(async () => {
+      total++;
+      try {
+        const knownYears = knownTitleYears.get(`${entryMediaType(q.raw, q.mediaType)}|${legacyEntryKey(q.raw)}`);
+        const year = entryYear(q.raw);
+        if (knownYears && (!year || knownYears.has(year))) {
+          skipped++;
+          this.updateProgress(username, { skipped });
+          return;
+        }
 
-      for (const q of batch) {
-        total++;
-        try {
-          const resolved = await this.resolveLegacyEntry(q.raw, q.mediaType);
-          if (!resolved || !resolved.tmdbId) {
-            skipped++;
-            this.updateProgress(username, { 
-              processed: total, 
-              skipped, 
-              currentItem: typeof q.raw === 'string' ? q.raw : ((q.raw as LegacyImportEntry).title || 'Unknown')
-            });
-            continue;
-          }
-
-          const tmdbId = Number(resolved.tmdbId);
-          
-          // Update progress with current item
+        const resolved = await this.resolveLegacyEntry(q.raw, q.mediaType);
+        if (!resolved || !resolved.tmdbId) {
+          skipped++;
           this.updateProgress(username, { 
-            currentItem: resolved.title || 'Unknown',
-            processed: total
+            skipped, 
+            currentItem: typeof q.raw === 'string' ? q.raw : ((q.raw as LegacyImportEntry).title || 'Unknown')
           });
+          return;
+        }
+
+        const tmdbId = Number(resolved.tmdbId);
+        
+        // Update progress with current item
+        this.updateProgress(username, { currentItem: resolved.title || 'Unknown' });
 
-          // Check if media exists
-          const media = await prisma.media.findUnique({ where: { tmdbId } });
-          let exists = false;
-          if (media) {
-            const um = await prisma.userMedia.findFirst({ where: { userId: user.id, mediaId: media.id } });
-            if (um) exists = true;
-          }
-
-          if (exists) {
-            console.debug(`[Import] Skipping '${resolved.title}' - Already in DB`);
-            skipped++;
-            this.updateProgress(username, { skipped, processed: total });
-            continue;
-          }
-
-          // Build item payload for updateMediaStatus (it will upsert media)
-          const itemForDb: MediaItemInput = {
-            tmdbId: tmdbId,
-            title: resolved.title,
-            mediaType: resolved.mediaType,
-            releaseYear: resolved.releaseYear,
-            posterUrl: resolved.posterUrl,
-            overview: resolved.overview,
-            backdropUrl: resolved.backdropUrl,
-            voteAverage: resolved.voteAverage !== undefined ? Number(resolved.voteAverage) : undefined,
-          };
-
-          await updateMediaStatus(username, itemForDb, q.targetStatus, accessToken);
-          imported++;
-          this.updateProgress(username, { imported, processed: total });
-          console.log(`[Import] ✓ Imported '${resolved.title}' (${imported}/${queue.length - skipped})`);
-        } catch (e: unknown) {
-          const errorMsg = e instanceof Error ? e.message : String(e);
-          errors.push(errorMsg);
-          this.updateProgress(username, { errors: errors.length, processed: total });
-          console.error(`[Import] ✗ Failed to import item:`, errorMsg);
+        if (existingTmdbIds.has(tmdbId)) {
+          logger.debug({ title: resolved.title }, '[Import] Skipping - already in DB');
+          skipped++;
+          this.updateProgress(username, { skipped });
+          return;
         }
+        // Claim the id before saving so a concurrent entry resolving to it is skipped
+        existingTmdbIds.add(tmdbId);
+
+        // Build item payload for updateMediaStatus (it will upsert media)
+        const itemForDb: MediaItemInput = {
+          tmdbId: tmdbId,
+          title: resolved.title,
+          mediaType: resolved.mediaType,
+          releaseYear: resolved.releaseYear,
+          posterUrl: resolved.posterUrl,
+          overview: resolved.overview,
+          backdropUrl: resolved.backdropUrl,
+          voteAverage: resolved.voteAverage !== undefined ? Number(resolved.voteAverage) : undefined,
+        };
+
+        try {
+          await updateMediaStatus(username, itemForDb, q.targetStatus, accessToken, user.id);
+        } catch (e) {
+          existingTmdbIds.delete(tmdbId);
+          throw e;
+        }
+        imported++;
+        this.updateProgress(username, { imported });
+        console.log(`[Import] ✓ Imported '${resolved.title}' (${imported}/${queue.length - skipped})`);
+      } catch (e: unknown) {
+        const errorMsg = e instanceof Error ? e.message : String(e);
+        errors.push(errorMsg);
+        this.updateProgress(username, { errors: errors.length });
+        console.error(`[Import] ✗ Failed to import item:`, errorMsg);
+      } finally {
+        processed++;
+        this.updateProgress(username, { processed });
       }
-    }
+    })));
 
     console.log(`[Import] Complete: ${imported} imported, ${skipped} skipped, ${errors.length} errors`);
     this.completeProgress(username);
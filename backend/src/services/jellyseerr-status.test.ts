@@ -0,0 +1,110 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const { client, cacheStore } = vi.hoisted(() => ({
+  client: { get: vi.fn() },
+  cacheStore: new Map<string, unknown>(),
+}));
+
+vi.mock('axios', () => ({ default: { create: vi.fn(() => client) } }));
+vi.mock('./config', () => ({
+  default: { getConfig: vi.fn().mockResolvedValue({ jellyseerrUrl: 'http://jellyseerr.example:5055', jellyseerrApiKey: 'test-key' }) },
+}));
+vi.mock('../utils/ssrf-protection', () => ({ validateBaseUrl: (url: string) => url }));
+vi.mock('../utils/logger', () => ({ logger: { debug: vi.fn(), info: vi.fn(), warn: vi.fn(), error: vi.fn() } }));
+// In-memory stand-in for the namespaced cache (the real one also persists to SQLite)
+vi.mock('./cache', () => ({
+  CacheService: {
+    get: (ns: string, key: string) => cacheStore.get(`${ns}:${key}`),
+    set: (ns: string, key: string, value: unknown) => { cacheStore.set(`${ns}:${key}`, value); },
+    getOrSet: async (ns: string, key: string, fetcher: () => Promise<unknown>) => {
+      const full = `${ns}:${key}`;
+      if (cacheStore.has(full)) return cacheStore.get(full);
+      const value = await fetcher();
+      cacheStore.set(full, value);
+      return value;
+    },
+  },
+}));
+
+import { filterByJellyseerrStatus, getJellyseerrStatuses, JellyseerrStatus } from './jellyseerr-status';
+
+type Listed = { id: number; tmdbId: number; mediaType: string; status: number };
+
+// Serves /api/v1/media listings per status filter, paged by take/skip like Jellyseerr
+function serveListings(byFilter: Record<string, Listed[]>) {
+  client.get.mockImplementation(async (url: string, config?: { params?: { filter: string; take: number; skip: number } }) => {
+    if (url !== '/api/v1/media' || !config?.params) throw new Error(`unexpected request ${url}`);
+    const { filter, take, skip } = config.params;
+    const all = byFilter[filter] ?? [];
+    return { data: { pageInfo: { results: all.length }, results: all.slice(skip, skip + take) } };
+  });
+}
+
+function listed(tmdbId: number, status: number, mediaType = 'movie'): Listed {
+  return { id: tmdbId, tmdbId, mediaType, status };
+}
+
+describe('jellyseerr status index', () => {
+  beforeEach(() => {
+    cacheStore.clear();
+    client.get.mockReset();
+  });
+
+  it('pages past the page size for each status filter', async () => {
+    const available = Array.from({ length: 1200 }, (_, i) => listed(10_000 + i, JellyseerrStatus.AVAILABLE));
+    serveListings({ pending: [], processing: [], available });
+
+    const statuses = await getJellyseerrStatuses([10_000, 10_600, 11_199], 'movie');
+
+    expect(statuses.get(10_000)).toBe(JellyseerrStatus.AVAILABLE);
+    expect(statuses.get(10_600)).toBe(JellyseerrStatus.AVAILABLE);
+    expect(statuses.get(11_199)).toBe(JellyseerrStatus.AVAILABLE);
+    const availableSkips = client.get.mock.calls
+      .filter(([, config]) => config?.params?.filter === 'available')
+      .map(([, config]) => config.params.skip);
+    expect(availableSkips.sort((a, b) => a - b)).toEqual([0, 500, 1000]);
+  });
+
+  it('drops listed media that is neither a movie nor a tv show', async () => {
+    serveListings({ pending: [listed(77, JellyseerrStatus.PENDING, 'person')], processing: [], available: [] });
+
+    expect((await getJellyseerrStatuses([77], 'movie')).get(77)).toBeNull();
+    expect((await getJellyseerrStatuses([77], 'tv')).get(77)).toBeNull();
+  });
+
+  it('maps ids missing from the listing to null and keeps types apart', async () => {
+    serveListings({ pending: [listed(1399, JellyseerrStatus.PENDING, 'tv')], processing: [listed(550, JellyseerrStatus.PROCESSING)], available: [] });
+
+    const movies = await getJellyseerrStatuses([550, 603, 1399], 'movie');
+    expect(movies.get(550)).toBe(JellyseerrStatus.PROCESSING);
+    expect(movies.get(603)).toBeNull();
+    expect(movies.get(1399)).toBeNull();
+
+    const tv = await getJellyseerrStatuses([1399], 'tv');
+    expect(tv.get(1399)).toBe(JellyseerrStatus.PENDING);
+  });
+
+  it('falls back to per-id lookups when the listing fails', async () => {
+    client.get.mockImplementation(async (url: string) => {
+      if (url === '/api/v1/media') throw new Error('listing unavailable');
+      if (url === '/api/v1/movie/550') return { data: { mediaInfo: { status: JellyseerrStatus.AVAILABLE } } };
+      if (url === '/api/v1/movie/603') throw Object.assign(new Error('not found'), { response: { status: 404 } });
+      throw new Error(`unexpected request ${url}`);
+    });
+
+    const statuses = await getJellyseerrStatuses([550, 603], 'movie');
+
+    expect(statuses.get(550)).toBe(JellyseerrStatus.AVAILABLE);
+    expect(statuses.get(603)).toBeNull();
+    expect(client.get).toHaveBeenCalledWith('/api/v1/movie/550');
+    expect(client.get).toHaveBeenCalledWith('/api/v1/movie/603');
+  });
+
+  it('filters out already requested or available items', async () => {
+    serveListings({ pending: [listed(550, JellyseerrStatus.PENDING)], processing: [], available: [listed(603, JellyseerrStatus.AVAILABLE)] });
+
+    const kept = await filterByJellyseerrStatus([{ id: 550 }, { id: 603 }, { id: 680 }], 'movie');
+
+    expect(kept).toEqual([{ id: 680 }]);
+  });
+});
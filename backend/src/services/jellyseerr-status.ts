@@ -4,9 +4,11 @@
  */
 
 import axios from 'axios';
+import pLimit from 'p-limit';
 import ConfigService from './config';
 import { validateBaseUrl } from '../utils/ssrf-protection';
 import { CacheService } from './cache';
+import { logger } from '../utils/logger';
 
 // Jellyseerr media status codes
 export enum JellyseerrStatus {
@@ -18,11 +20,11 @@ export enum JellyseerrStatus {
 }
 
 // Statuses that should be filtered out (already requested or available)
-const FILTER_STATUSES = [
+const FILTER_STATUSES: ReadonlySet<number> = new Set([
     JellyseerrStatus.PENDING,
     JellyseerrStatus.PROCESSING,
     JellyseerrStatus.AVAILABLE,
-];
+]);
 
 interface JellyseerrMediaInfo {
     id: number;
@@ -31,6 +33,9 @@ interface JellyseerrMediaInfo {
     tmdbId: number;
 }
 
+// Status checks fire per item; keep a single client until the Jellyseerr settings change
+let cachedClient: { key: string; client: import('axios').AxiosInstance } | null = null;
+
 /**
  * Get Jellyseerr client
  */
@@ -46,12 +51,16 @@ async function getClient(): Promise<import('axios').AxiosInstance | null> {
 
         const base = validateBaseUrl(rawBase);
         const key = rawKey.trim();
+        const cacheKey = `${base}|${key}`;
+        if (cachedClient?.key === cacheKey) return cachedClient.client;
 
-        return axios.create({
+        const client = axios.create({
             baseURL: base,
             headers: { 'X-Api-Key': key },
             timeout: 10000,
         });
+        cachedClient = { key: cacheKey, client };
+        return client;
     } catch (e) {
         console.warn('[Jellyseerr Status] Client creation failed:', (e as Error).message);
         return null;
@@ -85,14 +94,85 @@ export async function getJellyseerrStatus(
             CacheService.set('jellyseerr', cacheKey, null, 300);
             return null;
         }
-        console.debug(`[Jellyseerr Status] Failed to get status for ${mediaType}/${tmdbId}:`, e?.message);
+        logger.debug({ mediaType, tmdbId, err: e?.message }, '[Jellyseerr Status] Failed to get status');
+        return null;
+    }
+}
+
+const MEDIA_PAGE_SIZE = 500;
+const STATUS_CONCURRENCY = 10;
+const MEDIA_INDEX_TTL_SECONDS = 300; // Same freshness as the per-item status cache
+
+type MediaStatusIndex = { movie: Array<[number, number]>; tv: Array<[number, number]> };
+
+// /api/v1/media filter values for each status in FILTER_STATUSES
+const MEDIA_STATUS_FILTERS = ['pending', 'processing', 'available'] as const;
+
+// Lookup maps built from a cached index; while the cache entry lives, repeat batches
+// (recommendations and watchlist checks in the same request) reuse the map as-is
+const statusMapsByEntry = new WeakMap<Array<[number, number]>, ReadonlyMap<number, number>>();
+
+function statusMapFor(entries: Array<[number, number]>): ReadonlyMap<number, number> {
+    let map = statusMapsByEntry.get(entries);
+    if (!map) {
+        map = new Map(entries);
+        statusMapsByEntry.set(entries, map);
+    }
+    return map;
+}
+
+/**
+ * Index the TMDB ids Jellyseerr reports as pending, processing or available, using its
+ * server-side status filters on /api/v1/media so entries we'd keep anyway (unknown,
+ * partially available) are never transferred. A handful of paged calls replaces one
+ * details call per candidate. Returns null when the listing can't be fetched.
+ */
+async function getMediaStatusIndex(mediaType: 'movie' | 'tv'): Promise<ReadonlyMap<number, number> | null> {
+    const cacheKey = 'jellyseerr_media_status_index';
+    const cached = CacheService.get<MediaStatusIndex>('jellyseerr', cacheKey);
+    if (cached) return statusMapFor(cached[mediaType]);
+
+    try {
+        const client = await getClient();
+        if (!client) return null;
+
+        // getOrSet joins a listing already in flight, so movie and TV batches checked in
+        // parallel share one set of paged calls
+        const index = await CacheService.getOrSet<MediaStatusIndex>('jellyseerr', cacheKey, async () => {
+            type MediaPage = { pageInfo?: { results?: number }; results?: JellyseerrMediaInfo[] };
+            const fetchPage = (filter: string, skip: number) => client
+                .get<MediaPage>('/api/v1/media', { params: { filter, take: MEDIA_PAGE_SIZE, skip } })
+                .then(r => r.data);
+
+            const fetchAll = async (filter: string): Promise<MediaPage[]> => {
+                const first = await fetchPage(filter, 0);
+                const total = first.pageInfo?.results ?? 0;
+                const rest: Promise<MediaPage>[] = [];
+                for (let skip = MEDIA_PAGE_SIZE; skip < total; skip += MEDIA_PAGE_SIZE) rest.push(fetchPage(filter, skip));
+                return [first, ...(await Promise.all(rest))];
+            };
+            const pages = (await Promise.all(MEDIA_STATUS_FILTERS.map(fetchAll))).flat();
+
+            const built: MediaStatusIndex = { movie: [], tv: [] };
+            for (const page of pages) {
+                for (const media of page.results || []) {
+                    if (media.mediaType === 'movie' || media.mediaType === 'tv') {
+                        built[media.mediaType].push([Number(media.tmdbId), media.status]);
+                    }
+                }
+            }
+            return built;
+        }, MEDIA_INDEX_TTL_SECONDS);
+        return statusMapFor(index[mediaType]);
+    } catch (e: any) {
+        logger.debug({ err: e?.message }, '[Jellyseerr Status] Media listing unavailable, falling back to per-item lookups');
         return null;
     }
 }
 
 /**
  * Get Jellyseerr statuses for multiple TMDB IDs (batch)
- * Returns Map<tmdbId, status>
+ * Returns Map<tmdbId, status>; ids outside the filtered statuses map to null
  */
 export async function getJellyseerrStatuses(
     tmdbIds: number[],
@@ -100,16 +180,19 @@ export async function getJellyseerrStatuses(
 ): Promise<Map<number, number | null>> {
     const statuses = new Map<number, number | null>();
 
-    // Process in parallel with concurrency limit
-    const BATCH_SIZE = 10;
-    for (let i = 0; i < tmdbIds.length; i += BATCH_SIZE) {
-        const batch = tmdbIds.slice(i, i + BATCH_SIZE);
-        const results = await Promise.all(
-            batch.map(id => getJellyseerrStatus(id, mediaType).then(status => ({ id, status })))
-        );
-        results.forEach(r => statuses.set(r.id, r.status));
+    // Ids missing from the filtered listing are ones filterByJellyseerrStatus keeps
+    const index = await getMediaStatusIndex(mediaType);
+    if (index) {
+        for (const id of tmdbIds) statuses.set(id, index.get(id) ?? null);
+        return statuses;
     }
 
+    // Sliding window of 10 concurrent lookups: a slow response no longer holds up a whole batch
+    const limit = pLimit(STATUS_CONCURRENCY);
+    await Promise.all(tmdbIds.map(id => limit(async () => {
+        statuses.set(id, await getJellyseerrStatus(id, mediaType));
+    })));
+
     return statuses;
 }
 
@@ -129,7 +212,7 @@ export async function filterByJellyseerrStatus<T extends { id: number }>(
     const filtered = items.filter(item => {
         const status = statuses.get(item.id);
         // Keep if no status (never requested) or status not in filter list
-        return status === null || !FILTER_STATUSES.includes(status as JellyseerrStatus);
+        return status === null || !FILTER_STATUSES.has(status as number);
     });
 
     const removedCount = items.length - filtered.length;
@@ -145,5 +228,5 @@ export async function filterByJellyseerrStatus<T extends { id: number }>(
  */
 export function shouldFilterStatus(status: number | null | undefined): boolean {
     if (status === null || status === undefined) return false;
-    return FILTER_STATUSES.includes(status);
+    return FILTER_STATUSES.has(status);
 }
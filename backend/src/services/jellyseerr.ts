@@ -1,5 +1,7 @@
 import axios from 'axios';
+import pLimit from 'p-limit';
 import { CacheService } from './cache';
+import { logger } from '../utils/logger';
 
 
 // NOTE: Do not rely on process.env at module-evaluation time for runtime-configured
@@ -8,6 +10,20 @@ import { CacheService } from './cache';
 
 import ConfigService from './config';
 import { validateBaseUrl } from '../utils/ssrf-protection';
+import { searchByTitle } from './tmdb-discover';
+
+// SSRF-validated base URL without trailing slashes, recomputed only when the configured URL changes
+let resolvedBase: { raw: string; base: string } | null = null;
+
+function jellyseerrBase(rawBase: string): string {
+  if (resolvedBase?.raw !== rawBase) {
+    resolvedBase = { raw: rawBase, base: validateBaseUrl(rawBase).replace(/\/+$/, '') };
+  }
+  return resolvedBase.base;
+}
+
+// One client per base URL + API key; rebuilt only when the configuration changes
+let cachedClient: { key: string; client: import('axios').AxiosInstance } | null = null;
 
 // Create an axios client using runtime configuration (DB values preferred, then env)
 async function getClient(): Promise<import('axios').AxiosInstance> {
@@ -15,10 +31,15 @@ async function getClient(): Promise<import('axios').AxiosInstance> {
   const rawBase = cfg && cfg.jellyseerrUrl ? String(cfg.jellyseerrUrl) : (process.env.JELLYSEERR_URL || '');
   const rawKey = cfg && cfg.jellyseerrApiKey ? String(cfg.jellyseerrApiKey) : (process.env.JELLYSEERR_API_KEY || '');
   // Explicit SSRF validation for baseURL
-  const base = validateBaseUrl(rawBase);
+  const base = jellyseerrBase(rawBase);
   const key = rawKey ? rawKey.trim() : '';
+  const cacheKey = `${base}|${key}`;
+  if (cachedClient?.key === cacheKey) return cachedClient.client;
+
   // Return axios client with validated runtime base URL and sanitized API key header
-  return axios.create({ baseURL: base, headers: { 'X-Api-Key': key }, timeout: 120000 });
+  const client = axios.create({ baseURL: base, headers: { 'X-Api-Key': key }, timeout: 120000 });
+  cachedClient = { key: cacheKey, client };
+  return client;
 }
 
 export type Enriched = {
@@ -34,15 +55,29 @@ export type Enriched = {
   genres?: string[];
 };
 
+// Title normalization patterns, compiled once at module load
+// (a leading "the", then a leading "a", matched in one pass)
+const LEADING_ARTICLES_RE = /^(?:the\s+)?(?:a\s+)?/;
+const NON_ALPHANUMERIC_RE = /[^a-z0-9]/g;
+const MEDIA_TYPES = new Set(['movie', 'tv']);
+
 function normalizeTitle(str: string | undefined): string {
   if (!str) return '';
-  // Lowercase
-  let s = String(str).toLowerCase();
-  // Remove common prefixes
-  s = s.replace(/^the\s+/, '').replace(/^a\s+/, '');
-  // Remove non-alphanumeric characters
-  s = s.replace(/[^a-z0-9]/g, '');
-  return s;
+  // Lowercase, strip a leading "the"/"a" and any non-alphanumeric characters
+  return String(str).toLowerCase().replace(LEADING_ARTICLES_RE, '').replace(NON_ALPHANUMERIC_RE, '');
+}
+
+// Search results revalidated with a 304 are the same cached objects, so each
+// candidate's normalized title is computed once rather than on every lookup
+const normalizedCandidateTitles = new WeakMap<object, string>();
+
+function normalizedCandidateTitle(candidate: any): string {
+  let norm = normalizedCandidateTitles.get(candidate);
+  if (norm === undefined) {
+    norm = normalizeTitle(candidate.title || candidate.name || candidate.originalTitle || candidate.original_name || '');
+    normalizedCandidateTitles.set(candidate, norm);
+  }
+  return norm;
 }
 
 /**
@@ -56,22 +91,68 @@ function strictEncode(str: string): string {
   });
 }
 
-async function constructPosterUrl(partialPath: string | undefined) {
-  if (!partialPath) return undefined;
+type EtagEntry<T> = { etag: string; value: T };
+// Validators outlive the result caches so an expired entry can still be revalidated cheaply
+const ETAG_TTL_SECONDS = 7 * 24 * 60 * 60;
+
+/**
+ * GET `url`, sending If-None-Match when an earlier response's ETag is stored under
+ * `etagKey`. A 304 returns the value derived from that earlier body; otherwise `derive`
+ * maps the fresh body and the result is stored alongside its new ETag.
+ */
+async function conditionalGet<T>(
+  client: import('axios').AxiosInstance,
+  url: string,
+  etagKey: string,
+  derive: (data: any) => T | Promise<T>
+): Promise<T> {
+  const previous = CacheService.get<EtagEntry<T>>('jellyseerr', etagKey);
+  const resp = await client.get(url, {
+    headers: previous ? { 'If-None-Match': previous.etag } : undefined,
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+  });
+  if (resp.status === 304 && previous) return previous.value;
+
+  const value = await derive(resp.data);
+  const etag = resp.headers?.etag;
+  if (etag) CacheService.set('jellyseerr', etagKey, { etag: String(etag), value } as EtagEntry<T>, ETAG_TTL_SECONDS);
+  return value;
+}
+
+// Page 1 of /api/v1/search for an already strict-encoded query
+function fetchSearchResults(client: import('axios').AxiosInstance, encodedQuery: string): Promise<any[]> {
+  return conditionalGet(client, `/api/v1/search?query=${encodedQuery}&page=1`, `search_etag_${encodedQuery}`,
+    data => (Array.isArray(data) ? data : (data?.results || [])));
+}
+
+// Resolve the validated Jellyseerr base URL used for image proxy links
+async function getImageProxyBase(): Promise<string> {
   const cfg = await ConfigService.getConfig();
   const rawBase = cfg.jellyseerrUrl || process.env.JELLYSEERR_URL || '';
   // SSRF Protection: validate base URL
-  const baseUrl = validateBaseUrl(rawBase);
-  return `${baseUrl}/imageproxy/tmdb/t/p/w300_and_h450_face${partialPath}`;
+  return jellyseerrBase(rawBase);
+}
+
+// Jellyseerr image-proxy renditions, appended to the validated base URL
+const POSTER_PROXY_PATH = '/imageproxy/tmdb/t/p/w300_and_h450_face';
+const BACKDROP_PROXY_PATH = '/imageproxy/tmdb/t/p/w1280_and_h720_multi_faces';
+
+function posterUrlFromBase(baseUrl: string, partialPath: string) {
+  return baseUrl + POSTER_PROXY_PATH + partialPath;
+}
+
+function backdropUrlFromBase(baseUrl: string, partialPath: string) {
+  return baseUrl + BACKDROP_PROXY_PATH + partialPath;
+}
+
+async function constructPosterUrl(partialPath: string | undefined) {
+  if (!partialPath) return undefined;
+  return posterUrlFromBase(await getImageProxyBase(), partialPath);
 }
 
 async function constructBackdropUrl(partialPath: string | undefined) {
   if (!partialPath) return undefined;
-  const cfg = await ConfigService.getConfig();
-  const rawBase = cfg.jellyseerrUrl || process.env.JELLYSEERR_URL || '';
-  // SSRF Protection: validate base URL
-  const baseUrl = validateBaseUrl(rawBase);
-  return `${baseUrl}/imageproxy/tmdb/t/p/w1280_and_h720_multi_faces${partialPath}`;
+  return backdropUrlFromBase(await getImageProxyBase(), partialPath);
 }
 
 /**
@@ -95,21 +176,17 @@ export async function searchAndVerify(queryTitle: string, queryYear: string | nu
       console.warn('Jellyseerr not configured; skipping verification', (cfgErr as any)?.message || String(cfgErr));
       return null;
     }
-    const resp = await client.get(`/api/v1/search?query=${encodedQuery}&page=1`);
-    const data = resp.data;
-    const results = Array.isArray(data) ? data : (data.results || []);
+    const results = await fetchSearchResults(client, encodedQuery);
 
+    // Normalized once per query; the candidate loop below only compares
     const normQuery = normalizeTitle(queryTitle);
 
-    // Filter out non-media results (persons, etc.)
-    const candidates = (results || []).filter((c: any) => {
-      const ct = (c.mediaType || c.media_type || c.type || '').toString().toLowerCase();
-      return ct === 'movie' || ct === 'tv';
-    });
-
-    const match = candidates.find((candidate: any) => {
-      const candidateTypeRaw = candidate.mediaType || candidate.media_type || candidate.type || (candidate.isMovie ? 'movie' : candidate.isTv ? 'tv' : undefined);
-      const candidateType = candidateTypeRaw ? String(candidateTypeRaw).toLowerCase() : '';
+    // One pass over the results, cheapest checks first: the title is only normalized for
+    // media results whose type and year already match
+    const match = !normQuery ? undefined : (results || []).find((candidate: any) => {
+      // Skip non-media results (persons, etc.)
+      const candidateType = (candidate.mediaType || candidate.media_type || candidate.type || '').toString().toLowerCase();
+      if (!MEDIA_TYPES.has(candidateType)) return false;
       if (typeStr && candidateType !== typeStr) return false;
 
       // Year check (strict exact)
@@ -118,9 +195,8 @@ export async function searchAndVerify(queryTitle: string, queryYear: string | nu
       if (yearStr && candidateYear !== yearStr) return false;
 
       // Title fuzzy check
-      const candTitle = candidate.title || candidate.name || candidate.originalTitle || candidate.original_name || '';
-      const normCand = normalizeTitle(candTitle);
-      if (!normCand || !normQuery) return false;
+      const normCand = normalizedCandidateTitle(candidate);
+      if (!normCand) return false;
       return normCand.includes(normQuery) || normQuery.includes(normCand);
     });
 
@@ -153,25 +229,15 @@ export async function searchAndVerify(queryTitle: string, queryYear: string | nu
 
       CacheService.set('jellyseerr', cacheKey, enriched);
       // Detailed audit log for verification success
-      try {
-        console.debug(`[Jellyseerr Verify] SUCCESS: Found "${match.title || match.name || title}" | Type: ${match.mediaType || match.media_type || match.type || media_type} | Year: ${match.releaseDate || match.firstAirDate || releaseDate}`);
-      } catch (logErr) {
-        // swallow logging errors
-        console.debug('[Jellyseerr Verify] SUCCESS: (log failed)', logErr);
-      }
+      logger.debug({ title: enriched.title, mediaType: media_type, releaseDate }, '[Jellyseerr Verify] SUCCESS');
       return enriched;
     }
 
     // Audit when no match found
-    try {
-      console.debug(`[Jellyseerr Verify] FAILED: No match found for query "${queryTitle}" (${yearStr})`);
-    } catch (logErr) {
-      console.warn('[Jellyseerr Verify] FAILED: (log failed)', logErr);
-    }
+    logger.debug({ query: queryTitle, year: yearStr }, '[Jellyseerr Verify] FAILED: no match found');
 
     // FALLBACK: Try direct TMDB search if configured
     try {
-      const { searchByTitle } = await import('./tmdb-discover');
       const tmdbResult = await searchByTitle(queryTitle, yearStr || undefined, typeStr as 'movie' | 'tv' | undefined);
 
       if (tmdbResult) {
@@ -186,12 +252,12 @@ export async function searchAndVerify(queryTitle: string, queryYear: string | nu
           releaseDate: tmdbResult.releaseDate,
         };
         CacheService.set('jellyseerr', cacheKey, enriched);
-        console.debug(`[TMDB Fallback] SUCCESS: Found "${tmdbResult.title}" via direct TMDB`);
+        logger.debug({ title: tmdbResult.title }, '[TMDB Fallback] SUCCESS via direct TMDB');
         return enriched;
       }
     } catch (tmdbErr: any) {
       // TMDB fallback failed - continue with null result
-      console.debug('[TMDB Fallback] Skipped:', tmdbErr?.message || 'not configured');
+      logger.debug({ reason: tmdbErr?.message || 'not configured' }, '[TMDB Fallback] Skipped');
     }
 
     CacheService.set('jellyseerr', cacheKey, null);
@@ -216,9 +282,9 @@ export async function search(query: string): Promise<Enriched[]> {
   try {
     // Manually encode the query to guarantee compliance with Jellyseerr's strict URL rules.
     const encodedQuery = strictEncode(String(query));
-    const resp = await client.get(`/api/v1/search?query=${encodedQuery}&page=1`);
-    const data = resp.data;
-    const results = Array.isArray(data) ? data : (data.results || []);
+    const results = await fetchSearchResults(client, encodedQuery);
+    // Resolve the image base once for the whole result set instead of per result
+    const imageBase = await getImageProxyBase();
     const out: Enriched[] = [];
     for (const r of (results || [])) {
       const tmdb_id = r.id || r.tmdbId || r.tmdb_id || r.tmdb || undefined;
@@ -226,8 +292,8 @@ export async function search(query: string): Promise<Enriched[]> {
       const backdropPartial = r.backdropPath || r.backdrop_path || r.backdrop || undefined;
       const voteAverage = r.voteAverage ?? r.vote_average ?? r.rating ?? r.vote;
       const language = r.originalLanguage ?? r.language ?? r.lang;
-      const posterUrl = partialPath ? await constructPosterUrl(partialPath) : undefined;
-      const backdropUrl = backdropPartial ? await constructBackdropUrl(backdropPartial) : undefined;
+      const posterUrl = partialPath ? posterUrlFromBase(imageBase, partialPath) : undefined;
+      const backdropUrl = backdropPartial ? backdropUrlFromBase(imageBase, backdropPartial) : undefined;
       out.push({
         title: r.title || r.name || r.originalTitle || r.original_name || '',
         media_type: (r.mediaType || r.media_type || r.type || (r.isMovie ? 'movie' : r.isTv ? 'tv' : 'movie')) as any,
@@ -272,6 +338,11 @@ export async function searchAndEnrich(title: string, targetMediaType?: string, r
   }
 }
 
+// Title/poster/overview for a TMDB id practically never change; keep hits for a day
+const DETAILS_TTL_SECONDS = 24 * 60 * 60;
+// Detail lookups currently on the wire, keyed like their cache entries
+const detailsInFlight = new Map<string, Promise<Enriched | null>>();
+
 /**
  * Get media details directly by TMDB ID (no search required)
  * @param tmdbId - TMDB ID (numeric)
@@ -285,10 +356,30 @@ export async function getMediaDetails(tmdbId: string | number, mediaType: 'movie
     return null;
   }
 
-  const cacheKey = `jellyseerr_details_${mediaType}_${id}`;
+  const cacheKey = detailsCacheKey(id, mediaType);
   const cached = CacheService.get<Enriched | null>('jellyseerr', cacheKey);
   if (cached !== undefined) return cached;
 
+  // getFullDetails reads the same endpoint; reuse its result instead of a second request
+  const full = CacheService.get<FullMediaDetails>('jellyseerr', fullDetailsCacheKey(id, mediaType));
+  if (full) {
+    const fromFull = toEnriched(full);
+    CacheService.set('jellyseerr', cacheKey, fromFull, DETAILS_TTL_SECONDS);
+    return fromFull;
+  }
+
+  // Fan-outs often ask for the same id concurrently (e.g. a title seeded from two anchors);
+  // join the pending lookup rather than issuing a second request
+  const pending = detailsInFlight.get(cacheKey);
+  if (pending) return pending;
+
+  const lookup = fetchMediaDetails(id, mediaType, cacheKey)
+    .finally(() => detailsInFlight.delete(cacheKey));
+  detailsInFlight.set(cacheKey, lookup);
+  return lookup;
+}
+
+async function fetchMediaDetails(id: number, mediaType: 'movie' | 'tv', cacheKey: string): Promise<Enriched | null> {
   let client;
   try {
     client = await getClient();
@@ -299,44 +390,45 @@ export async function getMediaDetails(tmdbId: string | number, mediaType: 'movie
 
   try {
     const endpoint = mediaType === 'movie' ? `/api/v1/movie/${id}` : `/api/v1/tv/${id}`;
-    const resp = await client.get(endpoint);
-    const data = resp.data;
+    const enriched = await conditionalGet<Enriched | null>(client, endpoint, `details_etag_${mediaType}_${id}`, async (data) => {
+      if (!data) return null;
 
-    if (!data) {
-      CacheService.set('jellyseerr', cacheKey, null);
-      return null;
-    }
+      // Extract genres
+      const genresData = data.genres || [];
+      const genres = (Array.isArray(genresData) ? genresData : [])
+        .map((g: any) => g.name || g)
+        .filter(Boolean);
 
-    // Extract genres
-    const genresData = data.genres || [];
-    const genres = (Array.isArray(genresData) ? genresData : [])
-      .map((g: any) => g.name || g)
-      .filter(Boolean);
+      const partialPath = data.posterPath || data.poster_path || data.poster || undefined;
+      const backdropPartial = data.backdropPath || data.backdrop_path || data.backdrop || undefined;
+      const posterUrl = await constructPosterUrl(partialPath);
+      const backdropUrl = await constructBackdropUrl(backdropPartial);
 
-    const partialPath = data.posterPath || data.poster_path || data.poster || undefined;
-    const backdropPartial = data.backdropPath || data.backdrop_path || data.backdrop || undefined;
-    const posterUrl = await constructPosterUrl(partialPath);
-    const backdropUrl = await constructBackdropUrl(backdropPartial);
+      return {
+        title: data.title || data.name || data.originalTitle || data.original_name || '',
+        media_type: mediaType,
+        tmdb_id: id,
+        posterUrl: posterUrl || undefined,
+        backdropUrl: backdropUrl || undefined,
+        overview: data.overview || data.plot || data.synopsis || undefined,
+        voteAverage: data.voteAverage ?? data.vote_average ?? data.rating ?? undefined,
+        language: data.originalLanguage ?? data.language ?? undefined,
+        releaseDate: data.releaseDate || data.firstAirDate || data.release_date || data.first_air_date || undefined,
+        genres,
+      };
+    });
 
-    const enriched: Enriched = {
-      title: data.title || data.name || data.originalTitle || data.original_name || '',
-      media_type: mediaType,
-      tmdb_id: id,
-      posterUrl: posterUrl || undefined,
-      backdropUrl: backdropUrl || undefined,
-      overview: data.overview || data.plot || data.synopsis || undefined,
-      voteAverage: data.voteAverage ?? data.vote_average ?? data.rating ?? undefined,
-      language: data.originalLanguage ?? data.language ?? undefined,
-      releaseDate: data.releaseDate || data.firstAirDate || data.release_date || data.first_air_date || undefined,
-      genres,
-    };
+    if (!enriched) {
+      CacheService.set('jellyseerr', cacheKey, null);
+      return null;
+    }
 
-    CacheService.set('jellyseerr', cacheKey, enriched);
-    console.debug(`[Jellyseerr] Details fetched for ${mediaType} ${id}: ${enriched.title}`);
+    CacheService.set('jellyseerr', cacheKey, enriched, DETAILS_TTL_SECONDS);
+    logger.debug({ mediaType, tmdbId: id, title: enriched.title }, '[Jellyseerr] Details fetched');
     return enriched;
   } catch (e: any) {
     if (e.response?.status === 404) {
-      console.debug(`[Jellyseerr] Media not found: ${mediaType} ${id}`);
+      logger.debug({ mediaType, tmdbId: id }, '[Jellyseerr] Media not found');
       CacheService.set('jellyseerr', cacheKey, null);
       return null;
     }
@@ -345,7 +437,23 @@ export async function getMediaDetails(tmdbId: string | number, mediaType: 'movie
   }
 }
 
-export async function requestMediaByTmdb(tmdbId: number, mediaType: 'movie' | 'tv' = 'movie'): Promise<any> {
+// Media requests fan out through a shared queue (max 4 in flight); repeated
+// clicks on the same title join the pending request instead of re-posting it.
+const requestLimit = pLimit(4);
+const inFlightRequests = new Map<string, Promise<any>>();
+
+export function requestMediaByTmdb(tmdbId: number, mediaType: 'movie' | 'tv' = 'movie'): Promise<any> {
+  const key = `${mediaType}:${tmdbId}`;
+  const pending = inFlightRequests.get(key);
+  if (pending) return pending;
+
+  const request = requestLimit(() => sendMediaRequest(tmdbId, mediaType))
+    .finally(() => inFlightRequests.delete(key));
+  inFlightRequests.set(key, request);
+  return request;
+}
+
+async function sendMediaRequest(tmdbId: number, mediaType: 'movie' | 'tv'): Promise<any> {
   let client;
   try {
     client = await getClient();
@@ -366,7 +474,7 @@ export async function requestMediaByTmdb(tmdbId: number, mediaType: 'movie' | 't
         if (detailsResp.data && Array.isArray(detailsResp.data.seasons)) {
           // Select all seasons
           payload.seasons = detailsResp.data.seasons.map((s: any) => s.seasonNumber);
-          console.debug(`[Jellyseerr] Auto-selecting seasons for TV ${tmdbId}:`, payload.seasons);
+          logger.debug({ tmdbId, seasons: payload.seasons }, '[Jellyseerr] Auto-selecting seasons for TV');
         }
       } catch (detailsErr) {
         console.warn('[Jellyseerr] Failed to fetch TV details for season auto-selection, sending empty season list:', detailsErr);
@@ -375,10 +483,10 @@ export async function requestMediaByTmdb(tmdbId: number, mediaType: 'movie' | 't
     }
 
     // Debug: avoid logging full request payloads; log minimal identifying fields only
-    console.debug('[Jellyseerr] Sending request payload', { mediaType: payload.mediaType, mediaId: payload.mediaId, seasonsCount: payload.seasons?.length });
+    logger.debug({ mediaType: payload.mediaType, mediaId: payload.mediaId, seasonsCount: payload.seasons?.length }, '[Jellyseerr] Sending request payload');
 
     const resp = await client.post('/api/v1/request', payload);
-    console.debug('[Jellyseerr] Request response:', resp.data);
+    logger.debug({ requestId: resp.data?.id, status: resp.data?.status }, '[Jellyseerr] Request response');
     return resp.data;
   } catch (e: any) {
     console.error('Jellyseerr request error for', tmdbId, e?.response?.data || e.message || e);
@@ -414,7 +522,7 @@ export async function getSimilar(tmdbId: number, mediaType: 'movie' | 'tv'): Pro
     const ids = results.map((r: any) => Number(r.id)).filter((id: number) => Number.isFinite(id) && id > 0);
 
     CacheService.set('jellyseerr', cacheKey, ids);
-    console.debug(`[Jellyseerr] Similar fetched for ${mediaType} ${tmdbId}: ${ids.length} items`);
+    logger.debug({ mediaType, tmdbId, count: ids.length }, '[Jellyseerr] Similar fetched');
     return ids;
   } catch (e: any) {
     console.error(`[Jellyseerr] Error fetching similar for ${mediaType} ${tmdbId}:`, e?.response?.data || e.message || e);
@@ -450,7 +558,7 @@ export async function getRecommendations(tmdbId: number, mediaType: 'movie' | 't
     const ids = results.map((r: any) => Number(r.id)).filter((id: number) => Number.isFinite(id) && id > 0);
 
     CacheService.set('jellyseerr', cacheKey, ids);
-    console.debug(`[Jellyseerr] Recommendations fetched for ${mediaType} ${tmdbId}: ${ids.length} items`);
+    logger.debug({ mediaType, tmdbId, count: ids.length }, '[Jellyseerr] Recommendations fetched');
     return ids;
   } catch (e: any) {
     console.error(`[Jellyseerr] Error fetching recommendations for ${mediaType} ${tmdbId}:`, e?.response?.data || e.message || e);
@@ -486,6 +594,30 @@ export type FullMediaDetails = {
   recommendations: number[];
 };
 
+function fullDetailsCacheKey(tmdbId: number, mediaType: 'movie' | 'tv'): string {
+  return `jellyseerr_fulldetails_${mediaType}_${tmdbId}`;
+}
+
+function detailsCacheKey(tmdbId: number, mediaType: 'movie' | 'tv'): string {
+  return `jellyseerr_details_${mediaType}_${tmdbId}`;
+}
+
+// The getMediaDetails() view of a full-details result
+function toEnriched(full: FullMediaDetails): Enriched {
+  return {
+    title: full.title,
+    media_type: full.media_type,
+    tmdb_id: full.tmdb_id,
+    posterUrl: full.posterUrl,
+    backdropUrl: full.backdropUrl,
+    overview: full.overview,
+    voteAverage: full.voteAverage,
+    language: full.language,
+    releaseDate: full.releaseDate,
+    genres: full.genres,
+  };
+}
+
 /**
  * Get full media details including keywords, credits, similar, and recommendations
  * @param tmdbId - TMDB ID (numeric)
@@ -493,7 +625,7 @@ export type FullMediaDetails = {
  * @returns Full enriched metadata
  */
 export async function getFullDetails(tmdbId: number, mediaType: 'movie' | 'tv'): Promise<FullMediaDetails | null> {
-  const cacheKey = `jellyseerr_fulldetails_${mediaType}_${tmdbId}`;
+  const cacheKey = fullDetailsCacheKey(tmdbId, mediaType);
   const cached = CacheService.get<FullMediaDetails>('jellyseerr', cacheKey);
   if (cached !== undefined) return cached;
 
@@ -570,7 +702,9 @@ export async function getFullDetails(tmdbId: number, mediaType: 'movie' | 'tv'):
     };
 
     CacheService.set('jellyseerr', cacheKey, result);
-    console.debug(`[Jellyseerr] Full details fetched for ${mediaType} ${tmdbId}: ${genres.length} genres, ${keywords.length} keywords, ${topCast.length} cast`);
+    // Seed the basic details cache too, so a later getMediaDetails() for this id is free
+    CacheService.set('jellyseerr', detailsCacheKey(tmdbId, mediaType), toEnriched(result), DETAILS_TTL_SECONDS);
+    logger.debug({ mediaType, tmdbId, genres: genres.length, keywords: keywords.length, cast: topCast.length }, '[Jellyseerr] Full details fetched');
     return result;
   } catch (e: any) {
     console.error(`[Jellyseerr] Error fetching full details for ${mediaType} ${tmdbId}:`, e?.response?.data || e.message || e);
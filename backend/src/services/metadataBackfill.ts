@@ -1,5 +1,5 @@
-import prisma from './data';
-import { searchAndEnrich } from './jellyseerr';
+import prisma, { invalidateWatchlists } from './data';
+import { getMediaDetails } from './jellyseerr';
 
 async function sleep(ms: number) { return new Promise(resolve => setTimeout(resolve, ms)); }
 
@@ -22,19 +22,13 @@ export async function runMetadataBackfill() {
         continue;
       }
 
-      const title = m.title || '';
-      const mediaType = (m.mediaType || 'movie') as any;
-      const year = m.releaseYear || undefined;
+      const mediaType = m.mediaType === 'tv' ? 'tv' : 'movie';
 
-      if (!title) {
-        console.warn(`Skipping media id=${m.id} tmdbId=${m.tmdbId} because title is missing`);
-        skipped++;
-        continue;
-      }
-
-      const enriched = await searchAndEnrich(title, mediaType, year);
+      // Every row already carries its TMDB id: look it up directly instead of re-running a fuzzy
+      // title search, which also reuses details cached by enrichment or earlier lookups
+      const enriched = await getMediaDetails(m.tmdbId, mediaType);
       if (!enriched) {
-        console.debug(`No enrichment found for: ${title} (${year || 'n/a'})`);
+        console.debug(`No enrichment found for: ${m.title || ''} (tmdbId ${m.tmdbId})`);
         skipped++;
         await sleep(150);
         continue;
@@ -54,6 +48,7 @@ export async function runMetadataBackfill() {
       }
 
       await prisma.media.update({ where: { id: m.id }, data: toUpdate });
+      invalidateWatchlists();
       console.info(`Updated media id=${m.id} tmdbId=${m.tmdbId} -> ${Object.keys(toUpdate).join(',')}`);
       updated++;
 
@@ -3,7 +3,7 @@ import { JellyfinService } from '../jellyfin';
 import * as JellyseerrService from './jellyseerr';
 import * as DataService from './data';
 import { extractTmdbIds, normalizeJellyfinItem } from './jellyfin-normalizer';
-import prisma from '../db';
+import { logger } from '../utils/logger';
 
 const jellyfinService = new JellyfinService();
 
@@ -58,8 +58,12 @@ export async function syncHistory(
       return result;
     }
 
-    // Step 2: Get existing user data to check what's already in DB
-    const existingData = await DataService.getUserData(username);
+    // Step 2: Get existing user data to check what's already in DB.
+    // The user row is resolved once here rather than upserted again for every saved item.
+    const [existingData, user] = await Promise.all([
+      DataService.getUserData(username),
+      DataService.ensureUser(username),
+    ]);
     const existingWatchedSet = new Set(existingData.watchedIds);
     console.log(`[Sync] Found ${existingWatchedSet.size} existing watched items in database`);
 
@@ -67,6 +71,9 @@ export async function syncHistory(
     // p-limit replaces the per-item 100ms sleep: requests are throttled by
     // concurrency, not by artificial delay, so large syncs are significantly faster.
     const limit = pLimit(5);
+    // Per-item trace goes through pino so it is dropped (unformatted) below LOG_LEVEL=debug;
+    // already-synced items — the bulk of every run — are only counted and summarised once.
+    let alreadySynced = 0;
 
     await Promise.all(history.map(item => limit(async () => {
       try {
@@ -74,21 +81,21 @@ export async function syncHistory(
         const tmdbRaw = item.ProviderIds?.Tmdb ?? item.ProviderIds?.tmdb ?? null;
 
         if (!tmdbRaw) {
-          console.debug(`[Sync] Skipping "${item.Name}" - no TMDB ID`);
+          logger.debug({ name: item.Name }, '[Sync] Skipping item without TMDB ID');
           result.skipped++;
           return;
         }
 
         const tmdbId = Number(tmdbRaw);
         if (!Number.isFinite(tmdbId) || tmdbId <= 0) {
-          console.debug(`[Sync] Skipping "${item.Name}" - invalid TMDB ID: ${tmdbRaw}`);
+          logger.debug({ name: item.Name, tmdbRaw }, '[Sync] Skipping item with invalid TMDB ID');
           result.skipped++;
           return;
         }
 
         // Check if already in database
         if (existingWatchedSet.has(tmdbId)) {
-          console.debug(`[Sync] Skipping TMDB ${tmdbId} "${item.Name}" - already in database`);
+          alreadySynced++;
           result.skipped++;
           return;
         }
@@ -97,7 +104,7 @@ export async function syncHistory(
         const jellyfinType = item.Type?.toLowerCase() || 'movie';
         const mediaType = jellyfinType === 'series' ? 'tv' : 'movie';
 
-        console.log(`[Sync] Processing new item: "${item.Name}" (TMDB: ${tmdbId}, Type: ${mediaType})`);
+        logger.debug({ name: item.Name, tmdbId, mediaType }, '[Sync] Processing new item');
 
         // Step 4: Enrich with Jellyseerr metadata
         const enriched = await JellyseerrService.getMediaDetails(tmdbId, mediaType);
@@ -108,9 +115,9 @@ export async function syncHistory(
           // Fallback: use Jellyfin data if enrichment fails
           const normalized = normalizeJellyfinItem(item);
           if (normalized && normalized.tmdbId) {
-            await DataService.updateMediaStatus(username, normalized, 'WATCHED');
+            await DataService.updateMediaStatus(username, normalized, 'WATCHED', undefined, user.id);
             result.new++;
-            console.log(`[Sync] Saved "${item.Name}" with Jellyfin metadata only`);
+            logger.debug({ name: item.Name }, '[Sync] Saved with Jellyfin metadata only');
           } else {
             result.failed++;
             result.errors.push(`No TMDB ID for "${item.Name}"`);
@@ -131,9 +138,9 @@ export async function syncHistory(
           language: enriched.language || null,
         };
 
-        await DataService.updateMediaStatus(username, itemToSave, 'WATCHED');
+        await DataService.updateMediaStatus(username, itemToSave, 'WATCHED', undefined, user.id);
         result.new++;
-        console.log(`[Sync] ✓ Saved "${enriched.title}" (TMDB: ${tmdbId})`);
+        logger.debug({ title: enriched.title, tmdbId }, '[Sync] Saved');
 
       } catch (itemError: any) {
         result.failed++;
@@ -143,7 +150,7 @@ export async function syncHistory(
       }
     })));
 
-    console.log(`[Sync] Complete: ${result.new} new, ${result.skipped} skipped, ${result.failed} failed`);
+    console.log(`[Sync] Complete: ${result.new} new, ${result.skipped} skipped (${alreadySynced} already in database), ${result.failed} failed`);
     return result;
 
   } catch (error: any) {
@@ -158,17 +165,11 @@ export async function syncHistory(
  */
 export async function getSyncStats(username: string): Promise<{ dbWatched: number; dbTotal: number }> {
   try {
-    const user = await prisma.user.findUnique({
-      where: { username },
-      include: { userMedia: { include: { media: true } } },
-    });
+    // Counts come from the cached status snapshot rather than loading every row with its media
+    const { watchedIds, watchlistIds, blockedIds } = await DataService.getUserData(username);
 
-    if (!user) {
-      return { dbWatched: 0, dbTotal: 0 };
-    }
-
-    const dbWatched = user.userMedia.filter((um: any) => um.status === 'WATCHED').length;
-    const dbTotal = user.userMedia.length;
+    const dbWatched = watchedIds.length;
+    const dbTotal = watchedIds.length + watchlistIds.length + blockedIds.length;
 
     return { dbWatched, dbTotal };
   } catch (error) {
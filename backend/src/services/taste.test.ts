@@ -0,0 +1,68 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const { prismaMock, summarizeProfile, cacheStore } = vi.hoisted(() => ({
+  prismaMock: {
+    user: { findUnique: vi.fn(), upsert: vi.fn() },
+    userMedia: { findMany: vi.fn() },
+  },
+  summarizeProfile: vi.fn(),
+  cacheStore: new Map<string, unknown>(),
+}));
+
+vi.mock('./data', () => ({ default: prismaMock }));
+vi.mock('../jellyfin', () => ({ JellyfinService: class { getUserHistory = vi.fn(); } }));
+vi.mock('./gemini', () => ({ GeminiService: { summarizeProfile } }));
+vi.mock('./cache', () => ({
+  CacheService: {
+    get: (ns: string, key: string) => cacheStore.get(`${ns}:${key}`),
+    set: (ns: string, key: string, value: unknown) => { cacheStore.set(`${ns}:${key}`, value); },
+  },
+}));
+
+import { TasteService } from './taste';
+
+const watchlist = ['Arrival', 'Blade Runner 2049', 'Dune'].map((title, i) => ({
+  media: { title, releaseYear: String(2016 + i) },
+}));
+
+describe('TasteService.updateProfile', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    cacheStore.clear();
+    prismaMock.userMedia.findMany.mockResolvedValue(watchlist);
+    prismaMock.user.upsert.mockResolvedValue({});
+  });
+
+  it('skips Gemini when the seed is unchanged and returns the stored profile', async () => {
+    summarizeProfile.mockResolvedValue('Cerebral science fiction');
+    await TasteService.updateProfile('alice', 'movie');
+    expect(summarizeProfile).toHaveBeenCalledTimes(1);
+
+    prismaMock.user.findUnique.mockResolvedValue({ username: 'alice', movieProfile: 'Cerebral science fiction' });
+    const result = await TasteService.updateProfile('alice', 'movie');
+
+    expect(summarizeProfile).toHaveBeenCalledTimes(1);
+    expect(prismaMock.user.upsert).toHaveBeenCalledTimes(1);
+    expect(result).toBe('Cerebral science fiction');
+  });
+
+  it('regenerates when the seed changes', async () => {
+    summarizeProfile.mockResolvedValue('Cerebral science fiction');
+    await TasteService.updateProfile('alice', 'movie');
+
+    prismaMock.userMedia.findMany.mockResolvedValue([...watchlist, { media: { title: 'Interstellar', releaseYear: '2014' } }]);
+    await TasteService.updateProfile('alice', 'movie');
+
+    expect(summarizeProfile).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not store the fingerprint when the summary is empty', async () => {
+    summarizeProfile.mockResolvedValueOnce('').mockResolvedValueOnce('Cerebral science fiction');
+
+    await TasteService.updateProfile('alice', 'movie');
+    const retried = await TasteService.updateProfile('alice', 'movie');
+
+    expect(summarizeProfile).toHaveBeenCalledTimes(2);
+    expect(retried).toBe('Cerebral science fiction');
+  });
+});
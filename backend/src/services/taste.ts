@@ -1,9 +1,21 @@
+import crypto from 'crypto';
 import prisma from './data';
 import { JellyfinService } from '../jellyfin';
 import { GeminiService } from './gemini';
+import { CacheService } from './cache';
 
 const jellyfin = new JellyfinService();
 
+// Fingerprint of the titles a profile was generated from; identical input means an identical
+// prompt, so the Gemini call and the user write can be skipped
+function seedFingerprint(seed: any[]): string {
+  const hash = crypto.createHash('sha1');
+  for (const s of seed) {
+    hash.update(`${s?.Name ?? s?.title ?? ''}|${s?.ProductionYear ?? s?.release_year ?? ''}\n`);
+  }
+  return hash.digest('hex');
+}
+
 export const TasteService = {
   async getProfile(username: string, type: 'movie' | 'tv') {
     if (!username) return '';
@@ -44,6 +56,12 @@ export const TasteService = {
 
     // Ask Gemini to generate a compact taste summary (only if enough data)
     if (seed && seed.length >= 3) {
+      const fingerprintKey = `seed_${username}_${type}`;
+      const fingerprint = seedFingerprint(seed);
+      if (CacheService.get<string>('taste', fingerprintKey) === fingerprint) {
+        console.debug(`[TasteService] Watch history unchanged for ${username} (${type}); keeping current profile`);
+        return this.getProfile(username, type);
+      }
       try {
         const summary = await GeminiService.summarizeProfile(username, seed, type);
         if (typeof summary === 'string') {
@@ -51,6 +69,8 @@ export const TasteService = {
           if (type === 'tv') data.tvProfile = summary;
           else data.movieProfile = summary;
           await prisma.user.upsert({ where: { username }, create: { username, ...data }, update: data });
+          // An empty summary means generation failed; leave the next request free to retry
+          if (summary) CacheService.set('taste', fingerprintKey, fingerprint);
           return summary;
         }
       } catch (e) {
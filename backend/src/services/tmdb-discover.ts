@@ -8,6 +8,10 @@ import ConfigService from './config';
 import { validateBaseUrl } from '../utils/ssrf-protection';
 import { CacheService } from './cache';
 
+// Public TMDB image CDN prefixes; callers append a poster_path/backdrop_path
+export const TMDB_POSTER_URL_PREFIX = 'https://image.tmdb.org/t/p/w500';
+export const TMDB_BACKDROP_URL_PREFIX = 'https://image.tmdb.org/t/p/w780';
+
 interface DiscoverParams {
     with_genres?: string;           // comma (AND) or pipe (OR) separated
     with_keywords?: string;         // keyword IDs
@@ -66,15 +70,24 @@ interface KeywordSearchResult {
 
 
 // Create axios client for either Direct TMDB or Jellyseerr (proxy)
+// Direct TMDB client, kept until the API key changes so its HTTP/2 session is reused
+let cachedTmdbClient: { apiKey: string; client: import('axios').AxiosInstance } | null = null;
+
 async function getClient(): Promise<{ client: import('axios').AxiosInstance; type: 'tmdb' | 'jellyseerr' }> {
     const cfg = await ConfigService.getConfig();
 
     // Priority 1: Direct TMDB API (if configured)
     if (cfg.tmdbApiKey && cfg.tmdbApiKey.length > 5) {
+        if (cachedTmdbClient?.apiKey === cfg.tmdbApiKey) {
+            return { client: cachedTmdbClient.client, type: 'tmdb' };
+        }
+
         const isBearer = cfg.tmdbApiKey.length > 60; // Read Access Tokens are usually very long JWTs
         const config: import('axios').CreateAxiosDefaults = {
             baseURL: 'https://api.themoviedb.org/3',
-            timeout: 15000
+            timeout: 15000,
+            // TMDB serves HTTP/2: discover page fan-outs multiplex over one TLS connection
+            httpVersion: 2,
         };
 
         if (isBearer) {
@@ -83,10 +96,9 @@ async function getClient(): Promise<{ client: import('axios').AxiosInstance; typ
             config.params = { api_key: cfg.tmdbApiKey };
         }
 
-        return {
-            client: axios.create(config),
-            type: 'tmdb'
-        };
+        const client = axios.create(config);
+        cachedTmdbClient = { apiKey: cfg.tmdbApiKey, client };
+        return { client, type: 'tmdb' };
     }
 
     // Priority 2: Jellyseerr Proxy
@@ -205,31 +217,37 @@ export async function discoverTV(params: DiscoverParams, pages: number = 3): Pro
  * Used to convert Gemini's keyword suggestions to TMDB keyword IDs
  */
 export async function searchKeyword(query: string): Promise<number | null> {
-    const cacheKey = `keyword_${query.toLowerCase()}`;
-    const cached = CacheService.get<number | null>('tmdb', cacheKey);
-    if (cached !== undefined) return cached;
+    // One cache entry per normalized name, so "Dystopia" and " dystopia" share a lookup,
+    // and concurrent runs asking for the same keyword join a single request
+    const normalized = query.trim().toLowerCase();
+    if (!normalized) return null;
+
+    try {
+        return await CacheService.getOrSet('tmdb', `keyword_${normalized}`, () => fetchKeywordId(normalized), 86400); // Cache 24 hours
+    } catch {
+        return null;
+    }
+}
 
+// Failures are thrown rather than returned as null so they are not cached
+async function fetchKeywordId(normalized: string): Promise<number | null> {
     const { client, type } = await getClient();
     const endpoint = type === 'tmdb' ? '/search/keyword' : '/api/v1/search/keyword';
 
     try {
         const response = await client.get<{ results: KeywordSearchResult[] }>(endpoint, {
-            params: { query: query.trim() }
+            params: { query: normalized }
         });
 
         if (response.data?.results && response.data.results.length > 0) {
             // Return exact match or first result
-            const exact = response.data.results.find(r => r.name.toLowerCase() === query.toLowerCase());
-            const id = exact?.id || response.data.results[0].id;
-            CacheService.set('tmdb', cacheKey, id, 86400); // Cache 24 hours
-            return id;
+            const exact = response.data.results.find(r => r.name.toLowerCase() === normalized);
+            return exact?.id || response.data.results[0].id;
         }
-
-        CacheService.set('tmdb', cacheKey, null, 86400);
         return null;
     } catch (error: any) {
-        console.error(`[TMDB Discover] Keyword search failed for "${query}" (${type}):`, error?.message || error);
-        return null;
+        console.error(`[TMDB Discover] Keyword search failed for "${normalized}" (${type}):`, error?.message || error);
+        throw error;
     }
 }
 
@@ -287,29 +305,30 @@ export async function searchByTitle(
             return null;
         }
 
-        // Filter by media type if specified
-        let results = response.data.results.filter(r =>
-            r.media_type === 'movie' || r.media_type === 'tv'
-        );
+        // Single pass: take the first title+year match, remembering the first
+        // media result of the right type as a fallback (persons etc. are skipped)
+        const normalizedQuery = query.toLowerCase().trim();
+        let firstMedia: any = null;
+        let bestMatch: any = null;
+        for (const r of response.data.results) {
+            if (r.media_type !== 'movie' && r.media_type !== 'tv') continue;
+            if (mediaType && r.media_type !== mediaType) continue;
+            if (!firstMedia) firstMedia = r;
 
-        if (mediaType) {
-            results = results.filter(r => r.media_type === mediaType);
+            const title = (r.title || r.name || '').toLowerCase().trim();
+            const titleMatch = title === normalizedQuery || title.includes(normalizedQuery);
+            if (!titleMatch) continue;
+            if (!year || (r.release_date || r.first_air_date || '').substring(0, 4) === year) {
+                bestMatch = r;
+                break;
+            }
         }
+        bestMatch = bestMatch || firstMedia;
 
-        if (results.length === 0) {
+        if (!bestMatch) {
             return null;
         }
 
-        // Find best match (exact title + year match if possible)
-        const normalizedQuery = query.toLowerCase().trim();
-        const bestMatch = results.find(r => {
-            const title = (r.title || r.name || '').toLowerCase().trim();
-            const releaseYear = (r.release_date || r.first_air_date || '').substring(0, 4);
-            const titleMatch = title === normalizedQuery || title.includes(normalizedQuery);
-            const yearMatch = !year || releaseYear === year;
-            return titleMatch && yearMatch;
-        }) || results[0];
-
         const posterPath = bestMatch.poster_path;
         const backdropPath = bestMatch.backdrop_path;
 
@@ -320,8 +339,8 @@ export async function searchByTitle(
             title: bestMatch.title || bestMatch.name,
             media_type: bestMatch.media_type,
             overview: bestMatch.overview,
-            posterUrl: posterPath ? `https://image.tmdb.org/t/p/w500${posterPath}` : undefined,
-            backdropUrl: backdropPath ? `https://image.tmdb.org/t/p/w780${backdropPath}` : undefined,
+            posterUrl: posterPath ? TMDB_POSTER_URL_PREFIX + posterPath : undefined,
+            backdropUrl: backdropPath ? TMDB_BACKDROP_URL_PREFIX + backdropPath : undefined,
             voteAverage: bestMatch.vote_average,
             releaseDate: bestMatch.release_date || bestMatch.first_air_date,
         };
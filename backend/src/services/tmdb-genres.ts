@@ -52,9 +52,25 @@ export const TV_GENRES: Record<string, number> = {
     'western': 37,
 };
 
-// Reverse maps for ID -> Name lookup
-const MOVIE_GENRES_REV: Record<number, string> = Object.entries(MOVIE_GENRES).reduce((acc, [k, v]) => ({ ...acc, [v]: k }), {} as Record<number, string>);
-const TV_GENRES_REV: Record<number, string> = Object.entries(TV_GENRES).reduce((acc, [k, v]) => ({ ...acc, [v]: k }), {} as Record<number, string>);
+// Capitalize words (e.g. "science fiction" -> "Science Fiction")
+function toDisplayName(name: string): string {
+    return name.split(' ')
+        .map((w: string) => w.charAt(0).toUpperCase() + w.slice(1))
+        .join(' ');
+}
+
+// Reverse maps for ID -> display name lookup, built once at module load.
+// When several names share an ID the last entry wins.
+function buildReverseMap(genres: Record<string, number>): Map<number, string> {
+    const rev = new Map<number, string>();
+    for (const [name, id] of Object.entries(genres)) {
+        rev.set(id, toDisplayName(name));
+    }
+    return rev;
+}
+
+const MOVIE_GENRES_REV = buildReverseMap(MOVIE_GENRES);
+const TV_GENRES_REV = buildReverseMap(TV_GENRES);
 
 /**
  * Convert genre names to TMDB IDs
@@ -86,11 +102,5 @@ export function getGenreId(name: string, type: 'movie' | 'tv'): number | null {
  */
 export function getGenreName(id: number, type: 'movie' | 'tv'): string | null {
     const map = type === 'movie' ? MOVIE_GENRES_REV : TV_GENRES_REV;
-    const name = map[id];
-    if (!name) return null;
-
-    // Capitalize words
-    return name.split(' ')
-        .map((w: string) => w.charAt(0).toUpperCase() + w.slice(1))
-        .join(' ');
+    return map.get(id) ?? null;
 }
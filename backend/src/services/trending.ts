@@ -3,7 +3,7 @@ import axios from 'axios';
 import ConfigService from './config';
 import { validateBaseUrl } from '../utils/ssrf-protection';
 import { filterByJellyseerrStatus } from './jellyseerr-status';
-import { prisma } from '../db';
+import { getTrackedIds } from './data';
 import { CacheService } from './cache';
 import { getGenreName } from './tmdb-genres';
 
@@ -85,28 +85,29 @@ export class TrendingService {
 
         for (let page = 1; page <= PAGES_TO_FETCH; page++) {
             pagePromises.push(
-                client.get(`/api/v1/discover/trending?page=${page}`)
-                    .then(res => res)
+                client.get('/api/v1/discover/trending', { params: { page } })
                     .catch(() => ({ data: { results: [] } }))
             );
         }
 
-        const responses = await Promise.all(pagePromises);
-
-        // Collect all results
-        let allMovies: any[] = [];
-        let allTvShows: any[] = [];
-
-        responses.forEach((res) => {
-            const items = res.data?.results || [];
-            items.forEach((item: any) => {
-                if (item.mediaType === 'movie') {
-                    allMovies.push(item);
-                } else if (item.mediaType === 'tv') {
-                    allTvShows.push(item);
-                }
-            });
-        });
+        // The user's tracked ids come from the cached status snapshot, fetched alongside the pages
+        const [responses, excludedTmdbIds] = await Promise.all([
+            Promise.all(pagePromises),
+            getTrackedIds(username),
+        ]);
+
+        // Collect all results, routing each item to its bucket with one lookup (people etc. are dropped).
+        // Items the user already has are dropped here, before any of them is mapped.
+        const allMovies: any[] = [];
+        const allTvShows: any[] = [];
+        const buckets = new Map<string, any[]>([['movie', allMovies], ['tv', allTvShows]]);
+
+        for (const res of responses) {
+            for (const item of res.data?.results || []) {
+                if (excludedTmdbIds.has(item.id)) continue;
+                buckets.get(item.mediaType)?.push(item);
+            }
+        }
 
         // Map to TrendingItem
         const rawMovies: TrendingItem[] = allMovies.map((m: any) => ({
@@ -135,30 +136,10 @@ export class TrendingService {
             genres: (t.genreIds || t.genre_ids || []).map((id: number) => getGenreName(id, 'tv')).filter(Boolean),
         }));
 
-        // Get user's excluded TMDB IDs from database
-        const user = await prisma.user.findFirst({ where: { username } });
-        if (!user) {
-            throw new Error('User not found');
-        }
-
-        const userMedia = await prisma.userMedia.findMany({
-            where: { userId: user.id },
-            include: { media: { select: { tmdbId: true } } },
-        });
-        const excludedTmdbIds = new Set(userMedia.map(um => um.media.tmdbId));
-
-        // Initial simple filter (DB only)
-        const filterByDb = (item: TrendingItem): boolean => {
-            return !excludedTmdbIds.has(item.id);
-        };
-
-        let movies = rawMovies.filter(filterByDb);
-        let tvShows = rawTvShows.filter(filterByDb);
-
         // Deep filter by Jellyseerr status
         const [filteredMovies, filteredTvShows] = await Promise.all([
-            filterByJellyseerrStatus(movies, 'movie'),
-            filterByJellyseerrStatus(tvShows, 'tv')
+            filterByJellyseerrStatus(rawMovies, 'movie'),
+            filterByJellyseerrStatus(rawTvShows, 'tv')
         ]);
 
         const result = { movies: filteredMovies, tvShows: filteredTvShows };
@@ -0,0 +1,67 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+vi.mock('../db', () => ({ default: {} }));
+vi.mock('./gemini', () => ({ GeminiService: {} }));
+vi.mock('./tmdb-genres', () => ({ genreNamesToIds: vi.fn(), getGenreName: vi.fn() }));
+vi.mock('./tmdb-discover', () => ({
+  discoverMovies: vi.fn(),
+  discoverTV: vi.fn(),
+  keywordNamesToIds: vi.fn(),
+  TMDB_POSTER_URL_PREFIX: 'https://image.tmdb.org/t/p/w500',
+}));
+vi.mock('./jellyseerr-status', () => ({ filterByJellyseerrStatus: vi.fn() }));
+
+import { parsedLists, toWeeklyWatchlist } from './weekly-watchlist';
+
+function storedRow(overrides: Partial<{ id: number; userId: number; generatedAt: Date; movies: string }> = {}) {
+  return {
+    id: 1,
+    userId: 7,
+    movies: JSON.stringify([{ tmdbId: 550, title: 'Fight Club', posterUrl: null, overview: '' }]),
+    tvShows: '[]',
+    tasteProfile: 'Dark dramas',
+    generatedAt: new Date('2025-01-06T03:00:00Z'),
+    weekStart: new Date('2025-01-06T00:00:00Z'),
+    weekEnd: new Date('2025-01-12T23:59:59Z'),
+    ...overrides,
+  };
+}
+
+describe('toWeeklyWatchlist', () => {
+  beforeEach(() => {
+    parsedLists.clear();
+  });
+
+  it('reuses the parsed lists for an unchanged row', () => {
+    const first = toWeeklyWatchlist(storedRow());
+    const second = toWeeklyWatchlist(storedRow());
+    expect(second.movies).toBe(first.movies);
+    expect(second.movies[0].tmdbId).toBe(550);
+  });
+
+  it('replaces the entry for a user when a newer generation arrives', () => {
+    toWeeklyWatchlist(storedRow());
+    const next = toWeeklyWatchlist(storedRow({
+      id: 2,
+      generatedAt: new Date('2025-01-13T03:00:00Z'),
+      movies: JSON.stringify([{ tmdbId: 603, title: 'The Matrix', posterUrl: null, overview: '' }]),
+    }));
+
+    expect(parsedLists.size).toBe(1);
+    expect(parsedLists.get(7)?.rowId).toBe(2);
+    expect(next.movies[0].tmdbId).toBe(603);
+  });
+
+  it('re-parses a regenerated row with the same id', () => {
+    const first = toWeeklyWatchlist(storedRow());
+    const regenerated = toWeeklyWatchlist(storedRow({ generatedAt: new Date('2025-01-07T03:00:00Z') }));
+    expect(regenerated.movies).not.toBe(first.movies);
+    expect(parsedLists.size).toBe(1);
+  });
+
+  it('keeps one entry per user', () => {
+    toWeeklyWatchlist(storedRow());
+    toWeeklyWatchlist(storedRow({ id: 3, userId: 8 }));
+    expect(parsedLists.size).toBe(2);
+  });
+});
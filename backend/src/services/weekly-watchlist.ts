@@ -10,7 +10,8 @@
 import prisma from '../db';
 import { GeminiService } from './gemini';
 import { genreNamesToIds, getGenreName } from './tmdb-genres';
-import { discoverMovies, discoverTV, keywordNamesToIds, TMDBMovie, TMDBTV } from './tmdb-discover';
+import { discoverMovies, discoverTV, keywordNamesToIds, TMDBMovie, TMDBTV, TMDB_POSTER_URL_PREFIX } from './tmdb-discover';
+import { filterByJellyseerrStatus } from './jellyseerr-status';
 
 interface WatchlistItem {
     tmdbId: number;
@@ -42,16 +43,73 @@ function getWeekStart(): Date {
 }
 
 /**
- * Get the end of the current week (Sunday 23:59)
+ * Get the end of the week starting at `weekStart` (Sunday 23:59)
  */
-function getWeekEnd(): Date {
-    const weekStart = getWeekStart();
+function getWeekEnd(weekStart: Date = getWeekStart()): Date {
     const sunday = new Date(weekStart);
     sunday.setDate(sunday.getDate() + 6);
     sunday.setHours(23, 59, 59, 999);
     return sunday;
 }
 
+/**
+ * Index discover candidates by id and by lowercased title/original title.
+ * Titles are lowercased once per candidate; the first candidate wins a title,
+ * matching the order a linear find() would return.
+ */
+function indexCandidates<T extends { id: number }>(candidates: T[], titlesOf: (c: T) => Array<string | undefined>) {
+    const byId = new Map<number, T>();
+    const byTitle = new Map<string, T>();
+    for (const c of candidates) {
+        if (!byId.has(c.id)) byId.set(c.id, c);
+        for (const t of titlesOf(c)) {
+            if (!t) continue;
+            const key = t.toLowerCase();
+            if (!byTitle.has(key)) byTitle.set(key, c);
+        }
+    }
+    return { byId, byTitle };
+}
+
+// Parsed movies/tvShows of each user's latest stored watchlist. The page and its status badge
+// both read the list on every visit, but a row only changes when it is regenerated (new
+// generatedAt), so the JSON columns are parsed once per generation. Keyed by user so older
+// weeks are replaced rather than kept in memory; exported for tests.
+export const parsedLists = new Map<number, { rowId: number; generatedAt: number; movies: WatchlistItem[]; tvShows: WatchlistItem[] }>();
+
+type StoredWeeklyWatchlist = {
+    id: number;
+    userId: number;
+    movies: string;
+    tvShows: string;
+    tasteProfile: string;
+    generatedAt: Date;
+    weekStart: Date;
+    weekEnd: Date;
+};
+
+export function toWeeklyWatchlist(row: StoredWeeklyWatchlist) {
+    let parsed = parsedLists.get(row.userId);
+    if (!parsed || parsed.rowId !== row.id || parsed.generatedAt !== row.generatedAt.getTime()) {
+        parsed = {
+            rowId: row.id,
+            generatedAt: row.generatedAt.getTime(),
+            movies: JSON.parse(row.movies),
+            tvShows: JSON.parse(row.tvShows),
+        };
+        parsedLists.set(row.userId, parsed);
+    }
+    return {
+        id: row.id,
+        movies: parsed.movies,
+        tvShows: parsed.tvShows,
+        tasteProfile: row.tasteProfile,
+        generatedAt: row.generatedAt,
+        weekStart: row.weekStart,
+        weekEnd: row.weekEnd,
+    };
+}
+
 export class WeeklyWatchlistService {
 
     /**
@@ -85,15 +143,7 @@ export class WeeklyWatchlistService {
             });
             if (!newWatchlist) return null;
 
-            return {
-                id: newWatchlist.id,
-                movies: JSON.parse(newWatchlist.movies),
-                tvShows: JSON.parse(newWatchlist.tvShows),
-                tasteProfile: newWatchlist.tasteProfile,
-                generatedAt: newWatchlist.generatedAt,
-                weekStart: newWatchlist.weekStart,
-                weekEnd: newWatchlist.weekEnd,
-            };
+            return toWeeklyWatchlist(newWatchlist);
         }
 
         // Check if watchlist is older than 7 days
@@ -109,27 +159,11 @@ export class WeeklyWatchlistService {
             });
             if (!newWatchlist) return null;
 
-            return {
-                id: newWatchlist.id,
-                movies: JSON.parse(newWatchlist.movies),
-                tvShows: JSON.parse(newWatchlist.tvShows),
-                tasteProfile: newWatchlist.tasteProfile,
-                generatedAt: newWatchlist.generatedAt,
-                weekStart: newWatchlist.weekStart,
-                weekEnd: newWatchlist.weekEnd,
-            };
+            return toWeeklyWatchlist(newWatchlist);
         }
 
         console.log(`[Weekly Watchlist] Found existing watchlist for user ${userId} (${daysSinceGeneration.toFixed(1)} days old)`);
-        return {
-            id: watchlist.id,
-            movies: JSON.parse(watchlist.movies),
-            tvShows: JSON.parse(watchlist.tvShows),
-            tasteProfile: watchlist.tasteProfile,
-            generatedAt: watchlist.generatedAt,
-            weekStart: watchlist.weekStart,
-            weekEnd: watchlist.weekEnd,
-        };
+        return toWeeklyWatchlist(watchlist);
     }
 
     /**
@@ -138,13 +172,25 @@ export class WeeklyWatchlistService {
     static async generateForUser(userId: number): Promise<GenerationResult> {
         console.log(`[Weekly Watchlist] Generating for user ${userId}`);
 
-        // 1. Get user's complete watch history
-        // 0. Get global exclusion list (Watched + Watchlist + Blocked)
+        // 0. Get global exclusion list (Watched + Watchlist + Blocked). The same rows carry the
+        // blocklist for the Critic agent, split out by status in one pass instead of a second query.
         const allUserMedia = await prisma.userMedia.findMany({
             where: { userId },
-            select: { media: { select: { tmdbId: true } } }
+            select: { status: true, media: { select: { tmdbId: true, title: true, genres: true } } }
         });
-        const excludedTmdbIds = new Set(allUserMedia.map(um => um.media.tmdbId));
+        const excludedTmdbIds = new Set<number>();
+        const blocklist = new Set<number>();
+        const blocklistItems: Array<{ title: string; genres: string[] }> = [];
+        for (const um of allUserMedia) {
+            excludedTmdbIds.add(um.media.tmdbId);
+            if (um.status === 'BLOCKED') {
+                blocklist.add(um.media.tmdbId);
+                blocklistItems.push({
+                    title: um.media.title,
+                    genres: um.media.genres ? JSON.parse(um.media.genres) as string[] : [],
+                });
+            }
+        }
 
         // 1. Get user's watch history + watchlist for taste analysis
         // Fetch all enriched items, sample SEPARATELY for movies and TV
@@ -204,26 +250,18 @@ export class WeeklyWatchlistService {
         let tvCandidates = await this.fetchCandidates(tvTaste, 'tv', excludedTmdbIds);
 
         // 3b. Filter out items already requested in Jellyseerr (status 2/3/5)
-        const { filterByJellyseerrStatus } = await import('./jellyseerr-status');
         const movieCandidatesBeforeJellyseerr = movieCandidates.length;
         const tvCandidatesBeforeJellyseerr = tvCandidates.length;
 
-        movieCandidates = await filterByJellyseerrStatus(movieCandidates, 'movie');
-        tvCandidates = await filterByJellyseerrStatus(tvCandidates, 'tv');
+        [movieCandidates, tvCandidates] = await Promise.all([
+            filterByJellyseerrStatus(movieCandidates, 'movie'),
+            filterByJellyseerrStatus(tvCandidates, 'tv'),
+        ]);
 
         console.log(`[Weekly Watchlist] Jellyseerr filter: ${movieCandidatesBeforeJellyseerr} → ${movieCandidates.length} movies, ${tvCandidatesBeforeJellyseerr} → ${tvCandidates.length} TV`);
 
-        // Get blocklist with metadata for Critic agent
-        const blockedMedia = await prisma.userMedia.findMany({
-            where: { userId, status: 'BLOCKED' },
-            include: { media: { select: { tmdbId: true, title: true, genres: true } } }
-        });
-        const blocklist = blockedMedia.map(bm => bm.media.tmdbId);
-        const blocklistItems = blockedMedia.map(bm => ({
-            title: bm.media.title,
-            genres: bm.media.genres ? JSON.parse(bm.media.genres) as string[] : [],
-        }));
-        console.log(`[Weekly Watchlist] Blocklist size: ${blocklist.length}`);
+        // Blocklist (built in step 0) is shared by both Critic passes
+        console.log(`[Weekly Watchlist] Blocklist size: ${blocklist.size}`);
 
         // ==========================================
         // DUAL-AI SYSTEM: CURATOR → CRITIC
@@ -315,15 +353,15 @@ export class WeeklyWatchlistService {
         console.log(`[Weekly Watchlist] Critic approved: ${rankedMovies.length} movies, ${rankedTV.length} TV shows`);
 
         // 5. Build final lists with full details
+        const movieIndex = indexCandidates(movieCandidates as TMDBMovie[], c => [c.title, c.original_title]);
+        const tvIndex = indexCandidates(tvCandidates as TMDBTV[], c => [c.name, c.original_name]);
+
         const movies: WatchlistItem[] = rankedMovies.slice(0, 10).map((r: { tmdbId: number; title: string }) => {
-            let candidate = (movieCandidates as TMDBMovie[]).find((c: TMDBMovie) => c.id === Number(r.tmdbId));
+            let candidate = movieIndex.byId.get(Number(r.tmdbId));
 
             if (!candidate) {
                 // Fallback: Try fuzzy title match
-                candidate = (movieCandidates as TMDBMovie[]).find((c: TMDBMovie) =>
-                    c.title.toLowerCase() === r.title.toLowerCase() ||
-                    c.original_title.toLowerCase() === r.title.toLowerCase()
-                );
+                candidate = movieIndex.byTitle.get((r.title || '').toLowerCase());
 
                 if (candidate) {
                     console.log(`[Weekly Watchlist] Recovered movie "${r.title}" via title match (ID: ${candidate.id})`);
@@ -335,7 +373,7 @@ export class WeeklyWatchlistService {
             return {
                 tmdbId: candidate?.id || Number(r.tmdbId),
                 title: candidate?.title || r.title,
-                posterUrl: candidate?.poster_path ? `https://image.tmdb.org/t/p/w500${candidate.poster_path}` : null,
+                posterUrl: candidate?.poster_path ? TMDB_POSTER_URL_PREFIX + candidate.poster_path : null,
                 overview: candidate?.overview || '',
                 voteAverage: candidate?.vote_average || 0,
                 releaseDate: candidate?.release_date || null,
@@ -344,14 +382,11 @@ export class WeeklyWatchlistService {
         });
 
         const tvShows: WatchlistItem[] = rankedTV.slice(0, 10).map((r: { tmdbId: number; title: string }) => {
-            let candidate = (tvCandidates as TMDBTV[]).find((c: TMDBTV) => c.id === Number(r.tmdbId));
+            let candidate = tvIndex.byId.get(Number(r.tmdbId));
 
             if (!candidate) {
                 // Fallback: Try fuzzy title match
-                candidate = (tvCandidates as TMDBTV[]).find((c: TMDBTV) =>
-                    c.name.toLowerCase() === r.title.toLowerCase() ||
-                    c.original_name.toLowerCase() === r.title.toLowerCase()
-                );
+                candidate = tvIndex.byTitle.get((r.title || '').toLowerCase());
 
                 if (candidate) {
                     console.log(`[Weekly Watchlist] Recovered TV show "${r.title}" via title match (ID: ${candidate.id})`);
@@ -363,7 +398,7 @@ export class WeeklyWatchlistService {
             return {
                 tmdbId: candidate?.id || Number(r.tmdbId),
                 title: candidate?.name || r.title,
-                posterUrl: candidate?.poster_path ? `https://image.tmdb.org/t/p/w500${candidate.poster_path}` : null,
+                posterUrl: candidate?.poster_path ? TMDB_POSTER_URL_PREFIX + candidate.poster_path : null,
                 overview: candidate?.overview || '',
                 voteAverage: candidate?.vote_average || 0,
                 releaseDate: candidate?.first_air_date || null,
@@ -371,27 +406,31 @@ export class WeeklyWatchlistService {
             };
         });
 
-        // 6. Save to database
+        // 6. Save to database (one timestamp shared by the stored row and the returned result)
+        const generatedAt = new Date();
         const weekStart = getWeekStart();
-        const weekEnd = getWeekEnd();
+        const weekEnd = getWeekEnd(weekStart);
         const tasteProfile = movieTaste.tasteProfile; // Use movie taste for main profile
+        const moviesJson = JSON.stringify(movies);
+        const tvShowsJson = JSON.stringify(tvShows);
 
         await prisma.weeklyWatchlist.upsert({
             where: { userId_weekStart: { userId, weekStart } },
             update: {
-                movies: JSON.stringify(movies),
-                tvShows: JSON.stringify(tvShows),
+                movies: moviesJson,
+                tvShows: tvShowsJson,
                 tasteProfile,
-                generatedAt: new Date(),
+                generatedAt,
                 weekEnd,
             },
             create: {
                 userId,
-                movies: JSON.stringify(movies),
-                tvShows: JSON.stringify(tvShows),
+                movies: moviesJson,
+                tvShows: tvShowsJson,
                 tasteProfile,
                 weekStart,
                 weekEnd,
+                generatedAt,
             },
         });
 
@@ -403,7 +442,7 @@ export class WeeklyWatchlistService {
             tasteProfile,
             weekStart,
             weekEnd,
-            generatedAt: new Date()
+            generatedAt
         };
     }
 
@@ -588,15 +627,16 @@ export class WeeklyWatchlistService {
     static async checkAndRefreshStale(): Promise<void> {
         const weekStart = getWeekStart();
 
-        // Find users without a current week's watchlist
-        const users = await prisma.user.findMany();
+        // Find users without a current week's watchlist: one query for who already has one,
+        // instead of a lookup per user
+        const [users, current] = await Promise.all([
+            prisma.user.findMany({ select: { id: true } }),
+            prisma.weeklyWatchlist.findMany({ where: { weekStart }, select: { userId: true } }),
+        ]);
+        const usersWithCurrent = new Set(current.map(w => w.userId));
 
         for (const user of users) {
-            const existing = await prisma.weeklyWatchlist.findUnique({
-                where: { userId_weekStart: { userId: user.id, weekStart } }
-            });
-
-            if (!existing) {
+            if (!usersWithCurrent.has(user.id)) {
                 console.log(`[Weekly Watchlist] User ${user.id} has no current watchlist, generating...`);
                 try {
                     await this.generateForUser(user.id);
@@ -0,0 +1,84 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { withBackoff } from './http';
+
+function httpError(status: number) {
+    return Object.assign(new Error(`HTTP ${status}`), { response: { status } });
+}
+
+describe('withBackoff', () => {
+    beforeEach(() => {
+        vi.useFakeTimers();
+        vi.spyOn(Math, 'random').mockReturnValue(0);
+    });
+
+    afterEach(() => {
+        vi.useRealTimers();
+        vi.restoreAllMocks();
+    });
+
+    it('retries on 429 and 5xx until a call succeeds', async () => {
+        const fn = vi.fn()
+            .mockRejectedValueOnce(httpError(429))
+            .mockRejectedValueOnce(httpError(503))
+            .mockResolvedValueOnce('ok');
+
+        const result = withBackoff(fn, { retries: 3, baseDelayMs: 100 });
+        await vi.runAllTimersAsync();
+
+        await expect(result).resolves.toBe('ok');
+        expect(fn).toHaveBeenCalledTimes(3);
+    });
+
+    it('reads the status from a top-level status field as well', async () => {
+        const fn = vi.fn()
+            .mockRejectedValueOnce(Object.assign(new Error('rate limited'), { status: 429 }))
+            .mockResolvedValueOnce('ok');
+
+        const result = withBackoff(fn, { baseDelayMs: 100 });
+        await vi.runAllTimersAsync();
+
+        await expect(result).resolves.toBe('ok');
+        expect(fn).toHaveBeenCalledTimes(2);
+    });
+
+    it.each([400, 401])('rethrows %i immediately without retrying', async (status) => {
+        const fn = vi.fn().mockRejectedValue(httpError(status));
+
+        await expect(withBackoff(fn, { retries: 3, baseDelayMs: 100 })).rejects.toMatchObject({ response: { status } });
+        expect(fn).toHaveBeenCalledTimes(1);
+    });
+
+    it('rethrows errors without a status immediately', async () => {
+        const fn = vi.fn().mockRejectedValue(new Error('socket hang up'));
+
+        await expect(withBackoff(fn, { baseDelayMs: 100 })).rejects.toThrow('socket hang up');
+        expect(fn).toHaveBeenCalledTimes(1);
+    });
+
+    it('gives up after `retries` retries and rethrows the last error', async () => {
+        const fn = vi.fn().mockRejectedValue(httpError(500));
+
+        const result = withBackoff(fn, { retries: 2, baseDelayMs: 100 });
+        const assertion = expect(result).rejects.toMatchObject({ response: { status: 500 } });
+        await vi.runAllTimersAsync();
+
+        await assertion;
+        expect(fn).toHaveBeenCalledTimes(3);
+    });
+
+    it('caps every delay, jitter included, at maxDelayMs', async () => {
+        vi.mocked(Math.random).mockReturnValue(0.999);
+        const setTimeoutSpy = vi.spyOn(globalThis, 'setTimeout');
+        const fn = vi.fn().mockRejectedValue(httpError(429));
+
+        const result = withBackoff(fn, { retries: 4, baseDelayMs: 1000, maxDelayMs: 2500 });
+        const assertion = expect(result).rejects.toMatchObject({ response: { status: 429 } });
+        await vi.runAllTimersAsync();
+        await assertion;
+
+        const delays = setTimeoutSpy.mock.calls.map(([, ms]) => ms as number);
+        expect(delays).toHaveLength(4);
+        expect(delays[0]).toBeCloseTo(1499.5, 0);
+        for (const ms of delays.slice(1)) expect(ms).toBe(2500);
+    });
+});
@@ -0,0 +1,60 @@
+/**
+ * Shared outbound HTTP connection pooling
+ * Applied to axios defaults so every client (including per-call axios.create instances) reuses sockets
+ */
+
+import http from 'http';
+import https from 'https';
+import axios from 'axios';
+
+const agentOptions: http.AgentOptions = {
+  keepAlive: true,
+  maxSockets: 64,
+  maxFreeSockets: 32,
+  // Hand out the most recently used socket first: bursts of small Jellyseerr/TMDB calls then
+  // run over a few warm connections while surplus ones idle out, instead of round-robining
+  // across every socket a past burst opened
+  scheduling: 'lifo',
+};
+
+export const httpAgent = new http.Agent(agentOptions);
+export const httpsAgent = new https.Agent(agentOptions);
+
+/**
+ * Install the keep-alive agents on axios defaults.
+ * Jellyseerr/TMDB/Jellyfin fan-outs then skip a TCP + TLS handshake per request.
+ */
+export function configureHttpAgents(): void {
+  axios.defaults.httpAgent = httpAgent;
+  axios.defaults.httpsAgent = httpsAgent;
+}
+
+const RETRYABLE_STATUS = new Set([429, 500, 502, 503, 504]);
+
+function retryableStatus(err: unknown): boolean {
+  const e = err as { status?: number; code?: number; response?: { status?: number } };
+  const status = e?.status ?? e?.response?.status ?? e?.code;
+  return typeof status === 'number' && RETRYABLE_STATUS.has(status);
+}
+
+/**
+ * Retry `fn` on rate-limit / transient upstream errors with capped exponential backoff.
+ * Each delay gets up to +50% random jitter so concurrent callers hitting the same 429
+ * don't retry in lockstep. Non-retryable errors are rethrown immediately.
+ */
+export async function withBackoff<T>(
+  fn: () => Promise<T>,
+  { retries = 3, baseDelayMs = 1000, maxDelayMs = 30_000 }: { retries?: number; baseDelayMs?: number; maxDelayMs?: number } = {}
+): Promise<T> {
+  let delay = baseDelayMs;
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fn();
+    } catch (err) {
+      if (attempt >= retries || !retryableStatus(err)) throw err;
+      const wait = Math.min(delay + Math.random() * delay * 0.5, maxDelayMs);
+      await new Promise(resolve => setTimeout(resolve, wait));
+      delay = Math.min(delay * 2, maxDelayMs);
+    }
+  }
+}
@@ -49,7 +49,11 @@ export function getOrCreateSessionSecret(dataDir: string): string {
 
   try {
     fs.mkdirSync(dataDir, { recursive: true });
-    fs.writeFileSync(secretPath, newSecret, { encoding: 'utf8', mode: 0o600 });
+    // Write-then-rename: a crash mid-write must never leave a truncated secret behind,
+    // which the next start would treat as too short and regenerate (logging everyone out)
+    const tmpPath = `${secretPath}.tmp`;
+    fs.writeFileSync(tmpPath, newSecret, { encoding: 'utf8', mode: 0o600 });
+    fs.renameSync(tmpPath, secretPath);
     logger.info(`[SecretManager] Generated new session secret → ${secretPath}`);
   } catch (err) {
     logger.error({ err }, '[SecretManager] Failed to persist session secret — using ephemeral secret (sessions lost on restart)');
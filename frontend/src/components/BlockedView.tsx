@@ -3,9 +3,10 @@
  * Displays blocked movies/TV shows and AI-recommended redemption candidates
  */
 
-import React, { useEffect, useState, useMemo } from 'react';
+import React, { useCallback, useEffect, useState, useMemo } from 'react';
 import { Ban } from 'lucide-react';
 import { getBlockedItems, getRedemptionCandidates } from '../services/api';
+import { removeByTmdbId } from '../utils/list';
 import type { JellyfinItem } from '../types';
 import MediaCard from './MediaCard';
 import RedemptionCard from './RedemptionCard';
@@ -22,6 +23,10 @@ interface RedemptionCandidate {
 
 type FilterType = 'all' | 'movie' | 'tv';
 
+const REFRESH_DEBOUNCE_MS = 300;
+
+const SKELETON_KEYS = Array.from({ length: 10 }, (_, idx) => `skeleton-${idx}`);
+
 const BlockedView: React.FC = () => {
     const [blockedMovies, setBlockedMovies] = useState<JellyfinItem[]>([]);
     const [blockedTVShows, setBlockedTVShows] = useState<JellyfinItem[]>([]);
@@ -34,14 +39,20 @@ const BlockedView: React.FC = () => {
         loadBlockedContent();
         loadRedemptionCandidates();
 
-        // Listen for global blocked content changes
+        // Listen for global blocked content changes. Rapid unblocks arrive as a burst of
+        // events, so refetch once after they settle instead of once per click.
+        let refreshTimer: ReturnType<typeof setTimeout> | undefined;
         const handler = () => {
-            loadBlockedContent(true);
-            loadRedemptionCandidates();
+            clearTimeout(refreshTimer);
+            refreshTimer = setTimeout(() => {
+                loadBlockedContent(true);
+                loadRedemptionCandidates();
+            }, REFRESH_DEBOUNCE_MS);
         };
         window.addEventListener('blocked:changed', handler as EventListener);
 
         return () => {
+            clearTimeout(refreshTimer);
             window.removeEventListener('blocked:changed', handler as EventListener);
         };
     }, []);
@@ -87,29 +98,23 @@ const BlockedView: React.FC = () => {
         // Optimistically remove the card from UI immediately
         setRedemptionCandidates(prev => prev.filter(c => String(c.media.tmdbId) !== String(mediaId)));
 
-        // Refresh both lists after redemption action (in background)
-        loadBlockedContent(true);
-        loadRedemptionCandidates();
-
-        // Dispatch event so other components know blocked content changed
+        // Other components and our own listener refresh both lists (in background)
         window.dispatchEvent(new CustomEvent('blocked:changed'));
     };
 
-    const handleMediaUnblocked = (tmdbId?: number) => {
+    // Stable so the memoized cards keyed by tmdbId keep their identity across filter changes
+    const handleMediaUnblocked = useCallback((tmdbId?: number) => {
         if (!tmdbId) return;
         console.log('[BlockedView] Media unblocked:', tmdbId);
 
         // Optimistically remove from both lists
-        // Use String comparison to be safe against type mismatches
-        setBlockedMovies(prev => prev.filter(m => String(m.tmdbId) !== String(tmdbId)));
-        setBlockedTVShows(prev => prev.filter(s => String(s.tmdbId) !== String(tmdbId)));
+        // Ids are compared numerically to be safe against type mismatches
+        setBlockedMovies(prev => removeByTmdbId(prev, tmdbId, m => m.tmdbId));
+        setBlockedTVShows(prev => removeByTmdbId(prev, tmdbId, s => s.tmdbId));
 
-        // Refresh in background
-        loadBlockedContent(true);
-
-        // Dispatch event so other components know blocked content changed
+        // Other components and our own listener refresh in the background
         window.dispatchEvent(new CustomEvent('blocked:changed'));
-    };
+    }, []);
 
     if (error) {
         return (
@@ -185,9 +190,8 @@ const BlockedView: React.FC = () => {
 
                         {loading ? (
                             <div className="grid grid-cols-1 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-4">
-                                {[...Array(10)].map((_, i) => (
-                                    // eslint-disable-next-line @eslint-react/no-array-index-key
-                                    <SkeletonCard key={i} />
+                                {SKELETON_KEYS.map(key => (
+                                    <SkeletonCard key={key} />
                                 ))}
                             </div>
                         ) : filteredMovies.length === 0 ? (
@@ -218,9 +222,8 @@ const BlockedView: React.FC = () => {
 
                         {loading ? (
                             <div className="grid grid-cols-1 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-4">
-                                {[...Array(10)].map((_, i) => (
-                                    // eslint-disable-next-line @eslint-react/no-array-index-key
-                                    <SkeletonCard key={i} />
+                                {SKELETON_KEYS.map(key => (
+                                    <SkeletonCard key={key} />
                                 ))}
                             </div>
                         ) : filteredTVShows.length === 0 ? (
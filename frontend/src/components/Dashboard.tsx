@@ -3,6 +3,7 @@ import * as Slider from '@radix-ui/react-slider';
 import ItemList from './ItemList';
 import type { JellyfinItem } from '../types';
 import { getRecommendations } from '../services/api';
+import { removeByTmdbId } from '../utils/list';
 import { useAuth } from '../contexts/AuthContext';
 import WatchlistView from './WatchlistView';
 import ManualSearchView from './ManualSearchView';
@@ -37,6 +38,13 @@ const YEAR_MAX = new Date().getFullYear();
 const YEAR_STEP = 1;
 const YEAR_TICKS_MOBILE = [1900, 1950, 2000, YEAR_MAX];
 const YEAR_TICKS_DESKTOP = Array.from({ length: Math.floor((YEAR_MAX - YEAR_MIN) / 10) + 1 }, (_, i) => YEAR_MIN + i * 10).concat(YEAR_MAX).filter((v, i, a) => a.indexOf(v) === i);
+// Tick labels are constant: class and position are resolved once here rather than on
+// every render (the slider re-renders the dashboard on each drag step)
+const YEAR_TICK_LABELS = YEAR_TICKS_DESKTOP.map(year => ({
+  year,
+  className: `absolute -translate-x-1/2 ${YEAR_TICKS_MOBILE.includes(year) ? '' : 'hidden sm:block'}`,
+  style: { left: `${((year - YEAR_MIN) / (YEAR_MAX - YEAR_MIN)) * 100}%` } as React.CSSProperties,
+}));
 
 interface Props {
   currentView?: 'recommendations' | 'weekly-picks' | 'trending' | 'watchlist' | 'search' | 'mark-watched' | 'settings' | 'blocked';
@@ -53,6 +61,16 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
   const [recommendations, setRecommendations] = useState<JellyfinItem[]>([]);
   const [error, setError] = useState<string | null>(null);
 
+  // Chip lists only change with their own selection, not on slider drags or loading toggles
+  const genreChips = React.useMemo(() => {
+    const active = new Set(selectedGenres);
+    return GENRES.map(g => ({ id: g, label: g, active: active.has(g) }));
+  }, [selectedGenres]);
+  const moodChips = React.useMemo(
+    () => MOODS.map(m => ({ id: m.id, label: m.label, active: selectedMood === m.id })),
+    [selectedMood],
+  );
+
   const toggleGenre = (g: string) => {
     setSelectedGenres(prev => prev.includes(g) ? prev.filter(x => x !== g) : [...prev, g]);
   };
@@ -61,6 +79,16 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
     setSelectedMood(prev => prev === m ? null : m);
   };
 
+  // Stable callbacks keep the memoized recommendations grid from re-rendering on filter edits
+  const handleSelectItem = React.useCallback(() => { }, []);
+  const handleRemoveRecommendation = React.useCallback((tmdbId?: number) => {
+    if (!tmdbId && tmdbId !== 0) return;
+    setRecommendations(prev => removeByTmdbId(prev, tmdbId, i => {
+      const item = i as JellyfinItem & { tmdb_id?: number; id?: number };
+      return item.tmdbId ?? item.tmdb_id ?? item.id;
+    }));
+  }, []);
+
 
   const handleGetRecommendations = React.useCallback(async (refresh: boolean = true) => {
     setError(null);
@@ -166,12 +194,8 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
                       <Slider.Thumb className="block w-6 h-6 rounded-full border-2 border-white/85 bg-violet-500 shadow-[0_0_12px_rgba(139,92,246,0.9)] focus:outline-none focus:ring-2 focus:ring-violet-400/50 cursor-grab active:cursor-grabbing touch-none" aria-label="Maximum year" />
                     </Slider.Root>
                     <div className="mt-3 relative h-4 text-xs text-slate-500">
-                      {YEAR_TICKS_DESKTOP.map(year => (
-                        <span
-                          key={year}
-                          className={`absolute -translate-x-1/2 ${YEAR_TICKS_MOBILE.includes(year) ? '' : 'hidden sm:block'}`}
-                          style={{ left: `${((year - YEAR_MIN) / (YEAR_MAX - YEAR_MIN)) * 100}%` }}
-                        >
+                      {YEAR_TICK_LABELS.map(({ year, className, style }) => (
+                        <span key={year} className={className} style={style}>
                           {year}
                         </span>
                       ))}
@@ -182,7 +206,7 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
                 <div>
                   <label className="text-sm text-slate-400 mb-3 block">Genres</label>
                   <FilterGroup
-                    chips={GENRES.map(g => ({ id: g, label: g, active: selectedGenres.includes(g) }))}
+                    chips={genreChips}
                     onToggle={toggleGenre}
                   />
                 </div>
@@ -190,7 +214,7 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
                 <div>
                   <label className="text-sm text-slate-400 mb-3 block">Mood</label>
                   <FilterGroup
-                    chips={MOODS.map(m => ({ id: m.id, label: m.label, active: selectedMood === m.id }))}
+                    chips={moodChips}
                     onToggle={toggleMood}
                   />
                 </div>
@@ -209,14 +233,7 @@ const Dashboard: React.FC<Props> = ({ currentView = 'recommendations' }) => {
           {currentView === 'recommendations' && (
             <>
               {error && <div className="mb-4 text-red-400">{error}</div>}
-              <ItemList items={recommendations} onSelectItem={() => { }} isLoading={isLoading} onRemove={(tmdbId) => {
-                if (!tmdbId && tmdbId !== 0) return;
-                setRecommendations(prev => prev.filter(i => {
-                  const item = i as JellyfinItem & { tmdb_id?: number; id?: number };
-                  const id = Number(item.tmdbId ?? item.tmdb_id ?? item.id);
-                  return id !== Number(tmdbId);
-                }));
-              }} />
+              <ItemList items={recommendations} onSelectItem={handleSelectItem} isLoading={isLoading} onRemove={handleRemoveRecommendation} />
             </>
           )}
 
@@ -11,17 +11,16 @@ interface Props {
     variant?: 'default' | 'watchlist' | 'search';
 }
 
-const ItemList: React.FC<Props> = ({ items, onSelectItem, isLoading = false, onRemove, variant = 'default' }) => {
-    const skeletonCount = 8;
-
+// Skeleton keys are fixed, so build them once rather than on every loading render
+const SKELETON_KEYS = Array.from({ length: 8 }, (_, idx) => `skeleton-${idx}`);
 
+const ItemList: React.FC<Props> = ({ items, onSelectItem, isLoading = false, onRemove, variant = 'default' }) => {
     return (
         <div>
             <div className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-3 md:gap-6">
                 {isLoading ? (
-                    Array.from({ length: skeletonCount }).map((_, idx) => (
-                        // eslint-disable-next-line @eslint-react/no-array-index-key
-                        <SkeletonCard key={`skeleton-${idx}`} />
+                    SKELETON_KEYS.map(key => (
+                        <SkeletonCard key={key} />
                     ))
                 ) : (
                     items.map((item) => (
@@ -33,4 +32,4 @@ const ItemList: React.FC<Props> = ({ items, onSelectItem, isLoading = false, onR
     );
 };
 
-export default ItemList;
+export default React.memo(ItemList);
@@ -1,8 +1,9 @@
-import React, { useState } from 'react';
+import React, { useCallback, useState } from 'react';
 import SearchBar from './SearchBar';
 import ItemList from './ItemList';
 import type { JellyfinItem } from '../types';
 import { searchJellyseerr } from '../services/api';
+import { removeByTmdbId } from '../utils/list';
 
 const ManualSearchView: React.FC = () => {
   const [results, setResults] = useState<JellyfinItem[]>([]);
@@ -25,10 +26,11 @@ const ManualSearchView: React.FC = () => {
     }
   };
 
-  const handleRemove = (tmdbId?: number) => {
+  const handleSelectItem = useCallback(() => { }, []);
+  const handleRemove = useCallback((tmdbId?: number) => {
     if (!tmdbId) return;
-    setResults(prev => prev.filter(item => item.tmdbId !== tmdbId));
-  };
+    setResults(prev => removeByTmdbId(prev, tmdbId, item => item.tmdbId));
+  }, []);
 
   return (
     <div>
@@ -52,7 +54,7 @@ const ManualSearchView: React.FC = () => {
       ) : null}
 
       <div className="mt-6">
-        <ItemList items={results} onSelectItem={() => { }} isLoading={loading} variant="search" onRemove={handleRemove} />
+        <ItemList items={results} onSelectItem={handleSelectItem} isLoading={loading} variant="search" onRemove={handleRemove} />
       </div>
     </div>
   );
@@ -19,6 +19,11 @@ interface AugmentedItem extends JellyfinItem {
   id?: number;
 }
 
+// Let other views (e.g. WatchlistView) know the watchlist changed
+const notifyWatchlistChanged = (tmdbId: number) => {
+  try { window.dispatchEvent(new CustomEvent('watchlist:changed', { detail: { tmdbId } })); } catch { /* ignore */ }
+};
+
 const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'default' }) => {
   const imgSrc = item.posterUrl || '';
   const titleText = item.title || 'Unknown Title';
@@ -49,6 +54,37 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
   });
   const tmdbLink = `https://www.themoviedb.org/${currentMediaType}/${item.tmdbId}`;
 
+  // Action callbacks shared by the card overlay and the details modal
+  const handleRequest = async () => {
+    if (requesting) return;
+    setRequesting(true);
+    const id = Number(item.tmdbId);
+    try {
+      if (variant === 'blocked') {
+        // Optimistically drop the card, then move it out of the blocklist
+        if (typeof onRemove === 'function') onRemove(id);
+        setShowInfo(false);
+        await unblockItem(id, 'jellyseerr');
+      } else {
+        await postJellyseerrRequest(id, currentMediaType);
+        if (typeof onRemove === 'function') onRemove(id);
+      }
+      setRequested(true);
+      setShowInfo(false);
+    } catch (err) {
+      console.error('Request failed', err);
+    } finally {
+      setRequesting(false);
+    }
+  };
+
+  const handleUnblock = () => {
+    const id = Number(item.tmdbId);
+    if (typeof onRemove === 'function') onRemove(id);
+    setShowInfo(false);
+    unblockItem(id, 'remove').catch(console.error);
+  };
+
   return (
     <>
       <div
@@ -67,6 +103,7 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
               alt={titleText}
               className="absolute inset-0 w-full h-full object-cover block md:hidden"
               loading="lazy"
+              decoding="async"
               onError={(e) => { (e.target as HTMLImageElement).src = 'data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="1280" height="720"><rect width="100%" height="100%" fill="%23343a40"/></svg>'; }}
             />
           ) : (
@@ -85,6 +122,7 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
               alt={titleText}
               className="absolute inset-0 w-full h-full object-cover hidden md:block"
               loading="lazy"
+              decoding="async"
               onError={(e) => { (e.target as HTMLImageElement).src = 'data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="400" height="600"><rect width="100%" height="100%" fill="%23343a40"/></svg>'; }}
             />
           ) : (
@@ -112,44 +150,22 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
           </div>
 
           <div className="absolute inset-0 transition-opacity duration-300 flex flex-col justify-end p-4 bg-gradient-to-t from-black/90 via-black/60 to-transparent opacity-100 md:opacity-0 md:group-hover:opacity-100">
-            <div className="flex w-full items-center justify-evenly gap-1 bg-black/40 px-1 py-2 rounded-md">
-
-
-
+            {/* Clicks inside the action row never open the card: stopped once here instead of in each button */}
+            <div className="flex w-full items-center justify-evenly gap-1 bg-black/40 px-1 py-2 rounded-md" onClick={(e) => e.stopPropagation()}>
               {/* Request */}
-              <button aria-label="Request" title="Request" onClick={async (e) => {
-                e.stopPropagation();
-                if (requesting) return;
-                setRequesting(true);
-                const id = Number(item.tmdbId);
-                try {
-                  if (variant === 'blocked') {
-                    if (typeof onRemove === 'function') onRemove(id);
-                    await unblockItem(id, 'jellyseerr');
-                  } else {
-                    await postJellyseerrRequest(id, currentMediaType as 'movie' | 'tv');
-                  }
-                  setRequested(true);
-                  if (typeof onRemove === 'function') onRemove(Number(id));
-                } catch (err) {
-                  console.error('Request failed', err);
-                } finally {
-                  setRequesting(false);
-                }
-              }} className="p-3 md:p-2 rounded text-white hover:text-cyan-300 transition-colors">
+              <button aria-label="Request" title="Request" onClick={handleRequest} className="p-3 md:p-2 rounded text-white hover:text-cyan-300 transition-colors">
                 {requesting ? <Loader2 className="w-6 h-6 md:w-5 md:h-5 animate-spin" /> : requested ? <Check className="w-6 h-6 md:w-5 md:h-5 text-green-400" /> : <DownloadCloud className="w-6 h-6 md:w-5 md:h-5" />}
               </button>
 
               {/* Watchlist */}
               {variant !== 'watchlist' ? (
-                <button aria-label="Add to Watchlist" title="Add to Watchlist" onClick={async (e) => {
-                  e.stopPropagation();
+                <button aria-label="Add to Watchlist" title="Add to Watchlist" onClick={async () => {
                   const id = Number(item.tmdbId);
                   try {
                     const actionPromise = variant === 'blocked' ? unblockItem(id, 'watchlist') : postActionWatchlist(buildItemPayload());
                     await actionPromise;
                     if (typeof onRemove === 'function') onRemove(id);
-                    try { window.dispatchEvent(new CustomEvent('watchlist:changed', { detail: { tmdbId: id } })); } catch { /* ignore */ }
+                    notifyWatchlistChanged(id);
                   } catch {
                     showError('Failed to add to watchlist');
                   }
@@ -157,13 +173,12 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
                   <Bookmark className="w-6 h-6 md:w-5 md:h-5" />
                 </button>
               ) : (
-                <button aria-label="Remove from Watchlist" title="Remove from Watchlist" onClick={(e) => {
-                  e.stopPropagation();
+                <button aria-label="Remove from Watchlist" title="Remove from Watchlist" onClick={() => {
                   const id = Number(item.tmdbId);
                   if (typeof onRemove === 'function') onRemove(id as number);
                   postRemoveFromWatchlist(buildItemPayload())
                     .then(() => {
-                      try { window.dispatchEvent(new CustomEvent('watchlist:changed', { detail: { tmdbId: id } })); } catch { /* ignore */ }
+                      notifyWatchlistChanged(id);
                     })
                     .catch(err => {
                       console.error('Failed to remove from watchlist', err);
@@ -174,8 +189,7 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
               )}
 
               {/* Watched */}
-              <button aria-label="Mark Watched" title="Mark Watched" onClick={async (e) => {
-                e.stopPropagation();
+              <button aria-label="Mark Watched" title="Mark Watched" onClick={async () => {
                 const id = Number(item.tmdbId);
                 try {
                   if (variant === 'blocked') {
@@ -194,17 +208,11 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
               {/* Block */}
               {/* Block / Unblock */}
               {variant === 'blocked' ? (
-                <button aria-label="Unblock" title="Unblock" onClick={(e) => {
-                  e.stopPropagation();
-                  const id = Number(item.tmdbId);
-                  if (typeof onRemove === 'function') onRemove(id as number);
-                  unblockItem(id, 'remove').catch(console.error);
-                }} className="p-3 md:p-2 rounded-md text-white hover:text-red-500 active:scale-95 transition-transform focus:outline-none">
+                <button aria-label="Unblock" title="Unblock" onClick={handleUnblock} className="p-3 md:p-2 rounded-md text-white hover:text-red-500 active:scale-95 transition-transform focus:outline-none">
                   <X className="w-6 h-6 md:w-5 md:h-5" />
                 </button>
               ) : (
-                <button aria-label="Block (Do not recommend)" title="Block (Do not recommend)" onClick={async (e) => {
-                  e.stopPropagation();
+                <button aria-label="Block (Do not recommend)" title="Block (Do not recommend)" onClick={async () => {
                   const id = Number(item.tmdbId);
                   try {
                     await postActionBlock(buildItemPayload());
@@ -270,232 +278,164 @@ const MediaCard: React.FC<Props> = ({ item, onClick, onRemove, variant = 'defaul
         </div>
       </div>
 
-      <Modal isOpen={showInfo} onClose={() => setShowInfo(false)} title="Details">
-        <div className="flex flex-col md:flex-row gap-6 p-4 md:p-6">
-          <div className="w-full md:w-1/3 shrink-0">
-            <img
-              src={imgSrc}
-              alt={titleText}
-              className="w-full rounded-lg shadow-lg object-cover aspect-[2/3]"
-              onError={(e) => { (e.target as HTMLImageElement).src = 'data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="400" height="600"><rect width="100%" height="100%" fill="%23343a40"/></svg>'; }}
-            />
-          </div>
-          <div className="flex-1 space-y-4">
-            <div>
-              <h3 className="text-2xl font-bold text-white">{titleText}</h3>
-              <div className="flex items-center gap-3 text-slate-400 mt-1">
-                <span>{item.releaseYear}</span>
-                <span>•</span>
-                <span className="capitalize">{currentMediaType === 'tv' ? 'TV Series' : 'Movie'}</span>
-                {item.voteAverage ? (
-                  <>
-                    <span>•</span>
-                    <div className="flex items-center gap-1 text-yellow-400">
-                      <Star className="w-4 h-4 fill-current" />
-                      <span>{item.voteAverage.toFixed(1)}</span>
-                    </div>
-                  </>
-                ) : null}
-              </div>
-
+      {/* Mounted only while open: a grid renders dozens of cards, and the details view
+          with its action row would otherwise be built for every card on every render */}
+      {showInfo && (
+        <Modal isOpen onClose={() => setShowInfo(false)} title="Details">
+          <div className="flex flex-col md:flex-row gap-6 p-4 md:p-6">
+            <div className="w-full md:w-1/3 shrink-0">
+              <img
+                src={imgSrc}
+                alt={titleText}
+                className="w-full rounded-lg shadow-lg object-cover aspect-[2/3]"
+                onError={(e) => { (e.target as HTMLImageElement).src = 'data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="400" height="600"><rect width="100%" height="100%" fill="%23343a40"/></svg>'; }}
+              />
             </div>
-            {/* Full Genre List (Modal View) */}
-            {item.genres && item.genres.length > 0 && (
-              <div className="flex flex-wrap gap-2 mt-3">
-                {item.genres.map((g) => (
-                  <span key={g} className="px-2 py-1 rounded-md bg-white/10 text-slate-300 text-sm border border-white/5">
-                    {g}
-                  </span>
-                ))}
-              </div>
-            )}
-          </div>
-
-          <div className="prose prose-invert max-w-none">
-            <p className="text-slate-300 leading-relaxed">
-              {item.overview || 'No synopsis available.'}
-            </p>
-          </div>
+            <div className="flex-1 space-y-4">
+              <div>
+                <h3 className="text-2xl font-bold text-white">{titleText}</h3>
+                <div className="flex items-center gap-3 text-slate-400 mt-1">
+                  <span>{item.releaseYear}</span>
+                  <span>•</span>
+                  <span className="capitalize">{currentMediaType === 'tv' ? 'TV Series' : 'Movie'}</span>
+                  {item.voteAverage ? (
+                    <>
+                      <span>•</span>
+                      <div className="flex items-center gap-1 text-yellow-400">
+                        <Star className="w-4 h-4 fill-current" />
+                        <span>{item.voteAverage.toFixed(1)}</span>
+                      </div>
+                    </>
+                  ) : null}
+                </div>
 
-          <div className="pt-4 border-t border-white/10 flex flex-wrap gap-4 items-center justify-between">
-            <a
-              href={tmdbLink}
-              target="_blank"
-              rel="noopener noreferrer"
-              className="inline-flex items-center gap-2 bg-[#0d253f] hover:bg-[#01b4e4] text-white px-4 py-2 rounded-lg transition-colors font-medium border border-[#01b4e4]/30"
-            >
-              <ExternalLink className="w-4 h-4" />
-              View on TMDB
-            </a>
+              </div>
+              {/* Full Genre List (Modal View) */}
+              {item.genres && item.genres.length > 0 && (
+                <div className="flex flex-wrap gap-2 mt-3">
+                  {item.genres.map((g) => (
+                    <span key={g} className="px-2 py-1 rounded-md bg-white/10 text-slate-300 text-sm border border-white/5">
+                      {g}
+                    </span>
+                  ))}
+                </div>
+              )}
+            </div>
 
-            <div className="flex flex-wrap items-center gap-3">
-              {/* Request */}
-              <button
-                aria-label="Request"
-                title="Request"
-                onClick={async () => {
-                  if (requesting) return;
-                  setRequesting(true);
-                  const id = Number(item.tmdbId);
-                  try {
-                    if (variant === 'blocked') {
-                      if (typeof onRemove === 'function') onRemove(id);
-                      setShowInfo(false);
-                      await unblockItem(id, 'jellyseerr');
-                    } else {
-                      await postJellyseerrRequest(id, currentMediaType as 'movie' | 'tv');
-                    }
-                    setRequested(true);
-                    if (typeof onRemove === 'function') onRemove(Number(id));
-                    setShowInfo(false);
-                  } catch (err) {
-                    console.error('Request failed', err);
-                  } finally {
-                    setRequesting(false);
-                  }
-                }}
-                className="flex items-center gap-2 px-4 py-2 rounded-lg bg-cyan-500/10 hover:bg-cyan-500/20 text-cyan-400 hover:text-cyan-300 transition-colors border border-cyan-500/20"
-              >
-                {requesting ? <Loader2 className="w-5 h-5 animate-spin" /> : <DownloadCloud className="w-5 h-5" />}
-                <span className="font-medium">Request</span>
-              </button>
+            <div className="prose prose-invert max-w-none">
+              <p className="text-slate-300 leading-relaxed">
+                {item.overview || 'No synopsis available.'}
+              </p>
+            </div>
 
-              {/* Watchlist */}
-              <button
-                aria-label={variant === 'watchlist' ? "Remove" : "Watchlist"}
-                title={variant === 'watchlist' ? "Remove from Watchlist" : "Add to Watchlist"}
-                onClick={() => {
-                  const id = Number(item.tmdbId);
-                  // Always remove from view and close modal
-                  if (typeof onRemove === 'function') onRemove(id as number);
-                  setShowInfo(false);
-                  // If currently on watchlist, remove it
-                  if (variant === 'watchlist') {
-                    const payloadItemRem = {
-                      tmdbId: item.tmdbId ?? null,
-                      title: item.title ?? 'Unknown Title',
-                      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-                      mediaType: (currentMediaType as any),
-                      posterUrl: item.posterUrl ?? null,
-                      releaseYear: item.releaseYear,
-                      overview: item.overview ?? '',
-                      voteAverage: item.voteAverage ? Number(item.voteAverage) : 0,
-                      backdropUrl: item.backdropUrl ?? '',
-                    };
-                    postRemoveFromWatchlist(payloadItemRem).catch(console.error);
-                  } else if (variant === 'blocked') {
-                    if (typeof onRemove === 'function') onRemove(id);
-                    setShowInfo(false);
-                    unblockItem(id, 'watchlist')
-                      .then(() => { try { window.dispatchEvent(new CustomEvent('watchlist:changed', { detail: { tmdbId: id } })); } catch { /* ignore */ } })
-                      .catch(console.error);
-                  } else {
-                    // Add to watchlist
-                    const payloadItem = {
-                      tmdbId: item.tmdbId ?? null,
-                      title: item.title ?? 'Unknown Title',
-                      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-                      mediaType: (currentMediaType as any),
-                      posterUrl: item.posterUrl ?? null,
-                      releaseYear: item.releaseYear,
-                      overview: item.overview ?? '',
-                      voteAverage: item.voteAverage ? Number(item.voteAverage) : 0,
-                      backdropUrl: item.backdropUrl ?? '',
-                    };
-                    postActionWatchlist(payloadItem)
-                      .then(() => { try { window.dispatchEvent(new CustomEvent('watchlist:changed', { detail: { tmdbId: id } })); } catch { /* ignore */ } })
-                      .catch(console.error);
-                  }
-                }}
-                className="flex items-center gap-2 px-4 py-2 rounded-lg bg-yellow-500/10 hover:bg-yellow-500/20 text-yellow-400 hover:text-yellow-300 transition-colors border border-yellow-500/20"
+            <div className="pt-4 border-t border-white/10 flex flex-wrap gap-4 items-center justify-between">
+              <a
+                href={tmdbLink}
+                target="_blank"
+                rel="noopener noreferrer"
+                className="inline-flex items-center gap-2 bg-[#0d253f] hover:bg-[#01b4e4] text-white px-4 py-2 rounded-lg transition-colors font-medium border border-[#01b4e4]/30"
               >
-                <Bookmark className="w-5 h-5" />
-                <span className="font-medium">Watchlist</span>
-              </button>
+                <ExternalLink className="w-4 h-4" />
+                View on TMDB
+              </a>
 
-              {/* Watched */}
-              <button
-                aria-label="Watched"
-                title="Mark Watched"
-                onClick={() => {
-                  const id = Number(item.tmdbId);
-                  if (typeof onRemove === 'function') onRemove(id as number);
-                  setShowInfo(false);
-                  const payloadItemWatched = {
-                    tmdbId: item.tmdbId ?? null,
-                    title: item.title ?? 'Unknown Title',
-                    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-                    mediaType: (currentMediaType as any),
-                    posterUrl: item.posterUrl ?? null,
-                    releaseYear: item.releaseYear,
-                    overview: item.overview ?? '',
-                    voteAverage: item.voteAverage ? Number(item.voteAverage) : 0,
-                    backdropUrl: item.backdropUrl ?? '',
-                  };
-                  if (variant === 'blocked') {
-                    if (typeof onRemove === 'function') onRemove(id);
-                    setShowInfo(false);
-                    unblockItem(id, 'watched').catch(console.error);
-                  } else {
-                    postActionWatched(payloadItemWatched).catch(console.error);
-                  }
-                }}
-                className="flex items-center gap-2 px-4 py-2 rounded-lg bg-green-500/10 hover:bg-green-500/20 text-green-400 hover:text-green-300 transition-colors border border-green-500/20"
-              >
-                <Eye className="w-5 h-5" />
-                <span className="font-medium">Watched</span>
-              </button>
+              <div className="flex flex-wrap items-center gap-3">
+                {/* Request */}
+                <button
+                  aria-label="Request"
+                  title="Request"
+                  onClick={handleRequest}
+                  className="flex items-center gap-2 px-4 py-2 rounded-lg bg-cyan-500/10 hover:bg-cyan-500/20 text-cyan-400 hover:text-cyan-300 transition-colors border border-cyan-500/20"
+                >
+                  {requesting ? <Loader2 className="w-5 h-5 animate-spin" /> : <DownloadCloud className="w-5 h-5" />}
+                  <span className="font-medium">Request</span>
+                </button>
 
-              {/* Block */}
-              {/* Block / Unblock */}
-              {variant === 'blocked' ? (
+                {/* Watchlist */}
                 <button
-                  aria-label="Unblock"
-                  title="Unblock"
+                  aria-label={variant === 'watchlist' ? "Remove" : "Watchlist"}
+                  title={variant === 'watchlist' ? "Remove from Watchlist" : "Add to Watchlist"}
                   onClick={() => {
                     const id = Number(item.tmdbId);
+                    // Always remove from view and close modal
                     if (typeof onRemove === 'function') onRemove(id as number);
                     setShowInfo(false);
-                    unblockItem(id, 'remove').catch(console.error);
+                    // If currently on watchlist, remove it
+                    if (variant === 'watchlist') {
+                      postRemoveFromWatchlist(buildItemPayload()).catch(console.error);
+                    } else if (variant === 'blocked') {
+                      unblockItem(id, 'watchlist')
+                        .then(() => { notifyWatchlistChanged(id); })
+                        .catch(console.error);
+                    } else {
+                      // Add to watchlist
+                      postActionWatchlist(buildItemPayload())
+                        .then(() => { notifyWatchlistChanged(id); })
+                        .catch(console.error);
+                    }
                   }}
-                  className="flex items-center gap-2 px-4 py-2 rounded-lg bg-red-500/10 hover:bg-red-500/20 text-red-500 hover:text-red-400 transition-colors border border-red-500/20"
+                  className="flex items-center gap-2 px-4 py-2 rounded-lg bg-yellow-500/10 hover:bg-yellow-500/20 text-yellow-400 hover:text-yellow-300 transition-colors border border-yellow-500/20"
                 >
-                  <X className="w-5 h-5" />
-                  <span className="font-medium">Unblock</span>
+                  <Bookmark className="w-5 h-5" />
+                  <span className="font-medium">Watchlist</span>
                 </button>
-              ) : (
+
+                {/* Watched */}
                 <button
-                  aria-label="Block"
-                  title="Block / Hide"
+                  aria-label="Watched"
+                  title="Mark Watched"
                   onClick={() => {
                     const id = Number(item.tmdbId);
                     if (typeof onRemove === 'function') onRemove(id as number);
                     setShowInfo(false);
-                    const payloadItemBlock = {
-                      tmdbId: item.tmdbId ?? null,
-                      title: item.title ?? 'Unknown Title',
-                      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-                      mediaType: (currentMediaType as any),
-                      posterUrl: item.posterUrl ?? null,
-                      releaseYear: item.releaseYear,
-                      overview: item.overview ?? '',
-                      voteAverage: item.voteAverage ? Number(item.voteAverage) : 0,
-                      backdropUrl: item.backdropUrl ?? '',
-                    };
-                    postActionBlock(payloadItemBlock).catch(console.error);
+                    if (variant === 'blocked') {
+                      unblockItem(id, 'watched').catch(console.error);
+                    } else {
+                      postActionWatched(buildItemPayload()).catch(console.error);
+                    }
                   }}
-                  className="flex items-center gap-2 px-4 py-2 rounded-lg bg-red-500/10 hover:bg-red-500/20 text-red-500 hover:text-red-400 transition-colors border border-red-500/20"
+                  className="flex items-center gap-2 px-4 py-2 rounded-lg bg-green-500/10 hover:bg-green-500/20 text-green-400 hover:text-green-300 transition-colors border border-green-500/20"
                 >
-                  <Ban className="w-5 h-5" />
-                  <span className="font-medium">Block</span>
+                  <Eye className="w-5 h-5" />
+                  <span className="font-medium">Watched</span>
                 </button>
-              )}
+
+                {/* Block */}
+                {/* Block / Unblock */}
+                {variant === 'blocked' ? (
+                  <button
+                    aria-label="Unblock"
+                    title="Unblock"
+                    onClick={handleUnblock}
+                    className="flex items-center gap-2 px-4 py-2 rounded-lg bg-red-500/10 hover:bg-red-500/20 text-red-500 hover:text-red-400 transition-colors border border-red-500/20"
+                  >
+                    <X className="w-5 h-5" />
+                    <span className="font-medium">Unblock</span>
+                  </button>
+                ) : (
+                  <button
+                    aria-label="Block"
+                    title="Block / Hide"
+                    onClick={() => {
+                      const id = Number(item.tmdbId);
+                      if (typeof onRemove === 'function') onRemove(id as number);
+                      setShowInfo(false);
+                      postActionBlock(buildItemPayload()).catch(console.error);
+                    }}
+                    className="flex items-center gap-2 px-4 py-2 rounded-lg bg-red-500/10 hover:bg-red-500/20 text-red-500 hover:text-red-400 transition-colors border border-red-500/20"
+                  >
+                    <Ban className="w-5 h-5" />
+                    <span className="font-medium">Block</span>
+                  </button>
+                )}
+              </div>
             </div>
           </div>
-        </div>
-      </Modal>
+        </Modal>
+      )}
     </>
   );
 };
 
-export default MediaCard;
+// Memoized so an action on one card (or a parent filter change) doesn't re-render the whole grid
+export default React.memo(MediaCard);
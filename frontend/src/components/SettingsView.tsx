@@ -31,7 +31,6 @@ interface ImportSummary {
 const SettingsView: React.FC = () => {
   const { user } = useAuth();
   const [selectedFile, setSelectedFile] = useState<File | null>(null);
-  const [fileContent, setFileContent] = useState<string>('');
   const [loading, setLoading] = useState(false);
   const [exportLoading, setExportLoading] = useState(false);
   const [result, setResult] = useState<ImportSummary | null>(null);
@@ -80,21 +79,10 @@ const SettingsView: React.FC = () => {
       return;
     }
 
+    // The file itself is uploaded on import; it is never read into a string here
     setSelectedFile(file);
     setError(null);
     setResult(null);
-
-    // Read file content
-    const reader = new FileReader();
-    reader.onload = (e) => {
-      const content = e.target?.result as string;
-      setFileContent(content);
-    };
-    reader.onerror = () => {
-      setError('Failed to read file');
-      setSelectedFile(null);
-    };
-    reader.readAsText(file);
   };
 
   const handleFileInputChange = (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -123,7 +111,6 @@ const SettingsView: React.FC = () => {
 
   const handleClearFile = () => {
     setSelectedFile(null);
-    setFileContent('');
     setError(null);
     setResult(null);
     if (fileInputRef.current) {
@@ -177,7 +164,7 @@ const SettingsView: React.FC = () => {
   }, []);
 
   const onImport = async () => {
-    if (!fileContent) {
+    if (!selectedFile) {
       setError('No file content to import');
       return;
     }
@@ -188,18 +175,10 @@ const SettingsView: React.FC = () => {
     setLoading(true);
 
     try {
-      // Validate JSON before sending
-      let parsed: Record<string, unknown>;
-      try {
-        parsed = JSON.parse(fileContent);
-      } catch {
-        throw new Error('Invalid JSON format');
-      }
-
       // Start SSE connection for progress
       connectToProgressStream();
 
-      const res = await postSettingsImport(parsed);
+      const res = await postSettingsImport(selectedFile);
 
       // Check if async import
       if (res.async) {
@@ -213,8 +192,9 @@ const SettingsView: React.FC = () => {
         eventSourceRef.current = null;
       }
     } catch (e: unknown) {
-      const err = e as { message?: string };
-      setError(String(err?.message || e));
+      const err = e as { message?: string; response?: { status?: number } };
+      // The upload is validated by the server's JSON parser; a 400 means the file was not valid JSON
+      setError(err?.response?.status === 400 ? 'Invalid JSON format' : String(err?.message || e));
       setLoading(false);
       eventSourceRef.current?.close();
       eventSourceRef.current = null;
@@ -342,7 +322,7 @@ const SettingsView: React.FC = () => {
         <div className="flex items-center gap-3 mt-6">
           <HeroButton
             onClick={onImport}
-            disabled={loading || !selectedFile || !fileContent || importProgress?.active}
+            disabled={loading || !selectedFile || importProgress?.active}
           >
             {loading ? (
               <span className="flex items-center gap-2">
@@ -19,6 +19,8 @@ const navItems: NavItem[] = [
   { id: 'settings', label: 'Settings' },
 ];
 
+const SAFE_AREA_STYLE: React.CSSProperties = { paddingBottom: 'env(safe-area-inset-bottom)' };
+
 interface SidebarProps {
   active: AppView;
   onNavigate: (id: AppView) => void;
@@ -48,7 +50,7 @@ const Sidebar: React.FC<SidebarProps> = ({ active, onNavigate, onClose }) => {
 
   return (
     <>
-      <aside className="w-80 bg-[#080810] h-[100dvh] flex flex-col border-r border-white/5" style={{ paddingBottom: 'env(safe-area-inset-bottom)' }}>
+      <aside className="w-80 bg-[#080810] h-[100dvh] flex flex-col border-r border-white/5" style={SAFE_AREA_STYLE}>
         {/* Scrollable content area */}
         <div className="flex-1 overflow-y-auto p-6">
           <nav>
@@ -1,9 +1,12 @@
 import React from 'react';
 
+// 2:3 poster box; a module constant so every skeleton shares one style object
+const POSTER_BOX_STYLE: React.CSSProperties = { paddingTop: '150%' };
+
 const SkeletonCard: React.FC = () => {
   return (
     <div className="rounded-lg overflow-hidden">
-      <div className="relative w-full" style={{ paddingTop: '150%' }}>
+      <div className="relative w-full" style={POSTER_BOX_STYLE}>
         <div className="absolute inset-0 bg-gray-700 animate-pulse" />
       </div>
       <div className="p-3">
@@ -14,4 +17,5 @@ const SkeletonCard: React.FC = () => {
   );
 };
 
-export default SkeletonCard;
+// Static markup: memoized so parent re-renders while loading don't re-render each placeholder
+export default React.memo(SkeletonCard);
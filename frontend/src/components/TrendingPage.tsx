@@ -10,6 +10,7 @@ import SkeletonCard from './SkeletonCard';
 import FilterGroup from './FilterGroup';
 import type { JellyfinItem } from '../types';
 import { getTrending } from '../services/api';
+import { removeByTmdbId } from '../utils/list';
 
 interface TrendingItem {
     id: number;
@@ -30,10 +31,15 @@ interface TrendingResponse {
     tvShows: TrendingItem[];
 }
 
+// Keys for the loading grid placeholders
+const SKELETON_KEYS = Array.from({ length: 12 }, (_, idx) => `skeleton-${idx}`);
+
 const mapToJellyfinItem = (item: TrendingItem): JellyfinItem => {
     const title = item.title || item.name || 'Unknown';
     const releaseDate = item.releaseDate || item.firstAirDate;
-    const posterUrl = item.posterPath ? `https://image.tmdb.org/t/p/w500${item.posterPath}` : null;
+    // Grid posters render at most ~250px wide; w342 covers that at 1x and costs roughly half
+    // the bytes and decode work of w500
+    const posterUrl = item.posterPath ? `https://image.tmdb.org/t/p/w342${item.posterPath}` : null;
     const backdropUrl = item.backdropPath ? `https://image.tmdb.org/t/p/w780${item.backdropPath}` : null;
     return {
         Id: `tmdb-${item.id}`,
@@ -52,6 +58,18 @@ const mapToJellyfinItem = (item: TrendingItem): JellyfinItem => {
     } as JellyfinItem;
 };
 
+// MediaCard is memoized, so each trending item maps to the same card item object across
+// renders; removing one card or switching tabs then re-renders nothing else
+const cardItems = new WeakMap<TrendingItem, JellyfinItem>();
+const toCardItem = (item: TrendingItem): JellyfinItem => {
+    let mapped = cardItems.get(item);
+    if (!mapped) {
+        mapped = mapToJellyfinItem(item);
+        cardItems.set(item, mapped);
+    }
+    return mapped;
+};
+
 const TrendingPage: React.FC = () => {
     const [data, setData] = useState<TrendingResponse | null>(null);
     const [loading, setLoading] = useState(true);
@@ -85,11 +103,10 @@ const TrendingPage: React.FC = () => {
         if (!tmdbId) return;
         setData(prev => {
             if (!prev) return prev;
-            return {
-                ...prev,
-                movies: prev.movies.filter(m => m.id !== tmdbId),
-                tvShows: prev.tvShows.filter(t => t.id !== tmdbId),
-            };
+            const movies = removeByTmdbId(prev.movies, tmdbId, m => m.id);
+            const tvShows = removeByTmdbId(prev.tvShows, tmdbId, t => t.id);
+            if (movies === prev.movies && tvShows === prev.tvShows) return prev;
+            return { ...prev, movies, tvShows };
         });
     }, []);
 
@@ -98,9 +115,8 @@ const TrendingPage: React.FC = () => {
             <div className="space-y-8 p-4 md:p-6">
                 <div className="h-16 animate-pulse bg-slate-800/50 rounded-xl" />
                 <div className="grid grid-cols-1 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 xl:grid-cols-6 gap-3 md:gap-4">
-                    {Array.from({ length: 12 }).map((_, idx) => (
-                        // eslint-disable-next-line @eslint-react/no-array-index-key
-                        <SkeletonCard key={`skeleton-${idx}`} />
+                    {SKELETON_KEYS.map(key => (
+                        <SkeletonCard key={key} />
                     ))}
                 </div>
             </div>
@@ -181,7 +197,7 @@ const TrendingPage: React.FC = () => {
                         {data.movies.map(item => (
                             <MediaCard
                                 key={item.id}
-                                item={mapToJellyfinItem(item)}
+                                item={toCardItem(item)}
                                 onRemove={handleRemove}
                             />
                         ))}
@@ -201,8 +217,8 @@ const TrendingPage: React.FC = () => {
                         {data.tvShows.map(item => (
                             <MediaCard
                                 key={item.id}
-                                item={mapToJellyfinItem(item)}
-                                onRemove={() => handleRemove(item.id)}
+                                item={toCardItem(item)}
+                                onRemove={handleRemove}
                             />
                         ))}
                     </div>
@@ -94,12 +94,12 @@ const UserStatsModal: React.FC<Props> = ({ isOpen, onClose }) => {
                     }
                 });
 
-                // Translate genres if needed
+                // Translate genres if needed; the API already returns them sorted by count, descending
                 if (res.data && res.data.genres) {
                     res.data.genres = res.data.genres.map((g: { name: string; value: number }) => ({
                         ...g,
                         name: GENRE_TRANSLATIONS[g.name] || g.name
-                    })).sort((a: { value: number }, b: { value: number }) => b.value - a.value); // Sort descending for chart
+                    }));
                 }
 
                 setData(res.data);
@@ -1,8 +1,9 @@
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useCallback, useEffect, useMemo, useState } from 'react';
 import ItemList from './ItemList';
 import type { JellyfinItem } from '../types';
 import { getUserWatchlist } from '../services/api';
 import FilterGroup from './FilterGroup';
+import { keepIfSameIds, removeByTmdbId } from '../utils/list';
 
 type FilterType = 'all' | 'movie' | 'tv';
 type SortType = 'added-newest' | 'release-newest' | 'title-asc';
@@ -31,8 +32,11 @@ const WatchlistView: React.FC = () => {
       });
 
     // Listen for global watchlist changes (e.g., added from Recommendations)
+    // Most events (e.g. a card removed here optimistically) leave the list unchanged; keep the same array then
     const handler = () => {
-      getUserWatchlist().then(d => { if (mounted) setItems(d || []); }).catch(err => console.error('Failed refreshing watchlist after event', err));
+      getUserWatchlist()
+        .then(d => { if (mounted) setItems(prev => keepIfSameIds(prev, d || [], i => i.tmdbId)); })
+        .catch(err => console.error('Failed refreshing watchlist after event', err));
     };
     window.addEventListener('watchlist:changed', handler as EventListener);
 
@@ -42,10 +46,11 @@ const WatchlistView: React.FC = () => {
     };
   }, []);
 
-  const handleRemove = (tmdbId?: number) => {
+  const handleSelectItem = useCallback(() => { }, []);
+  const handleRemove = useCallback((tmdbId?: number) => {
     if (!tmdbId && tmdbId !== 0) return;
-    setItems(prev => prev.filter(i => Number(i.tmdbId) !== Number(tmdbId)));
-  };
+    setItems(prev => removeByTmdbId(prev, tmdbId, i => i.tmdbId));
+  }, []);
 
   // Derived/processed items applying filter + sort
   const processedItems = useMemo(() => {
@@ -74,6 +79,25 @@ const WatchlistView: React.FC = () => {
     return list;
   }, [items, filter, sort]);
 
+  // Partition once per change instead of re-filtering by media type in every render branch
+  const { movieItems, tvItems } = useMemo(() => {
+    const movies: JellyfinItem[] = [];
+    const tv: JellyfinItem[] = [];
+    for (const item of processedItems) {
+      if ((item.mediaType || 'movie') === 'tv') tv.push(item);
+      else movies.push(item);
+    }
+    return { movieItems: movies, tvItems: tv };
+  }, [processedItems]);
+
+  const { movieCount, tvCount } = useMemo(() => {
+    let tv = 0;
+    for (const item of items) {
+      if ((item.mediaType || 'movie') === 'tv') tv++;
+    }
+    return { movieCount: items.length - tv, tvCount: tv };
+  }, [items]);
+
   return (
     <div>
       <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4 mb-6">
@@ -111,40 +135,40 @@ const WatchlistView: React.FC = () => {
 
       <div className="space-y-8">
         {/* Movies Section */}
-        {(filter === 'all' || filter === 'movie') && processedItems.filter(item => (item.mediaType || 'movie') === 'movie').length > 0 && (
+        {(filter === 'all' || filter === 'movie') && movieItems.length > 0 && (
           <section>
             <div className="flex items-center gap-2 mb-4">
               <div className="w-1 h-6 bg-purple-500 rounded-full"></div>
               <h3 className="text-xl font-semibold text-white">Movies</h3>
               <span className="text-sm text-slate-500">
-                ({items.filter(it => (it.mediaType || 'movie') === 'movie').length})
+                ({movieCount})
               </span>
             </div>
             <ItemList
-              items={processedItems.filter(item => (item.mediaType || 'movie') === 'movie')}
-              onSelectItem={() => { }}
+              items={movieItems}
+              onSelectItem={handleSelectItem}
               isLoading={loading}
-              onRemove={(id) => handleRemove(id)}
+              onRemove={handleRemove}
               variant="watchlist"
             />
           </section>
         )}
 
         {/* TV Shows Section */}
-        {(filter === 'all' || filter === 'tv') && processedItems.filter(item => (item.mediaType || 'movie') === 'tv').length > 0 && (
+        {(filter === 'all' || filter === 'tv') && tvItems.length > 0 && (
           <section>
             <div className="flex items-center gap-2 mb-4">
               <div className="w-1 h-6 bg-blue-500 rounded-full"></div>
               <h3 className="text-xl font-semibold text-white">TV Shows</h3>
               <span className="text-sm text-slate-500">
-                ({items.filter(it => (it.mediaType || 'movie') === 'tv').length})
+                ({tvCount})
               </span>
             </div>
             <ItemList
-              items={processedItems.filter(item => (item.mediaType || 'movie') === 'tv')}
-              onSelectItem={() => { }}
+              items={tvItems}
+              onSelectItem={handleSelectItem}
               isLoading={loading}
-              onRemove={(id) => handleRemove(id)}
+              onRemove={handleRemove}
               variant="watchlist"
             />
           </section>
@@ -1,13 +1,46 @@
 
-import React, { useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useMemo, useState } from 'react';
 import { Calendar, Sparkles, TrendingUp, Tv } from 'lucide-react';
 import { getWeeklyWatchlist } from '../services/api';
+import { removeByTmdbId } from '../utils/list';
 import type { WeeklyWatchlist as IWeeklyWatchlist, WeeklyWatchlistItem } from '../types';
 import type { JellyfinItem } from '../types';
 import MediaCard from './MediaCard';
 import SkeletonCard from './SkeletonCard';
 import { format, parseISO, addDays } from 'date-fns';
 
+const SKELETON_KEYS = Array.from({ length: 10 }, (_, idx) => `skeleton-${idx}`);
+
+// Helper to map WeeklyWatchlistItem to JellyfinItem for MediaCard
+const mapToJellyfinItem = (item: WeeklyWatchlistItem, type: 'movie' | 'tv'): JellyfinItem => {
+    return {
+        Id: `tmdb-${item.tmdbId}`,
+        Name: item.title,
+        Type: type === 'movie' ? 'Movie' : 'Series',
+        mediaType: type,
+        tmdbId: item.tmdbId,
+        title: item.title,
+        posterUrl: item.posterUrl,
+        overview: item.overview,
+        releaseYear: item.releaseDate ? item.releaseDate.substring(0, 4) : 'Unknown',
+        voteAverage: item.voteAverage || 0,
+        backdropUrl: null,
+        UserData: { Played: false, UnplayedItemCount: 1, PlaybackPositionTicks: 0, IsFavorite: false },
+    } as JellyfinItem;
+};
+
+// Cards are memoized, so each stored item must map to the same object across renders;
+// removing one pick then re-renders only the grid, not every remaining card
+const cardItems = new WeakMap<WeeklyWatchlistItem, JellyfinItem>();
+const toCardItem = (item: WeeklyWatchlistItem, type: 'movie' | 'tv'): JellyfinItem => {
+    let mapped = cardItems.get(item);
+    if (!mapped) {
+        mapped = mapToJellyfinItem(item, type);
+        cardItems.set(item, mapped);
+    }
+    return mapped;
+};
+
 const WeeklyWatchlist: React.FC = () => {
     const [watchlist, setWatchlist] = useState<IWeeklyWatchlist | null>(null);
     const [loading, setLoading] = useState(true);
@@ -34,36 +67,30 @@ const WeeklyWatchlist: React.FC = () => {
 
 
 
-    // Helper to map WeeklyWatchlistItem to JellyfinItem for MediaCard
-    const mapToJellyfinItem = (item: WeeklyWatchlistItem, type: 'movie' | 'tv'): JellyfinItem => {
-        return {
-            Id: `tmdb-${item.tmdbId}`,
-            Name: item.title,
-            Type: type === 'movie' ? 'Movie' : 'Series',
-            mediaType: type,
-            tmdbId: item.tmdbId,
-            title: item.title,
-            posterUrl: item.posterUrl,
-            overview: item.overview,
-            releaseYear: item.releaseDate ? item.releaseDate.substring(0, 4) : 'Unknown',
-            voteAverage: item.voteAverage || 0,
-            backdropUrl: null,
-            UserData: { Played: false, UnplayedItemCount: 1, PlaybackPositionTicks: 0, IsFavorite: false },
-        } as JellyfinItem;
-    };
-
     // Remove item from local state when user takes an action
-    const handleRemove = (tmdbId?: number) => {
-        if (!tmdbId || !watchlist) return;
+    const handleRemove = useCallback((tmdbId?: number) => {
+        if (!tmdbId) return;
         setWatchlist(prev => {
             if (!prev) return prev;
-            return {
-                ...prev,
-                movies: prev.movies.filter(m => m.tmdbId !== tmdbId),
-                tvShows: prev.tvShows.filter(t => t.tmdbId !== tmdbId),
-            };
+            const movies = removeByTmdbId(prev.movies, tmdbId, m => m.tmdbId);
+            const tvShows = removeByTmdbId(prev.tvShows, tmdbId, t => t.tmdbId);
+            if (movies === prev.movies && tvShows === prev.tvShows) return prev;
+            return { ...prev, movies, tvShows };
         });
-    };
+    }, []);
+
+    // Week labels depend only on the week itself; removing picks re-renders this view
+    // often, so the dates are parsed and formatted once per loaded watchlist
+    const weekStart = watchlist?.weekStart;
+    const weekEnd = watchlist?.weekEnd;
+    const weekLabels = useMemo(() => {
+        if (!weekStart || !weekEnd) return null;
+        const startDate = parseISO(weekStart);
+        return {
+            dateRange: `${format(startDate, 'MMM d')} - ${format(parseISO(weekEnd), 'MMM d')}`,
+            nextWeek: format(addDays(startDate, 7), 'EEEE, MMM do'),
+        };
+    }, [weekStart, weekEnd]);
 
     if (loading && !watchlist) {
         return (
@@ -72,9 +99,8 @@ const WeeklyWatchlist: React.FC = () => {
                 <div className="h-32 animate-pulse bg-slate-800/50 rounded-xl" />
                 {/* Loading skeleton for grid */}
                 <div className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-3 md:gap-6">
-                    {Array.from({ length: 10 }).map((_, idx) => (
-                        // eslint-disable-next-line @eslint-react/no-array-index-key
-                        <SkeletonCard key={`skeleton-${idx}`} />
+                    {SKELETON_KEYS.map(key => (
+                        <SkeletonCard key={key} />
                     ))}
                 </div>
             </div>
@@ -96,11 +122,7 @@ const WeeklyWatchlist: React.FC = () => {
         );
     }
 
-    if (!watchlist) return null;
-
-    const startDate = parseISO(watchlist.weekStart);
-    const endDate = parseISO(watchlist.weekEnd);
-    const dateRange = `${format(startDate, 'MMM d')} - ${format(endDate, 'MMM d')}`;
+    if (!watchlist || !weekLabels) return null;
 
     return (
         <div className="space-y-8">
@@ -111,7 +133,7 @@ const WeeklyWatchlist: React.FC = () => {
                         <div>
                             <div className="flex items-center gap-2 text-purple-300 font-medium mb-1">
                                 <Calendar className="w-4 h-4" />
-                                <span className="uppercase tracking-wider text-xs">Week of {dateRange}</span>
+                                <span className="uppercase tracking-wider text-xs">Week of {weekLabels.dateRange}</span>
                             </div>
                             <h2 className="text-3xl font-bold text-white flex items-center gap-3">
                                 <Sparkles className="w-6 h-6 text-purple-400" />
@@ -145,7 +167,7 @@ const WeeklyWatchlist: React.FC = () => {
                         You've gone through all your recommendations for this week.
                         <br />
                         <span className="text-slate-300 font-medium block mt-2">
-                            Fresh picks will be ready on {format(addDays(startDate, 7), 'EEEE, MMM do')}.
+                            Fresh picks will be ready on {weekLabels.nextWeek}.
                         </span>
                     </p>
                 </div>
@@ -163,7 +185,7 @@ const WeeklyWatchlist: React.FC = () => {
                         {watchlist.movies.map((item) => (
                             <MediaCard
                                 key={item.tmdbId}
-                                item={mapToJellyfinItem(item, 'movie')}
+                                item={toCardItem(item, 'movie')}
                                 variant="search"
                                 onRemove={handleRemove}
                             />
@@ -184,7 +206,7 @@ const WeeklyWatchlist: React.FC = () => {
                         {watchlist.tvShows.map((item) => (
                             <MediaCard
                                 key={item.tmdbId}
-                                item={mapToJellyfinItem(item, 'tv')}
+                                item={toCardItem(item, 'tv')}
                                 variant="search"
                                 onRemove={handleRemove}
                             />
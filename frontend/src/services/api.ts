@@ -101,10 +101,19 @@ export const postJellyseerrRequest = async (mediaId: number, mediaType: 'movie'
     return response.data;
 };
 
-export const postSettingsImport = async (jsonPayload: Record<string, unknown> | string) => {
-    // Accept either an object or a raw string. Backend will parse if provided as jsonContent string.
-    const body = typeof jsonPayload === 'string' ? { jsonContent: jsonPayload } : jsonPayload;
-    const response = await apiClient.post('/settings/import', body, authHeaders());
+export const postSettingsImport = async (jsonPayload: Record<string, unknown> | string | Blob) => {
+    // A raw JSON string or the backup file itself is sent verbatim as the request body:
+    // no re-serialisation of a large object on the client, and one parse on the server.
+    // A File is streamed from disk by the browser without ever becoming a JS string.
+    if (typeof jsonPayload === 'string' || jsonPayload instanceof Blob) {
+        const { headers } = authHeaders();
+        const response = await apiClient.post('/settings/import', jsonPayload, {
+            headers: { ...headers, 'Content-Type': 'application/json' },
+            transformRequest: [(data) => data],
+        });
+        return response.data;
+    }
+    const response = await apiClient.post('/settings/import', jsonPayload, authHeaders());
     return response.data;
 };
 
@@ -0,0 +1,56 @@
+import { describe, it, expect } from 'vitest';
+import { keepIfSameIds, removeByTmdbId } from './list';
+
+type Row = { tmdbId?: number | string | null; title: string };
+
+const rows: Row[] = [
+    { tmdbId: 550, title: 'Fight Club' },
+    { tmdbId: 603, title: 'The Matrix' },
+    { tmdbId: 1399, title: 'Game of Thrones' },
+];
+
+describe('removeByTmdbId', () => {
+    it('returns the same array reference when nothing matches', () => {
+        expect(removeByTmdbId(rows, 999, r => r.tmdbId)).toBe(rows);
+    });
+
+    it('compares string and number ids numerically', () => {
+        const mixed: Row[] = [{ tmdbId: '550', title: 'Fight Club' }, { tmdbId: 603, title: 'The Matrix' }];
+        expect(removeByTmdbId(mixed, 550, r => r.tmdbId).map(r => r.title)).toEqual(['The Matrix']);
+        expect(removeByTmdbId(rows, '603', r => r.tmdbId).map(r => r.title)).toEqual(['Fight Club', 'Game of Thrones']);
+    });
+
+    it('removes every item with a duplicate id', () => {
+        const duplicated: Row[] = [...rows, { tmdbId: 603, title: 'The Matrix (again)' }];
+        const result = removeByTmdbId(duplicated, 603, r => r.tmdbId);
+        expect(result.map(r => r.tmdbId)).toEqual([550, 1399]);
+    });
+
+    it('does not mutate the input', () => {
+        const copy = [...rows];
+        removeByTmdbId(rows, 550, r => r.tmdbId);
+        expect(rows).toEqual(copy);
+    });
+});
+
+describe('keepIfSameIds', () => {
+    it('keeps the previous reference when the ids and order match', () => {
+        const refetched = rows.map(r => ({ ...r }));
+        expect(keepIfSameIds(rows, refetched, r => r.tmdbId)).toBe(rows);
+    });
+
+    it('treats the same ids in a different order as changed', () => {
+        const reordered = [rows[1], rows[0], rows[2]];
+        expect(keepIfSameIds(rows, reordered, r => r.tmdbId)).toBe(reordered);
+    });
+
+    it('treats a different length as changed', () => {
+        const shorter = rows.slice(0, 2);
+        expect(keepIfSameIds(rows, shorter, r => r.tmdbId)).toBe(shorter);
+    });
+
+    it('compares string and number ids numerically', () => {
+        const stringIds = rows.map(r => ({ ...r, tmdbId: String(r.tmdbId) }));
+        expect(keepIfSameIds(rows, stringIds, r => r.tmdbId)).toBe(rows);
+    });
+});
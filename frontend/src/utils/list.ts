@@ -0,0 +1,38 @@
+/**
+ * Remove every item whose TMDB id matches `tmdbId`.
+ * Returns the original array when nothing matched so React state setters
+ * can bail out without re-rendering. Views holding separate movie and TV
+ * lists call this on both, so the no-match case scans without copying.
+ */
+export function removeByTmdbId<T>(
+  items: T[],
+  tmdbId: number | string,
+  getId: (item: T) => number | string | null | undefined,
+): T[] {
+  const target = Number(tmdbId);
+  const first = items.findIndex(item => Number(getId(item)) === target);
+  if (first === -1) return items;
+  // Items before the first match are kept as-is; only the tail needs filtering
+  const next = items.slice(0, first);
+  for (let i = first + 1; i < items.length; i++) {
+    if (Number(getId(items[i])) !== target) next.push(items[i]);
+  }
+  return next;
+}
+
+/**
+ * Return `prev` when `next` holds the same TMDB ids in the same order.
+ * Used when refetching a list so an unchanged response does not replace
+ * state and re-render every card.
+ */
+export function keepIfSameIds<T>(
+  prev: T[],
+  next: T[],
+  getId: (item: T) => number | string | null | undefined,
+): T[] {
+  if (prev.length !== next.length) return next;
+  for (let i = 0; i < next.length; i++) {
+    if (Number(getId(prev[i])) !== Number(getId(next[i]))) return next;
+  }
+  return prev;
+}